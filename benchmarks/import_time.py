@@ -0,0 +1,51 @@
+"""
+Measure how long it takes to import tidybear in a fresh interpreter.
+
+Usage ::
+    python benchmarks/import_time.py [repeats]
+"""
+import statistics
+import subprocess
+import sys
+from typing import Tuple
+
+STATEMENTS = {
+    "import tidybear": "import tidybear",
+    "import tidybear.selectors": "import tidybear.selectors",
+    "tidybear.count (imports pandas)": "import tidybear; tidybear.count",
+    "import pandas": "import pandas",
+}
+
+TIMER = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, "pandas" in sys.modules)
+"""
+
+
+def measure(statement: str, repeats: int) -> Tuple[float, bool]:
+    times = []
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMER.format(statement=statement)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        times.append(float(output[0]))
+
+    return statistics.median(times), output[1] == "True"
+
+
+def main() -> None:
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(f"{'statement':<35} {'median (ms)':>12} {'pandas loaded':>14}")
+    for label, statement in STATEMENTS.items():
+        median, pandas_loaded = measure(statement, repeats)
+        print(f"{label:<35} {median * 1000:>12.1f} {str(pandas_loaded):>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import pandas as pd
+import pytest
+
+import tidybear as tb
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame(
+        {
+            "key": pd.Series(list("abca"), dtype="string[pyarrow]"),
+            "cat": pd.Series(
+                list("xyxy"),
+                dtype=pd.ArrowDtype(pa.dictionary(pa.int32(), pa.string())),
+            ),
+            "A": pd.Series([1, 2, 3, 4], dtype="int64[pyarrow]"),
+            "B": pd.Series([1.0, None, 3.0, 4.0], dtype="double[pyarrow]"),
+        }
+    )
+
+
+def assert_no_object(df):
+    objects = [c for c, dtype in df.dtypes.items() if dtype == object]
+    assert not objects, f"object columns: {objects}"
+
+
+def test_pivot_longer_keeps_arrow(data):
+    result = tb.pivot_longer(data, ["A", "B"])
+    assert_no_object(result)
+    assert result.value.dtype == "double[pyarrow]"
+    assert result.value.tolist() == [1, 1, 2, 3, 3, 4, 4]
+
+
+def test_pivot_wider_keeps_arrow(data):
+    result = tb.pivot_wider(
+        data[["key", "cat", "A"]], names_from="cat", values_from="A"
+    )
+    assert_no_object(result)
+    assert result.columns.tolist() == ["key", "x", "y"]
+    assert result.x.dtype == "int64[pyarrow]"
+    assert result.x.tolist() == [1, pd.NA, 3]
+
+
+def test_mutate_keeps_arrow(data):
+    result = tb.mutate(data, twice=lambda x: x.A * 2, upper=lambda x: x.key.upper())
+    assert_no_object(result)
+    assert result.twice.dtype == "int64[pyarrow]"
+
+
+@pytest.mark.parametrize("groupby", [None, "key", ["key", "cat"]])
+def test_slice_keeps_arrow(data, groupby):
+    result = tb.slice_max(data, order_by="A", n=1, groupby=groupby)
+    pd.testing.assert_series_equal(result.dtypes, data.dtypes)
+
+
+def test_join_and_count_keep_arrow(data):
+    other = data[["key", "B"]].rename(columns={"B": "C"}).drop_duplicates("key")
+    assert_no_object(tb.left_join(data, other, "key"))
+    assert_no_object(tb.count(data, ["key", "cat"]))
+
+
+def test_groupby_keeps_arrow(data):
+    with tb.GroupBy(data, "key") as g:
+        g.sum("A")
+        g.n_distinct("cat")
+        g.quantile("B", 0.5)
+        g.rolling_mean("A", window=2)
+        summary = g.summarise()
+        windows = g.mutate()
+
+    assert_no_object(summary)
+    assert_no_object(windows)
+    assert summary.n_distinct_cat.tolist() == [2, 1, 1]
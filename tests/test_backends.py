@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import tidybear as tb
+from tidybear.backends import Backend
+from tidybear.backends import register_backend
+
+
+@pytest.fixture(autouse=True)
+def reset_options():
+    yield
+    tb.options.reset()
+
+
+@pytest.fixture(params=["polars", "duckdb"])
+def backend(request):
+    pytest.importorskip(request.param)
+    return request.param
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    n = 1000
+    df = pd.DataFrame(
+        {
+            "A": rng.choice(list("abc"), size=n),
+            "B": rng.choice([1, 2], size=n),
+            "X": rng.normal(size=n),
+            "I": rng.integers(0, 10, size=n),
+            "F": rng.choice([True, False], size=n),
+        },
+        index=rng.permutation(n) + 100,
+    )
+    df.loc[::13, "X"] = np.nan
+    df.loc[::17, "A"] = None
+    return df
+
+
+def run(backend, verb, *args, **kwargs):
+    tb.options.backend = "pandas"
+    expected = verb(*args, **kwargs)
+    tb.options.backend = backend
+    return verb(*args, **kwargs), expected
+
+
+@pytest.mark.parametrize("sort", [False, True])
+def test_backend_count(backend, data, sort):
+    result, expected = run(backend, tb.count, data, ["A", "B"], sort=sort)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_backend_join(backend, data, how):
+    right = pd.DataFrame(
+        {
+            "A": list("abdab"),
+            "Y": [1, 2, 3, 4, 5],
+            "X": [0.0, 1.0, 2.0, 3.0, 4.0],
+            "F": [True, False, True, True, False],
+        }
+    )
+    verb = getattr(tb, f"{how}_join")
+
+    result, expected = run(backend, verb, data.dropna(subset=["A"]), right, "A")
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_backend_join_missing_keys_falls_back(backend, data):
+    right = pd.DataFrame({"A": ["a", None], "Y": [1, 2]})
+    result, expected = run(backend, tb.inner_join, data, right, "A")
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_backend_mixed_keys_fall_back(backend, data):
+    data["M"] = pd.Series([1, 2.5, 3] * 400, dtype=object).iloc[: len(data)].values
+
+    result, expected = run(backend, tb.count, data, "M")
+    pd.testing.assert_frame_equal(result, expected)
+
+    result, expected = run(backend, tb.slice_max, data, order_by="X", n=2, groupby="M")
+    pd.testing.assert_frame_equal(result, expected)
+
+    def summarise(df):
+        with tb.GroupBy(df, "M") as g:
+            return g.sum("X")
+
+    result, expected = run(backend, summarise, data)
+    pd.testing.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("groupby", [None, "A", ["A", "B"]])
+def test_backend_slice(backend, data, groupby):
+    result, expected = run(
+        backend, tb.slice_max, data, order_by="X", n=3, groupby=groupby
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("stat", ["sum", "mean", "min", "max", "var", "std"])
+@pytest.mark.parametrize("column", ["X", "I", "F"])
+def test_backend_groupby_stats(backend, data, stat, column):
+    def summarise(df):
+        with tb.GroupBy(df, ["A", "B"]) as g:
+            return getattr(g, stat)(column)
+
+    result, expected = run(backend, summarise, data)
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        tb.options.backend = "spark"
+
+
+def test_register_backend(data):
+    class Counting(Backend):
+        name = "counting"
+        calls = []
+
+        def count(self, df, columns, name):
+            self.calls.append(columns)
+            return NotImplemented
+
+    register_backend("counting", Counting)
+    tb.options.backend = "counting"
+
+    result = tb.count(data, "A")
+
+    assert Counting.calls == [["A"]]
+    assert result.n.sum() == data.A.notna().sum()
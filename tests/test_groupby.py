@@ -1,3 +1,5 @@
+import asyncio
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -30,3 +32,293 @@ def test_groupby_same_series(data):
             for (pd_, tb_) in zip(pd_col, tb_col):
                 assert pd_[0] == tb_[0]
                 pd.testing.assert_series_equal(pd_[1], tb_[1])
+
+
+@pytest.fixture
+def float32_data():
+    rng = np.random.default_rng(0)
+    n = 100_000
+    return pd.DataFrame(
+        {
+            "A": rng.choice(list("abc"), size=n),
+            "X": (1000 + rng.random(n)).astype("float32"),
+        }
+    )
+
+
+@pytest.mark.parametrize("stat", ["var", "std"])
+def test_groupby_float32_var_accumulates_in_float64(float32_data, stat):
+    expected = getattr(float32_data.astype({"X": "float64"}).groupby("A").X, stat)()
+
+    with GroupBy(float32_data, "A") as g:
+        result = getattr(g, stat)("X")
+
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+
+@pytest.mark.parametrize("dtype", ["Float32", "float[pyarrow]"])
+def test_groupby_float32_var_keeps_extension_dtype(dtype):
+    df = pd.DataFrame(
+        {"g": list("aabbc"), "x": pd.array([1, 2, 3, None, 5], dtype=dtype)}
+    )
+
+    with GroupBy(df, "g") as g:
+        result = g.std("x")
+
+    pd.testing.assert_series_equal(result, df.groupby("g").x.std(), check_names=False)
+
+
+@pytest.mark.parametrize("stat", ["var", "std"])
+def test_groupby_float32_var_missing_key(stat):
+    df = pd.DataFrame({"g": ["a", "a", None, "b"], "x": np.float32([1, 2, 3, 4])})
+
+    with GroupBy(df, "g") as g:
+        result = getattr(g, stat)("x")
+
+    expected = getattr(df.groupby("g").x, stat)()
+    pd.testing.assert_series_equal(result, expected, check_names=False)
+
+
+@pytest.mark.parametrize("stat", ["var", "std"])
+def test_groupby_float32_var_unobserved_category(stat):
+    keys = pd.Categorical(list("bbccc"), categories=list("abc"))
+    df = pd.DataFrame({"g": keys, "x": np.float32([1, 2, 3, 5, 10])})
+
+    with GroupBy(df, "g") as g:
+        result = getattr(g, stat)("x")
+
+    expected = getattr(df.groupby("g", observed=False).x, stat)()
+    pd.testing.assert_series_equal(result, expected, check_names=False)
+
+
+def test_groupby_dtype(data):
+    with GroupBy(data, "A") as g:
+        total = g.sum("C", dtype="int32")
+        mean = g.mean("C", dtype="float32", decimals=1)
+        summary = g.summarise()
+
+    assert total.dtype == np.int32
+    assert mean.dtype == np.float32
+    assert summary.dtypes.tolist() == [np.int32, np.float32]
+    np.testing.assert_allclose(mean, data.groupby("A").C.mean().round(1), rtol=1e-6)
+
+
+def test_groupby_dtype_compact(data):
+    with GroupBy(data, "A") as g:
+        assert g.max("C", dtype="compact").dtype == np.int8
+        total = g.sum("C", dtype="compact")
+        assert total.dtype in (np.int16, np.int32)
+        assert total.tolist() == data.groupby("A").C.sum().tolist()
+        assert g.mean("C", dtype="compact").dtype == np.float32
+
+
+def test_groupby_dtype_compact_large_floats():
+    df = pd.DataFrame({"g": ["a", "b"], "x": [1e39, 2.5]})
+    with GroupBy(df, "g") as g:
+        result = g.max("x", dtype="compact")
+
+    assert result.dtype == np.float64
+    assert result.tolist() == [1e39, 2.5]
+
+
+def test_groupby_dtype_compact_non_numeric(data):
+    data["E"] = data.C > 50
+    with GroupBy(data, "A") as g:
+        assert g.agg("E", "any", dtype="compact").dtype == bool
+        assert g.agg("B", "first", dtype="compact").dtype == object
+
+
+def test_groupby_dtype_overflow(data):
+    with GroupBy(data, "A") as g:
+        with pytest.raises(OverflowError):
+            g.sum("C", dtype="int8")
+
+
+@pytest.fixture
+def series_data():
+    return pd.DataFrame(
+        {
+            "A": list("aabbaab"),
+            "X": [1.0, 2.0, 3.0, np.nan, 5.0, 6.0, 7.0],
+        }
+    )
+
+
+@pytest.mark.parametrize("stat", ["cumsum", "cumprod", "cummax", "cummin", "rank"])
+def test_groupby_window_matches_pandas(series_data, stat):
+    expected = getattr(series_data.groupby("A").X, stat)()
+
+    with GroupBy(series_data, "A") as g:
+        result = getattr(g, stat)("X")
+
+    assert result.name == f"{stat}_X"
+    pd.testing.assert_series_equal(result, expected, check_names=False)
+
+
+def test_groupby_lag_lead(series_data):
+    with GroupBy(series_data, "A") as g:
+        lag = g.lag("X")
+        lead = g.lead("X", n=2, fill_value=0)
+
+    np.testing.assert_array_equal(lag, [np.nan, 1, np.nan, 3, 2, 5, np.nan])
+    np.testing.assert_array_equal(lead, [5, 6, 7, 0, 0, 0, 0])
+
+
+@pytest.mark.parametrize("min_periods", [None, 1])
+def test_groupby_rolling_matches_pandas(series_data, min_periods):
+    rolling = series_data.groupby("A").X.rolling(2, min_periods=min_periods)
+    expected_sum = rolling.sum().droplevel(0).sort_index()
+    expected_mean = rolling.mean().droplevel(0).sort_index()
+
+    with GroupBy(series_data, "A") as g:
+        result_sum = g.rolling_sum("X", 2, min_periods=min_periods)
+        result_mean = g.rolling_mean("X", 2, min_periods=min_periods)
+
+    pd.testing.assert_series_equal(result_sum, expected_sum, check_names=False)
+    pd.testing.assert_series_equal(result_mean, expected_mean, check_names=False)
+
+
+def test_groupby_mutate(series_data):
+    with GroupBy(series_data, "A") as g:
+        g.cumsum("X")
+        g.lag("X", name="prev_X")
+        result = g.mutate()
+
+    assert result.columns.tolist() == ["A", "X", "cumsum_X", "prev_X"]
+    pd.testing.assert_frame_equal(result[["A", "X"]], series_data)
+
+
+def test_groupby_quantile_matches_pandas(data):
+    data.loc[::7, "C"] = np.nan
+    with GroupBy(data, "A") as g:
+        result = g.quantile("C", [0.1, 0.5, 0.99])
+        summary = g.summarise()
+
+    expected = data.groupby("A").C.quantile([0.1, 0.5, 0.99]).unstack()
+    assert result.columns.tolist() == ["q10_C", "q50_C", "q99_C"]
+    assert summary.columns.tolist() == ["q10_C", "q50_C", "q99_C"]
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+
+
+def test_groupby_quantile_single(data):
+    with GroupBy(data, ["A", "B"]) as g:
+        result = g.quantile("D", 0.9)
+
+    expected = data.groupby(["A", "B"]).D.quantile(0.9)
+    assert result.name == "q90_D"
+    pd.testing.assert_series_equal(result, expected, check_names=False)
+
+
+def test_groupby_quantile_missing_key():
+    df = pd.DataFrame({"g": ["a", "a", None, "b"], "x": [1.0, 2.0, 3.0, 4.0]})
+
+    with GroupBy(df, "g") as g:
+        result = g.quantile("x", [0.5, 0.9])
+
+    expected = df.groupby("g").x.quantile([0.5, 0.9]).unstack()
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+    assert result.index.tolist() == ["a", "b"]
+
+
+def test_groupby_quantile_missing_key_arrow():
+    df = pd.DataFrame({"g": ["a", "a", None, "b"], "x": [1.0, 2.0, 3.0, 4.0]})
+    df = df.astype({"g": "string[pyarrow]", "x": "double[pyarrow]"})
+
+    with GroupBy(df, "g") as g:
+        result = g.quantile("x", 0.5)
+
+    assert result.dtype == "double[pyarrow]"
+    assert result.tolist() == [1.5, 4.0]
+
+
+def test_groupby_quantile_unobserved_category():
+    keys = pd.Categorical(list("bbccc"), categories=list("abc"))
+    df = pd.DataFrame({"g": keys, "x": [1.0, 2.0, 3.0, 5.0, 10.0]})
+
+    with GroupBy(df, "g") as g:
+        result = g.quantile("x", [0.5, 0.9])
+
+    expected = df.groupby("g", observed=False).x.quantile([0.5, 0.9]).unstack()
+    assert result.index.tolist() == ["a", "b", "c"]
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+
+
+def test_groupby_quantile_approx(float32_data):
+    with GroupBy(float32_data, "A") as g:
+        result = g.quantile("X", 0.5, approx=True, max_samples=2000, random_state=0)
+
+    expected = float32_data.groupby("A").X.quantile(0.5)
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=0.05)
+
+
+def test_groupby_quantile_out_of_range(data):
+    with GroupBy(data, "A") as g:
+        with pytest.raises(ValueError):
+            g.quantile("C", [0.5, 1.5])
+
+
+def _register_stats(g):
+    g.n()
+    g.sum("C")
+    g.mean("D", decimals=2)
+    g.std("C")
+    g.n_distinct("B")
+    g.agg("D", lambda x: x.max() - x.min(), name="range_D")
+    g.quantile("C", [0.25, 0.75])
+
+
+@pytest.mark.parametrize("n_threads", [None, 1, 4])
+def test_groupby_lazy_summarise_matches_eager(data, n_threads):
+    with GroupBy(data, "A") as g:
+        _register_stats(g)
+        expected = g.summarise()
+
+    with GroupBy(data, "A", lazy=True) as g:
+        assert g.max("C") is None
+        g.stat("constant", pd.Series(1, index=expected.index))
+        _register_stats(g)
+        summary = g.summarise(n_threads=n_threads)
+
+    pd.testing.assert_frame_equal(summary.drop(columns=["max_C", "constant"]), expected)
+    assert summary.columns[:2].tolist() == ["max_C", "constant"]
+
+
+def test_groupby_asummarise(data):
+    with GroupBy(data, ["A", "B"], lazy=True) as g:
+        _register_stats(g)
+        summary = asyncio.run(g.asummarise(n_threads=2))
+        expected = g.summarise()
+
+    pd.testing.assert_frame_equal(summary, expected)
+
+
+def test_groupby_summarise_does_not_share_stats(data):
+    with GroupBy(data, "A") as g:
+        total = g.sum("C")
+        summary = g.summarise()
+
+    total.iloc[0] = -1
+    assert summary.sum_C.iloc[0] != -1
+
+
+def test_groupby_summarise_joins_other_indexes(data):
+    with GroupBy(data, "A") as g:
+        g.n()
+        g.stat("only_a", pd.Series([1], index=pd.Index(["a"], name="A")))
+        summary = g.summarise()
+
+    assert summary.only_a.notna().sum() == 1
+    assert summary.n.sum() == len(data)
+
+
+def test_groupby_rolling_large_magnitudes():
+    df = pd.DataFrame({"A": ["a"] * 6 + ["b"] * 2, "X": [1e16, 1, 1, 1, 1, 1, 1e16, 1]})
+
+    with GroupBy(df, "A") as g:
+        sums = g.rolling_sum("X", 2)
+        means = g.rolling_mean("X", 2, min_periods=1)
+
+    assert sums.tolist()[1:6] == [1e16 + 1, 2, 2, 2, 2]
+    assert np.isnan(sums.iloc[0]) and np.isnan(sums.iloc[6])
+    assert means.tolist()[2:6] == [1, 1, 1, 1]
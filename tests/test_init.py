@@ -0,0 +1,27 @@
+import subprocess
+import sys
+
+import tidybear as tb
+
+
+def _run(code):
+    return subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def test_import_does_not_import_pandas():
+    code = "import sys, tidybear, tidybear.selectors; print('pandas' in sys.modules)"
+    assert _run(code) == "False"
+
+
+def test_verbs_import_pandas_on_first_use():
+    code = "import sys, tidybear; tidybear.count; print('pandas' in sys.modules)"
+    assert _run(code) == "True"
+
+
+def test_all_names_resolve():
+    for name in tb.__all__:
+        assert getattr(tb, name) is not None
+
+    assert set(tb.__all__) <= set(dir(tb))
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import tidybear as tb
+from tidybear.selectors import starts_with
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    n = 1000
+    return pd.DataFrame(
+        {
+            "year": rng.choice([2020, 2021, 2022], size=n),
+            "country": rng.choice(["DE", "FR", "US"], size=n),
+            "x_a": rng.normal(size=n),
+            "x_b": rng.normal(size=n),
+            "other": rng.integers(0, 10, size=n),
+        }
+    )
+
+
+@pytest.fixture(params=["parquet", "feather", "csv"])
+def path(request, data, tmp_path):
+    path = tmp_path / f"data.{request.param}"
+    if request.param == "csv":
+        data.to_csv(path, index=False)
+    else:
+        getattr(data, f"to_{request.param}")(path)
+
+    return path
+
+
+def test_count_from_file(path, data):
+    result = tb.count(path, ["year", "country"])
+    expected = tb.count(data, ["year", "country"])
+    pd.testing.assert_frame_equal(
+        result.reset_index(drop=True), expected.reset_index(drop=True)
+    )
+
+
+def test_select_from_file(path, data):
+    result = tb.select(str(path), starts_with("x_"), c="country")
+    assert result.columns.tolist() == ["x_a", "x_b", "c"]
+    np.testing.assert_allclose(result.x_a, data.x_a)
+
+
+def test_groupby_from_file_reads_only_needed_columns(path, data):
+    with tb.GroupBy(path, "country", columns="x_a") as g:
+        assert g.obj.columns.tolist() == ["country", "x_a"]
+        result = g.sum("x_a")
+
+    np.testing.assert_allclose(result, data.groupby("country").x_a.sum())
+
+
+def test_scan_filters(path, data):
+    source = tb.scan(path, filters=[("year", ">=", 2021), ("country", "!=", "US")])
+    result = tb.count(source, "country")
+
+    kept = data[(data.year >= 2021) & (data.country != "US")]
+    assert result.n.tolist() == kept.groupby("country").size().tolist()
+
+
+def test_scan_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        tb.count(tmp_path / "data.xlsx", "country")
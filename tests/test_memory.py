@@ -0,0 +1,81 @@
+import pandas as pd
+import pytest
+
+import tidybear as tb
+from tidybear.memory import check_memory
+from tidybear.verbs.join import _join_rows
+
+
+@pytest.fixture(autouse=True)
+def reset_options():
+    yield
+    tb.options.reset()
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({"key": [1, 1, 2, 3], "A": [1.0, 2.0, 3.0, 4.0]})
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [(None, None), (1000, 1000), ("1KB", 1024), ("1.5 mb", 1572864), ("2G", 2**31)],
+)
+def test_max_memory_parsing(value, expected):
+    tb.options.max_memory = value
+    assert tb.options.max_memory == expected
+
+
+def test_max_memory_bad_value():
+    with pytest.raises(ValueError):
+        tb.options.max_memory = "lots"
+
+
+def test_check_memory():
+    check_memory("verb", 10**12)
+
+    tb.options.max_memory = 100
+    check_memory("verb", 100)
+    with pytest.raises(tb.MemoryBudgetError, match="verb needs an estimated"):
+        check_memory("verb", 101, "Try less.")
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_join_rows(data, how):
+    other = pd.DataFrame({"key": [1, 1, 3, 4], "B": [1, 2, 3, 4]})
+    expected = len(data.merge(other, how=how, on="key"))
+    assert _join_rows(data, other, how, ["key"], ["key"]) == expected
+
+
+def test_verbs_respect_budget(data):
+    tb.options.max_memory = 100
+
+    with pytest.raises(tb.MemoryBudgetError):
+        tb.cross_join(data, data)
+
+    with pytest.raises(tb.MemoryBudgetError):
+        tb.left_join(data, data, "key")
+
+    with pytest.raises(tb.MemoryBudgetError):
+        tb.mutate(data, B=lambda x: x.A * 2)
+
+    with pytest.raises(tb.MemoryBudgetError):
+        tb.slice_max(data, order_by="A", n=1)
+
+    with pytest.raises(tb.MemoryBudgetError, match="chunksize"):
+        tb.pivot_longer(data, "A")
+
+
+def test_pivot_longer_chunks_fit_budget(data):
+    tb.options.max_memory = 100
+
+    with pytest.raises(tb.MemoryBudgetError):
+        tb.pivot_longer(data, "A")
+
+    chunks = list(tb.pivot_longer(data, "A", chunksize=1))
+    assert len(chunks) == 4
+
+
+def test_rename_needs_no_memory(data):
+    tb.options.max_memory = 1
+    assert tb.rename(data, A="B").columns.tolist() == ["key", "B"]
@@ -0,0 +1,108 @@
+import threading
+
+import pandas as pd
+import pytest
+
+import tidybear as tb
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({"A": list("aabbc"), "B": [1, 2, 3, 4, 5], "C": [1.0] * 5})
+
+
+def test_profile_records_verbs(data):
+    with tb.profile() as prof:
+        tb.count(data, "A")
+        tb.select(data, "A", "B")
+
+    report = prof.report()
+    assert report.verb.tolist() == ["count", "select"]
+    assert report.input_shape.tolist() == [(5, 3), (5, 3)]
+    assert report.output_shape.tolist() == [(3, 2), (5, 2)]
+    assert (report.wall_time > 0).all()
+    assert report.bytes_allocated.notna().all()
+
+
+def test_profile_groupby_stats_recorded_once(data):
+    with tb.profile() as prof:
+        with tb.GroupBy(data, "A") as g:
+            g.sum("B")
+            g.n_distinct("C")
+            g.summarise()
+
+    assert prof.report().verb.tolist() == [
+        "GroupBy.sum",
+        "GroupBy.n_distinct",
+        "GroupBy.summarise",
+    ]
+    assert prof.records[0]["input_shape"] == (5, 3)
+
+
+def test_profile_copied_bytes(data):
+    with tb.profile() as prof:
+        tb.select(data, "B", "C", copy=True)
+        tb.select(data, "B", "C", copy=False)
+
+    copied = prof.report().copied_bytes.tolist()
+    assert copied == [80, 0]
+
+
+def test_profile_copied_bytes_arrow(data):
+    pytest.importorskip("pyarrow")
+    arrow = data.convert_dtypes(dtype_backend="pyarrow")
+
+    with tb.profile() as prof:
+        tb.select(arrow, "A", "B", copy=False)
+        tb.select(arrow, "A", "B", copy=True)
+
+    copied = prof.report().copied_bytes.tolist()
+    assert copied[0] == 0
+    assert copied[1] > 0
+
+
+def test_profile_is_per_thread(data):
+    started, done = threading.Event(), threading.Event()
+
+    def other_thread():
+        with tb.profile() as prof:
+            started.set()
+            done.wait(5)
+            tb.rename(data, A="X")
+        records.extend(prof.records)
+
+    records = []
+    thread = threading.Thread(target=other_thread)
+    thread.start()
+    started.wait(5)
+
+    with tb.profile() as prof:
+        tb.count(data, "A")
+        done.set()
+        thread.join()
+
+    assert [r["verb"] for r in prof.records] == ["count"]
+    assert [r["verb"] for r in records] == ["rename"]
+
+
+def test_profile_without_memory(data):
+    with tb.profile(memory=False) as prof:
+        tb.count(data, "A")
+
+    assert prof.records[0]["bytes_allocated"] is None
+    assert prof.records[0]["copied_bytes"] is None
+
+
+def test_hooks(data):
+    records = []
+    tb.add_hook(records.append)
+    try:
+        tb.rename(data, A="X")
+    finally:
+        tb.remove_hook(records.append)
+
+    tb.rename(data, A="X")
+
+    assert len(records) == 1
+    assert records[0]["verb"] == "rename"
+    assert records[0]["output_shape"] == (5, 3)
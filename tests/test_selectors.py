@@ -1,3 +1,5 @@
+import numpy as np
+import pandas as pd
 import pytest
 
 from tidybear import selectors
@@ -92,3 +94,124 @@ def test_tidyselector_negate():
 
 def test_tidyselector_filter_columns():
     assert selectors.everything().filter_columns(COLUMN_NAMES) == COLUMN_NAMES
+
+
+def test_tidyselector_negate_partial():
+    selector = -selectors.contains("color")
+    assert selector(COLUMN_NAMES) == ["name", "age", "height", "weight"]
+
+
+def test_tidyselector_memoized_per_index():
+    calls = []
+
+    def select_all(columns):
+        calls.append(columns)
+        return list(columns)
+
+    selector = selectors.TidySelector(select_all)
+    index = pd.Index(COLUMN_NAMES)
+
+    assert selector(index) == COLUMN_NAMES
+    assert selector(index) == COLUMN_NAMES
+    assert len(calls) == 1
+
+    assert selector(pd.Index(COLUMN_NAMES)) == COLUMN_NAMES
+    assert len(calls) == 2
+
+
+def test_tidyselector_not_memoized_for_lists():
+    columns = list(COLUMN_NAMES)
+    selector = selectors.everything()
+
+    assert selector(columns) == COLUMN_NAMES
+    columns.append("shoe_size")
+    assert selector(columns) == [*COLUMN_NAMES, "shoe_size"]
+
+
+def test_tidyselector_cache_returns_copies():
+    index = pd.Index(COLUMN_NAMES)
+    selector = selectors.everything()
+
+    selector(index).append("shoe_size")
+    assert selector(index) == COLUMN_NAMES
+
+
+def test_tidyselector_and():
+    selector = selectors.contains("e") & selectors.ends_with("t")
+    assert selector(COLUMN_NAMES) == ["height", "weight"]
+
+
+def test_tidyselector_or_keeps_column_order_without_duplicates():
+    selector = selectors.ends_with("color") | "name" | selectors.contains("eye")
+    assert selector(COLUMN_NAMES) == ["name", "eye_color", "hair_color"]
+
+
+def test_tidyselector_difference():
+    selector = selectors.contains("e") - selectors.contains("color")
+    assert selector(COLUMN_NAMES) == ["name", "age", "height", "weight"]
+
+    selector = "name" - selectors.starts_with("n")
+    assert selector(COLUMN_NAMES) == []
+
+
+def test_tidyselector_nested_combinations():
+    selector = -(selectors.starts_with("h") | selectors.starts_with("w")) & "age"
+    assert selector(COLUMN_NAMES) == ["age"]
+
+
+def test_where():
+    dtypes = ["O", "i8", "f8", "f8", "O", "O"]
+    selector = selectors.where(lambda dtype: dtype == "f8")
+    assert selector(COLUMN_NAMES, dtypes) == ["height", "weight"]
+
+    selector = selectors.where(lambda dtype: dtype == "O") - "name"
+    assert selector(COLUMN_NAMES, dtypes) == ["eye_color", "hair_color"]
+
+
+def test_where_needs_dtypes():
+    with pytest.raises(ValueError):
+        selectors.where(lambda dtype: True)(COLUMN_NAMES)
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(
+        {
+            "name": ["a", "b"],
+            "age": [1, 2],
+            "height": [1.0, 2.0],
+            "weight": pd.Series([1.0, 2.0], dtype="float32"),
+            "alive": [True, False],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "predicate,expected",
+    [
+        (selectors.is_numeric, ["age", "height", "weight"]),
+        (selectors.is_float, ["height", "weight"]),
+        (selectors.is_integer, ["age"]),
+        (selectors.is_bool, ["alive"]),
+        ("float32", ["weight"]),
+        (np.float64, ["height"]),
+    ],
+)
+def test_where_frame(frame, predicate, expected):
+    assert selectors.where(predicate)(frame) == expected
+
+
+def test_where_frame_dtype_index_is_cached(frame):
+    calls = []
+
+    def is_float(dtype):
+        calls.append(dtype)
+        return dtype.kind == "f"
+
+    selector = selectors.where(is_float)
+    assert selector(frame) == ["height", "weight"]
+    assert selector(frame) == ["height", "weight"]
+    assert len(calls) == len(set(frame.dtypes))
+
+    frame["age"] = frame["age"].astype("float64")
+    assert selector(frame) == ["age", "height", "weight"]
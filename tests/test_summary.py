@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tidybear import GroupBy
+from tidybear import SummaryState
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    n = 20_000
+    df = pd.DataFrame(
+        {
+            "A": rng.choice(list("abc"), size=n),
+            "X": rng.normal(size=n),
+            "U": rng.integers(0, 2000, size=n),
+        }
+    )
+    df.loc[::11, "X"] = np.nan
+    return df
+
+
+def test_summary_state_matches_groupby(data):
+    with GroupBy(data, "A") as g:
+        summary = g.summary_state("X").summarise()
+
+    expected = data.groupby("A").X.agg(["mean", "sum", "var", "std", "min", "max"])
+    assert summary.columns.tolist() == [
+        "n",
+        "mean_X",
+        "sum_X",
+        "var_X",
+        "std_X",
+        "min_X",
+        "max_X",
+    ]
+    assert summary.n.tolist() == data.groupby("A").size().tolist()
+    np.testing.assert_allclose(summary.iloc[:, 1:].to_numpy(), expected.to_numpy())
+
+
+def test_summary_state_update(data):
+    # the new rows include a group that was not in the history
+    data.loc[15_000:, "A"] = data.loc[15_000:, "A"].replace("c", "d")
+    history, new_rows = data.iloc[:15_000], data.iloc[15_000:]
+
+    state = SummaryState.from_frame(history, "A", "X").update(new_rows)
+    expected = SummaryState.from_frame(data, "A", "X")
+
+    assert state.ngroups == 4
+    pd.testing.assert_frame_equal(state.summarise(), expected.summarise())
+
+
+def test_summary_state_distinct(data):
+    state = SummaryState.from_frame(data.iloc[:10_000], "A", distinct="U")
+    state = state.merge(SummaryState.from_frame(data.iloc[10_000:], "A", distinct="U"))
+
+    expected = data.groupby("A").U.nunique()
+    estimate = state.summarise().n_distinct_U
+    np.testing.assert_allclose(estimate, expected, rtol=0.1)
+
+
+def test_summary_state_save_load(data, tmp_path):
+    state = SummaryState.from_frame(data, "A", "X", distinct="U")
+    state.save(tmp_path / "state.pkl")
+
+    loaded = SummaryState.load(tmp_path / "state.pkl")
+    pd.testing.assert_frame_equal(loaded.summarise(), state.summarise())
+
+
+def test_summary_state_merge_different_columns(data):
+    with pytest.raises(ValueError):
+        SummaryState.from_frame(data, "A", "X").merge(
+            SummaryState.from_frame(data, "A", distinct="U")
+        )
+
+
+def test_summary_state_missing_key():
+    df = pd.DataFrame({"A": ["a", "a", None, "b"], "X": [1.0, 2.0, 3.0, 4.0]})
+    summary = SummaryState.from_frame(df, "A", "X").summarise()
+
+    assert summary.index.tolist() == ["a", "b"]
+    assert summary.n.tolist() == [2, 1]
+    assert summary.sum_X.tolist() == [3.0, 4.0]
+
+
+def test_summary_state_unobserved_category():
+    keys = pd.Categorical(list("bbc"), categories=list("abc"))
+    df = pd.DataFrame({"A": keys, "X": [1.0, 2.0, 5.0]})
+    summary = SummaryState.from_frame(df, "A", "X").summarise()
+
+    assert summary.index.tolist() == ["a", "b", "c"]
+    assert summary.n.tolist() == [0, 2, 1]
+    assert summary.sum_X.tolist() == [0.0, 3.0, 5.0]
@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+
+from tidybear import arrange
+from tidybear import desc
+from tidybear.selectors import starts_with
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    n = 1000
+    dates = pd.Timestamp("2022-01-01") + pd.to_timedelta(rng.integers(0, 5, n), "D")
+    return DataFrame(
+        {
+            "A": rng.integers(-3, 3, size=n),
+            "B": rng.choice(["x", "y", "z", None], size=n),
+            "C": np.where(rng.random(n) < 0.1, np.nan, rng.normal(size=n).round(1)),
+            "D": dates.where(rng.random(n) > 0.1),
+            "E": pd.Categorical(
+                rng.choice(["lo", "mid", "hi"], size=n), ["lo", "mid", "hi"]
+            ),
+            "F": rng.random(n) < 0.5,
+        },
+        index=rng.permutation(n),
+    )
+
+
+@pytest.mark.parametrize("na_position", ["first", "last"])
+@pytest.mark.parametrize(
+    "keys, ascending",
+    [
+        (["A"], [True]),
+        (["C"], [False]),
+        (["B", "C"], [True, False]),
+        (["E", "A", "D"], [False, True, True]),
+        (["F", "D", "B"], [True, False, False]),
+    ],
+)
+def test_arrange_matches_sort_values(data, keys, ascending, na_position):
+    # pandas only places the missing values of the first key, so compare on rows
+    # where the other keys are complete
+    df = data.dropna(subset=keys[1:])
+    sort_keys = [k if a else desc(k) for k, a in zip(keys, ascending)]
+
+    result = arrange(df, *sort_keys, na_position=na_position)
+    expected = df.sort_values(
+        keys, ascending=ascending, na_position=na_position, kind="stable"
+    )
+    assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("limit", [0, 1, 10, 999, 1000, 5000])
+@pytest.mark.parametrize("na_position", ["first", "last"])
+def test_arrange_limit_matches_full_sort(data, limit, na_position):
+    keys = [desc("C"), "B", "A"]
+    result = arrange(data, *keys, na_position=na_position, limit=limit)
+    expected = arrange(data, *keys, na_position=na_position).head(limit)
+    assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("na_position", ["first", "last"])
+def test_arrange_limit_partitions_on_values(monkeypatch, na_position):
+    df = DataFrame({"x": [np.inf, np.nan, -np.inf, 3.0, np.nan, 1.0] * 100})
+
+    sorted_rows = []
+    lexsort = np.lexsort
+    monkeypatch.setattr(
+        np, "lexsort", lambda keys: sorted_rows.append(len(keys[0])) or lexsort(keys)
+    )
+    result = arrange(df, "x", na_position=na_position, limit=3)
+    monkeypatch.undo()
+
+    expected = df.sort_values("x", na_position=na_position, kind="stable").head(3)
+    assert_frame_equal(result, expected)
+    # with missing values first, they are filled with -inf and tie with those rows
+    assert sorted_rows == [100 if na_position == "last" else 300]
+
+
+def test_arrange_desc_extremes():
+    df = DataFrame({"x": [0, np.iinfo(np.int64).min, np.iinfo(np.int64).max, -1]})
+    assert arrange(df, desc("x")).x.tolist() == sorted(df.x, reverse=True)
+
+
+def test_arrange_selector_keys(data):
+    df = data[["A", "B"]].rename(columns={"A": "key_a", "B": "key_b"})
+    result = arrange(df, desc(starts_with("key")))
+    expected = df.sort_values(["key_a", "key_b"], ascending=False, kind="stable")
+    assert result.key_a.tolist() == expected.key_a.tolist()
+
+
+def test_arrange_no_keys_returns_copy(data):
+    result = arrange(data)
+    assert_frame_equal(result, data)
+    assert result is not data
+
+
+def test_arrange_bad_na_position(data):
+    with pytest.raises(ValueError):
+        arrange(data, "A", na_position="middle")
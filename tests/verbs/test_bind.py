@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+
+from tidybear import bind_cols
+from tidybear import bind_rows
+
+
+@pytest.fixture
+def frames():
+    return [
+        DataFrame({"x": [1, 2], "s": ["a", "b"], "f": [True, False]}),
+        DataFrame({"x": [1.5, np.nan], "d": pd.to_datetime(["2022-01-01", None])}),
+        DataFrame({"s": ["c", None], "x": [7, 8]}, index=[10, 11]),
+    ]
+
+
+@pytest.mark.parametrize("as_input", [list, iter])
+def test_bind_rows_matches_concat(frames, as_input):
+    result = bind_rows(as_input(frames))
+    assert_frame_equal(result, pd.concat(frames))
+
+
+def test_bind_rows_varargs_and_ignore_index(frames):
+    result = bind_rows(*frames, ignore_index=True)
+    assert_frame_equal(result, pd.concat(frames, ignore_index=True))
+
+
+def test_bind_rows_generator_grows():
+    frames = (DataFrame({"x": np.arange(i), "y": [str(i)] * i}) for i in range(1, 30))
+    expected = pd.concat(
+        [DataFrame({"x": np.arange(i), "y": [str(i)] * i}) for i in range(1, 30)],
+        ignore_index=True,
+    )
+    assert_frame_equal(bind_rows(frames, ignore_index=True), expected)
+
+
+@pytest.mark.parametrize("as_input", [list, iter])
+def test_bind_rows_unions_categories(as_input):
+    frames = [
+        DataFrame({"c": pd.Categorical(["u", "v"])}),
+        DataFrame({"c": pd.Categorical(["w", None, "u"])}),
+        DataFrame({"z": [1]}),
+    ]
+    result = bind_rows(as_input(frames), ignore_index=True)
+    assert result.c.dtype == "category"
+    assert result.c.cat.categories.tolist() == ["u", "v", "w"]
+    assert result.c.tolist() == ["u", "v", "w", np.nan, "u", np.nan]
+
+
+def test_bind_rows_ordered_categories_must_match():
+    frames = [
+        DataFrame({"c": pd.Categorical(["a"], ordered=True)}),
+        DataFrame({"c": pd.Categorical(["b"], ordered=True)}),
+    ]
+    with pytest.raises(TypeError):
+        bind_rows(frames)
+
+
+@pytest.mark.parametrize("as_input", [list, iter])
+def test_bind_rows_extension_dtypes(as_input):
+    frames = [
+        DataFrame({"a": pd.array([1, None], dtype="Int64")}),
+        DataFrame({"a": [1.5, 2.0]}),
+        DataFrame({"b": ["x"]}),
+    ]
+    result = bind_rows(as_input(frames), ignore_index=True)
+    assert_frame_equal(result, pd.concat(frames, ignore_index=True))
+
+
+def test_bind_rows_no_frames():
+    assert bind_rows([]).empty
+
+
+def test_bind_cols(frames):
+    left, right = frames[0], frames[1].rename(columns={"x": "y"})
+    result = bind_cols(left, right)
+    assert result.columns.tolist() == ["x", "s", "f", "y", "d"]
+    assert_frame_equal(result[["y", "d"]], right)
+
+
+def test_bind_cols_by_position():
+    left = DataFrame({"x": [1, 2]}, index=["a", "b"])
+    right = DataFrame({"y": [3, 4]}, index=[0, 1])
+    result = bind_cols(left, right)
+    assert result.index.tolist() == ["a", "b"]
+    assert result.y.tolist() == [3, 4]
+
+
+def test_bind_cols_errors(frames):
+    with pytest.raises(ValueError):
+        bind_cols(frames[0], frames[1])
+
+    with pytest.raises(ValueError):
+        bind_cols(frames[0], DataFrame({"y": [1]}))
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from pandas import concat
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+
+from tidybear import distinct
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    n = 1000
+    return DataFrame(
+        {
+            "A": rng.integers(0, 5, size=n),
+            "B": rng.choice(["x", "y", None], size=n),
+            "C": rng.normal(size=n),
+        }
+    )
+
+
+@pytest.mark.parametrize("cols", [None, "A", ["A", "B"]])
+def test_distinct_matches_drop_duplicates(data, cols):
+    result = distinct(data, cols, keep_all=True)
+    assert_frame_equal(result, data.drop_duplicates(cols))
+
+
+def test_distinct_selected_columns(data):
+    result = distinct(data, ["B", "A"])
+    assert result.columns.tolist() == ["B", "A"]
+    assert len(result) == 15
+
+
+def test_distinct_count(data):
+    result = distinct(data, ["A", "B"], count=True)
+    expected = data.groupby(["A", "B"], dropna=False).size()
+
+    assert result.n.sum() == len(data)
+    counts = result.set_index(["A", "B"]).n.sort_index()
+    assert counts.tolist() == expected.sort_index().tolist()
+
+
+def test_distinct_chunks(data):
+    chunks = [data.iloc[i:][:100] for i in range(0, len(data), 100)]
+    result = concat(distinct(chunks, ["A", "B"]))
+    assert_frame_equal(result, data.drop_duplicates(["A", "B"])[["A", "B"]])
+
+
+def test_distinct_chunks_count(data):
+    with pytest.raises(ValueError):
+        distinct([data], "A", count=True)
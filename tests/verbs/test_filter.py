@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from pandas import DataFrame
+
+from tidybear import filter
+from tidybear import profile
+
+
+@pytest.fixture
+def data():
+    return DataFrame(
+        {
+            "g": ["a", "a", "a", "b", "b", "c"],
+            "x": [1.0, 2.0, 3.0, 4.0, np.nan, 6.0],
+            "y": [6, 5, 4, 3, 2, 1],
+        }
+    )
+
+
+def test_filter_expression(data):
+    result = filter(data, "x > 1 and y > 2")
+    assert result.index.tolist() == [1, 2, 3]
+
+
+def _between(df, low, high):
+    return filter(df, "x > @low and x < @high")
+
+
+def test_filter_expression_local_variables(data):
+    assert _between(data, 1, 3).index.tolist() == [1]
+
+
+def test_filter_expression_local_variables_profiled(data):
+    with profile():
+        result = _between(data, 3, 7)
+    assert result.index.tolist() == [3, 5]
+
+
+def test_filter_multiple_predicates(data):
+    result = filter(data, "y < 6", lambda x: x.g != "b", lambda x: x.x < 6)
+    assert result.index.tolist() == [1, 2]
+
+
+def test_filter_drops_missing(data):
+    result = filter(data, lambda x: (x.x > 2).astype("boolean").mask(x.x.isna()))
+    assert result.index.tolist() == [2, 3, 5]
+    assert 4 not in result.index
+
+
+def test_filter_aligns_series_on_index(data):
+    mask = (data.y > 3)[::-1]
+    result = filter(data, lambda x: mask)
+    assert result.index.tolist() == [0, 1, 2]
+
+    with pytest.raises(ValueError):
+        filter(data, lambda x: mask.reset_index(drop=True).iloc[:3])
+
+
+def test_filter_groupby(data):
+    result = filter(data, lambda x: x.n() > 1, lambda x: x.y == x.y.max(), groupby="g")
+    assert result.index.tolist() == [0, 3]
+
+
+def test_filter_keeps_everything(data):
+    result = filter(data, lambda x: True)
+    assert result.equals(data)
+    assert result is not data
@@ -1,5 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
 import pytest
 from pandas import DataFrame
+from pandas.testing import assert_frame_equal
 
 from tidybear import mutate
 
@@ -20,3 +24,169 @@ def test_mutate_mult_col(data):
     assert result.columns.tolist() == ["A", "aplus1", "atimes4"]
     assert result.aplus1.tolist() == [2, 3]
     assert result.atimes4.tolist() == [4, 8]
+
+
+@pytest.mark.parametrize("option", ["groupby", "n_jobs", "engine"])
+def test_mutate_option_as_column_name(data, option):
+    with pytest.raises(TypeError, match=f"{option} is an option of mutate"):
+        mutate(data, **{option: lambda x: x.A + 1})
+
+
+@pytest.fixture
+def grouped_data():
+    return DataFrame({"g": ["a", "a", "b", None], "x": [1.0, 3.0, 5.0, 7.0]})
+
+
+def test_mutate_groupby_broadcasts_aggregates(grouped_data):
+    result = mutate(
+        grouped_data,
+        groupby="g",
+        demeaned=lambda x: x.x - x.x.mean(),
+        top=lambda x: x["x"].max(),
+        size=lambda x: x.n(),
+    )
+    assert result.columns.tolist() == ["g", "x", "demeaned", "top", "size"]
+    assert result.demeaned.tolist() == [-1.0, 1.0, 0.0, 0.0]
+    assert result.top.tolist() == [3.0, 3.0, 5.0, 7.0]
+    assert result["size"].tolist() == [2, 2, 1, 1]
+
+
+def test_mutate_groupby_sees_new_columns(grouped_data):
+    result = mutate(
+        grouped_data,
+        groupby="g",
+        x=lambda x: x.x * 2,
+        total=lambda x: x.x.sum(),
+        overall=lambda x: (x.x - x.x.mean()).mean(),
+    )
+    assert result.x.tolist() == [2.0, 6.0, 10.0, 14.0]
+    assert result.total.tolist() == [8.0, 8.0, 10.0, 14.0]
+    assert result.overall.tolist() == [0.0] * 4
+
+
+def test_mutate_groupby_forwards_arguments(grouped_data):
+    data = grouped_data.assign(x=[1.0, 3.0, 5.0, None])
+    result = mutate(
+        data,
+        groupby="g",
+        sd=lambda x: x.x.std(ddof=0),
+        mean=lambda x: x.x.mean(skipna=False),
+        median=lambda x: x.x.quantile(0.5),
+        agg=lambda x: x.x.agg("max"),
+        running=lambda x: x.x.cumsum(),
+        share=lambda x: x.x / x.x.sum(),
+    )
+    assert result.sd.tolist()[:3] == [1.0, 1.0, 0.0]
+    assert result["mean"].tolist()[:3] == [2.0, 2.0, 5.0]
+    assert result["mean"].isna().tolist() == [False, False, False, True]
+    assert result["median"].tolist()[:3] == [2.0, 2.0, 5.0]
+    assert result["agg"].tolist()[:3] == [3.0, 3.0, 5.0]
+    assert result.running.tolist()[:3] == [1.0, 4.0, 5.0]
+    assert result.share.tolist()[:3] == [0.25, 0.75, 1.0]
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2, -1])
+def test_mutate_n_jobs_matches_serial(n_jobs):
+    pytest.importorskip("cloudpickle")
+
+    df = DataFrame({"A": range(50), "B": list("xy") * 25}, index=[0] * 50)
+    definitions = dict(
+        twice=lambda x: x.A * 2,
+        label=lambda x: f"{x.B}{x.twice}",
+    )
+
+    result = mutate(df, n_jobs=n_jobs, **definitions)
+    assert_frame_equal(result, mutate(df, **definitions))
+
+
+def test_mutate_n_jobs_shares_numeric_columns():
+    pytest.importorskip("cloudpickle")
+
+    df = DataFrame(
+        {
+            "f": [0.5, None, 2.5, 3.0] * 5,
+            "s": list("abcd") * 5,
+            "b": [True, False] * 10,
+            "t": pd.date_range("2022-01-01", periods=20),
+            "n": pd.array([1, None, 3, 4] * 5, dtype="Int64"),
+        },
+        index=list("klmnopqrstuvwxyzABCD"),
+    )
+    definitions = dict(
+        row=lambda x: f"{x.name}{x.f}{x.s}{x.b}{x.t.day}{x.n}",
+        f2=lambda x: x.f * 2,
+    )
+
+    result = mutate(df, n_jobs=2, **definitions)
+    assert_frame_equal(result, mutate(df, **definitions))
+
+
+def test_mutate_n_jobs_concurrent_calls():
+    pytest.importorskip("cloudpickle")
+
+    frames = [DataFrame({"A": range(i, i + 20)}) for i in range(3)]
+    with ThreadPoolExecutor(3) as pool:
+        results = list(
+            pool.map(lambda df: mutate(df, n_jobs=2, B=lambda x: x.A * 2), frames)
+        )
+
+    for df, result in zip(frames, results):
+        assert result.B.tolist() == (df.A * 2).tolist()
+
+
+def test_mutate_n_jobs_raises_from_workers(data):
+    pytest.importorskip("cloudpickle")
+
+    with pytest.raises(ZeroDivisionError):
+        mutate(data, n_jobs=2, bad=lambda x: 1 // 0)
+
+
+def test_mutate_n_jobs_errors(data):
+    with pytest.raises(ValueError):
+        mutate(data, n_jobs=0, aplus1=lambda x: x.A + 1)
+
+    with pytest.raises(ValueError):
+        mutate(data, groupby="A", n_jobs=2, n=lambda x: x.n())
+
+
+def test_mutate_numba_engine():
+    pytest.importorskip("numba")
+
+    df = DataFrame({"price": [1.5, 2.0, None], "qty": [1, 2, 3]})
+    result = mutate(
+        df,
+        engine="numba",
+        total=lambda price, qty: price * qty,
+        large=lambda total: total > 2,
+    )
+    assert result.columns.tolist() == ["price", "qty", "total", "large"]
+    assert result.total.tolist()[:2] == [1.5, 4.0]
+    assert result.total.isna().tolist() == [False, False, True]
+    assert result.large.tolist() == [False, True, False]
+
+
+def test_mutate_numba_engine_arrow():
+    pytest.importorskip("numba")
+    pytest.importorskip("pyarrow")
+
+    df = DataFrame({"x": [1, None, 3]}).convert_dtypes(dtype_backend="pyarrow")
+    result = mutate(df, engine="numba", y=lambda x: x * 2)
+    assert str(result.y.dtype) == "double[pyarrow]"
+    assert result.y.tolist()[::2] == [2.0, 6.0]
+    assert result.y.isna().tolist() == [False, True, False]
+
+
+def test_mutate_numba_engine_errors(data):
+    pytest.importorskip("numba")
+
+    with pytest.raises(KeyError):
+        mutate(data, engine="numba", b=lambda B: B + 1)
+
+    with pytest.raises(TypeError):
+        mutate(DataFrame({"s": ["a"]}), engine="numba", t=lambda s: s)
+
+    with pytest.raises(ValueError):
+        mutate(data, engine="numba", n_jobs=2, b=lambda A: A + 1)
+
+    with pytest.raises(ValueError):
+        mutate(data, engine="cython", b=lambda A: A + 1)
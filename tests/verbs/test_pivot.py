@@ -1,4 +1,6 @@
 import pytest
+from numpy import nan
+from pandas import concat
 from pandas import DataFrame
 from pandas import isna
 from pandas.testing import assert_frame_equal
@@ -66,6 +68,28 @@ def test_pivot_longer_dont_drop_na(df_wide, df_long):
     assert isna(pivot.value.tolist()[2])
 
 
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+def test_pivot_longer_matches_stack():
+    df = DataFrame({"idx": [2.0, nan, 1.0], 0: [1, 2, 3], 1: [4, 5, 6]})
+    pivot = pivot_longer(df, "idx", cols_are_index=True)
+
+    expected = df.set_index("idx").stack(dropna=False).reset_index()
+    expected.columns = ["idx", "name", "value"]
+    assert_frame_equal(pivot, expected)
+    assert pivot.name.dtype == "int64"
+
+
+@pytest.mark.filterwarnings("ignore::FutureWarning")
+def test_pivot_longer_keeps_index_named_like_names_to():
+    df = DataFrame({"name": ["a", "b"], "height": [1.0, nan], "mass": [3.0, 4.0]})
+    pivot = pivot_longer(df, ["height", "mass"])
+
+    expected = df.set_index("name").stack(dropna=False).reset_index()
+    expected.columns = ["name", "name", "value"]
+    assert_frame_equal(pivot, expected.dropna(subset=["value"]))
+    assert pivot.iloc[:, 0].tolist() == ["a", "a", "b"]
+
+
 # # PIVOT_WIDER
 
 
@@ -100,3 +124,47 @@ def test_pivot_wider_fill_na(df_long, df_wide):
     df_wide["B"] = df_wide.B.astype(float)
 
     assert_frame_equal(pivot, df_wide)
+
+
+def test_pivot_wider_matches_pivot():
+    df = DataFrame(
+        {
+            "k": [2.0, nan, 1.0, nan],
+            "j": ["x", "y", "x", "y"],
+            "name": ["a", "a", nan, "b"],
+            "value": [1, 2, 3, 4],
+        }
+    )
+    pivot = pivot_wider(df)
+
+    expected = df.pivot(index=["k", "j"], columns="name", values="value")
+    expected.columns = expected.columns.tolist()
+    assert_frame_equal(pivot, expected.reset_index())
+    assert pivot.k.isna().tolist() == [True, False, False]
+
+
+# PIVOT_LONGER CHUNKED
+
+
+def test_pivot_longer_chunked_rows(df_wide, df_long):
+    chunks = list(pivot_longer(df_wide, ["A", "B"], chunksize=2))
+    assert len(chunks) == 2
+
+    pivot = concat(chunks).sort_values(["name", "idx"]).reset_index(drop=True)
+    assert_frame_equal(pivot, df_long)
+
+
+def test_pivot_longer_chunked_columns(df_wide, df_long):
+    chunks = list(pivot_longer(df_wide, ["A", "B"], chunksize=1, chunk_by="columns"))
+    assert [chunk.name.unique().tolist() for chunk in chunks] == [["A"], ["B"]]
+
+    pivot = concat(chunks).sort_values(["name", "idx"]).reset_index(drop=True)
+    assert_frame_equal(pivot, df_long)
+
+
+def test_pivot_longer_chunked_bad_args(df_wide):
+    with pytest.raises(ValueError):
+        pivot_longer(df_wide, ["A", "B"], chunksize=0)
+
+    with pytest.raises(ValueError):
+        pivot_longer(df_wide, ["A", "B"], chunksize=1, chunk_by="blocks")
@@ -1,9 +1,12 @@
+import numpy as np
 import pytest
 from numpy.testing import assert_array_equal
 from pandas import DataFrame
 from pandas.testing import assert_frame_equal
 
 from tidybear import rename
+from tidybear import rename_with
+from tidybear.selectors import starts_with
 
 
 @pytest.fixture
@@ -79,3 +82,23 @@ def test_rename_fails_with_args(df):
     # too many
     with pytest.raises(AssertionError):
         rename(df, "X", "Y", "Z")
+
+
+def test_rename_shares_data(df):
+    renamed = rename(df, A="X")
+    assert renamed.columns.tolist() == ["X", "B"]
+    assert df.columns.tolist() == ["A", "B"]
+    assert np.shares_memory(renamed["X"].to_numpy(), df["A"].to_numpy())
+
+
+def test_rename_with(df):
+    renamed = rename_with(df, str.lower)
+    assert renamed.columns.tolist() == ["a", "b"]
+    assert_array_equal(df.values, renamed.values)
+
+
+def test_rename_with_selector(df):
+    df["xC"] = [5, 6]
+    renamed = rename_with(df, str.upper, starts_with("x"))
+    assert renamed.columns.tolist() == ["A", "B", "XC"]
+    assert np.shares_memory(renamed["XC"].to_numpy(), df["xC"].to_numpy())
@@ -1,8 +1,11 @@
+import numpy as np
 import pytest
 from pandas import DataFrame
 from pandas.testing import assert_frame_equal
 
 from tidybear import select
+from tidybear.selectors import starts_with
+from tidybear.selectors import where
 
 
 @pytest.fixture
@@ -39,3 +42,42 @@ def test_select_args_and_kwargs(df):
     check = df.loc[:, ["A", "B"]]
     check.rename(columns={"B": "b"}, inplace=True)
     assert_frame_equal(selected, check)
+
+
+def test_select_combined_selectors(df):
+    selected = select(df, starts_with("i") | "B")
+    assert_frame_equal(selected, df.loc[:, ["idx", "B"]])
+
+
+def test_select_where(df):
+    df["C"] = [1.0, 2.0, 3.0]
+    selected = select(df, where(lambda dtype: dtype.kind == "f"))
+    assert_frame_equal(selected, df.loc[:, ["C"]])
+
+
+@pytest.mark.parametrize("to_select", [["A", "B"], ["idx", "B"], ["B", "idx"]])
+def test_select_no_copy_shares_data(df, to_select):
+    selected = select(df, *to_select, copy=False)
+    assert_frame_equal(selected, df.loc[:, to_select])
+
+    for col in to_select:
+        assert np.shares_memory(selected[col].to_numpy(), df[col].to_numpy())
+
+
+def test_select_copy(df):
+    selected = select(df, "A", "B", copy=True)
+    assert not np.shares_memory(selected["A"].to_numpy(), df["A"].to_numpy())
+
+
+def test_select_no_copy_rename(df):
+    selected = select(df, "idx", b="B", copy=False)
+    assert selected.columns.tolist() == ["idx", "b"]
+    assert df.columns.tolist() == ["idx", "A", "B"]
+
+
+def test_select_no_copy_mixed_dtypes(df):
+    df["C"] = [1.0, 2.0, 3.0]
+    selected = select(df, "B", "C", copy=False)
+
+    for col in ["B", "C"]:
+        assert np.shares_memory(selected[col].to_numpy(), df[col].to_numpy())
@@ -1,8 +1,15 @@
+import warnings
+
+import numpy as np
 import pytest
 from pandas import DataFrame
+from pandas.testing import assert_frame_equal
 
+from tidybear import slice_head
 from tidybear import slice_max
 from tidybear import slice_min
+from tidybear import slice_sample
+from tidybear import slice_tail
 
 
 @pytest.fixture
@@ -36,3 +43,75 @@ def test_slice_min_yes_group(df):
         assert bottom_rows[bottom_rows.A == 2].B.tolist() == list(
             range(2, 2 * n + 1, 2)
         )
+
+
+def test_slice_head_tail_no_group(df):
+    assert_frame_equal(slice_head(df, n=3), df.head(3))
+    assert_frame_equal(slice_tail(df, n=3), df.tail(3))
+    assert_frame_equal(slice_head(df, prop=0.3), df.head(2))
+
+
+def test_slice_head_tail_yes_group(df):
+    grouped = df.assign(A=df.A.where(df.index != 0))
+
+    head = slice_head(grouped, n=2, groupby="A")
+    assert head.A.tolist() == [1, 1, 2, 2]
+    assert head.B.tolist() == [3, 5, 2, 4]
+
+    tail = slice_tail(grouped, prop=0.5, groupby="A")
+    assert tail.A.tolist() == [1, 2, 2]
+    assert tail.B.tolist() == [7, 6, 8]
+
+
+def test_slice_sample(df):
+    sample = slice_sample(df, n=3, seed=0)
+    assert len(sample) == 3 and sample.index.is_unique
+    assert_frame_equal(sample, df.loc[sample.index])
+    assert_frame_equal(sample, slice_sample(df, n=3, seed=0))
+    assert len(slice_sample(df, n=20)) == 8
+
+
+def test_slice_sample_yes_group():
+    rng = np.random.default_rng(0)
+    df = DataFrame({"g": rng.integers(0, 50, 5000), "x": rng.random(5000)})
+
+    sample = slice_sample(df, n=3, groupby="g", seed=1)
+    assert (sample.groupby("g").size() == 3).all()
+    assert sample.g.is_monotonic_increasing
+    assert sample.merge(df, on=["g", "x"]).shape[0] == len(sample)
+
+
+def test_slice_sample_weights(df):
+    weights = [0, 1, 0, 1, 0, 1, 0, 1]
+    sample = slice_sample(df, n=8, weights=weights, seed=0)
+    assert sorted(sample.B) == [2, 4, 6, 8]
+
+    heavy = df.assign(w=[1000] + [1] * 7)
+    firsts = [
+        slice_sample(heavy, n=1, weights="w", seed=s).B.iloc[0] for s in range(20)
+    ]
+    assert firsts.count(1) > 15
+
+    with pytest.raises(ValueError):
+        slice_sample(df, n=1, weights=[-1] * 8)
+
+
+def test_slice_n_or_prop(df):
+    with pytest.raises(ValueError):
+        slice_head(df)
+
+    with pytest.raises(ValueError):
+        slice_sample(df, n=1, prop=0.5)
+
+    for bad in (dict(n=-1), dict(n=1.5), dict(prop=1.5), dict(prop=-0.1)):
+        with pytest.raises(ValueError):
+            slice_tail(df, **bad)
+
+
+def test_slice_categorical_groups(df):
+    df["A"] = df.A.astype("category").cat.add_categories([3])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = slice_head(df, n=1, groupby="A")
+
+    assert result.B.tolist() == [1, 2]
@@ -1,31 +1,116 @@
-from tidybear.groupby import GroupBy
-from tidybear.verbs.count import count
-from tidybear.verbs.join import cross_join
-from tidybear.verbs.join import inner_join
-from tidybear.verbs.join import left_join
-from tidybear.verbs.join import outer_join
-from tidybear.verbs.join import right_join
-from tidybear.verbs.mutate import mutate
-from tidybear.verbs.pivot import pivot_longer
-from tidybear.verbs.pivot import pivot_wider
-from tidybear.verbs.rename import rename
-from tidybear.verbs.select import select
-from tidybear.verbs.slice import slice_max
-from tidybear.verbs.slice import slice_min
+from importlib import import_module
+from typing import Any
+from typing import List
+from typing import TYPE_CHECKING
+
+from tidybear.memory import MemoryBudgetError
+from tidybear.options import options
+from tidybear.profiling import add_hook
+from tidybear.profiling import profile
+from tidybear.profiling import remove_hook
+
+if TYPE_CHECKING:
+    from tidybear.groupby import GroupBy
+    from tidybear.io import scan
+    from tidybear.summary import SummaryState
+    from tidybear.verbs.arrange import arrange
+    from tidybear.verbs.arrange import desc
+    from tidybear.verbs.bind import bind_cols
+    from tidybear.verbs.bind import bind_rows
+    from tidybear.verbs.count import count
+    from tidybear.verbs.distinct import distinct
+    from tidybear.verbs.filter import filter
+    from tidybear.verbs.join import cross_join
+    from tidybear.verbs.join import inner_join
+    from tidybear.verbs.join import left_join
+    from tidybear.verbs.join import outer_join
+    from tidybear.verbs.join import right_join
+    from tidybear.verbs.mutate import mutate
+    from tidybear.verbs.pivot import pivot_longer
+    from tidybear.verbs.pivot import pivot_wider
+    from tidybear.verbs.rename import rename
+    from tidybear.verbs.rename import rename_with
+    from tidybear.verbs.select import select
+    from tidybear.verbs.slice import slice_head
+    from tidybear.verbs.slice import slice_max
+    from tidybear.verbs.slice import slice_min
+    from tidybear.verbs.slice import slice_sample
+    from tidybear.verbs.slice import slice_tail
+
+# The verbs and GroupBy import pandas, so they are only imported when first used.
+# This keeps `import tidybear` and `tidybear.selectors` free of pandas.
+_LAZY = {
+    "GroupBy": "tidybear.groupby",
+    "SummaryState": "tidybear.summary",
+    "arrange": "tidybear.verbs.arrange",
+    "bind_cols": "tidybear.verbs.bind",
+    "bind_rows": "tidybear.verbs.bind",
+    "count": "tidybear.verbs.count",
+    "cross_join": "tidybear.verbs.join",
+    "desc": "tidybear.verbs.arrange",
+    "distinct": "tidybear.verbs.distinct",
+    "filter": "tidybear.verbs.filter",
+    "inner_join": "tidybear.verbs.join",
+    "left_join": "tidybear.verbs.join",
+    "outer_join": "tidybear.verbs.join",
+    "right_join": "tidybear.verbs.join",
+    "mutate": "tidybear.verbs.mutate",
+    "scan": "tidybear.io",
+    "pivot_longer": "tidybear.verbs.pivot",
+    "pivot_wider": "tidybear.verbs.pivot",
+    "rename": "tidybear.verbs.rename",
+    "rename_with": "tidybear.verbs.rename",
+    "select": "tidybear.verbs.select",
+    "slice_head": "tidybear.verbs.slice",
+    "slice_max": "tidybear.verbs.slice",
+    "slice_min": "tidybear.verbs.slice",
+    "slice_sample": "tidybear.verbs.slice",
+    "slice_tail": "tidybear.verbs.slice",
+}
 
 __all__ = (
     "GroupBy",
+    "SummaryState",
+    "arrange",
+    "desc",
+    "bind_rows",
+    "bind_cols",
     "count",
+    "distinct",
+    "filter",
     "mutate",
     "pivot_longer",
     "pivot_wider",
     "rename",
+    "rename_with",
     "slice_max",
     "slice_min",
+    "slice_head",
+    "slice_tail",
+    "slice_sample",
     "select",
     "inner_join",
     "left_join",
     "right_join",
     "outer_join",
     "cross_join",
+    "scan",
+    "profile",
+    "add_hook",
+    "remove_hook",
+    "options",
+    "MemoryBudgetError",
 )
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
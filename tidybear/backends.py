@@ -0,0 +1,474 @@
+"""
+Execution backends
+
+The heavy verbs (count, the joins, slice_min/slice_max and GroupBy stats) can hand
+their work to a multi-threaded engine instead of pandas. Frames are converted through
+Arrow, and the verbs still take and return pandas objects.
+
+Set `tidybear.options.backend` to choose one:
+
+- "pandas": always use pandas (the default)
+- "polars" or "duckdb": use that engine, which must be installed
+- "auto": use polars or duckdb if either is installed, else pandas
+
+A backend only takes the calls it can answer exactly like pandas, anything else
+(e.g. joins on keys with missing values) falls back to pandas. Results have the
+rows, dtypes and index pandas would give.
+
+Examples
+--------
+code ::
+    import tidybear as tb
+
+    tb.options.backend = "polars"
+    counts = tb.count(events, ["user", "event"])
+"""
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from pandas.api.extensions import take
+
+from tidybear.options import options
+
+_AUTO_ORDER = ("polars", "duckdb")
+_AGGREGATES = ("sum", "mean", "median", "min", "max", "var", "std")
+_JOIN_TYPES = {"inner": "inner", "left": "left", "right": "right", "outer": "full"}
+# pd.api.types.infer_dtype of object columns the engines hold without changes
+_UNIFORM_TYPES = ("string", "bytes", "integer", "floating", "boolean", "empty")
+
+# columns holding the row positions sent to the engines
+_LEFT = "__tidybear_left__"
+_RIGHT = "__tidybear_right__"
+_ROW = "__tidybear_row__"
+
+
+class Backend:
+    """Base class of the execution backends.
+
+    Every verb method returns NotImplemented when the backend can not compute the
+    exact pandas result, and the verb then runs on pandas. Joins and slices only
+    return row positions, and the output frame is taken from the pandas inputs,
+    so its dtypes and index are the ones pandas would give.
+    """
+
+    name = "pandas"
+    module = "pandas"
+
+    def count(self, df: pd.DataFrame, columns: List[str], name: str) -> Any:
+        """The count of each combination of columns, ordered by the columns"""
+        return NotImplemented
+
+    def join(
+        self, left: pd.DataFrame, right: pd.DataFrame, how: str, on: List[str]
+    ) -> Any:
+        """The left and right row positions of the joined rows, -1 for no row.
+
+        left and right only hold the key columns, with their row positions in the
+        _LEFT and _RIGHT columns. Rows are ordered like pd.merge orders them.
+        """
+        return NotImplemented
+
+    def slice(
+        self,
+        df: pd.DataFrame,
+        order_by: str,
+        n: int,
+        ascending: bool,
+        groupby: List[str],
+    ) -> Any:
+        """The row positions of the first n rows (of each group) by order_by.
+
+        df only holds the used columns, with the row positions in the _ROW column.
+        """
+        return NotImplemented
+
+    def agg(self, df: pd.DataFrame, groups: List[str], column: str, func: str) -> Any:
+        """The aggregate of each group, indexed by the groups"""
+        return NotImplemented
+
+
+class PolarsBackend(Backend):
+    name = "polars"
+    module = "polars"
+
+    def count(self, df: pd.DataFrame, columns: List[str], name: str) -> Any:
+        pl = import_module("polars")
+
+        counts = _to_polars(df[columns]).drop_nulls().group_by(columns).len(name=name)
+        counts = counts.sort(columns).with_columns(pl.col(name).cast(pl.Int64))
+        return counts.to_pandas()
+
+    def join(
+        self, left: pd.DataFrame, right: pd.DataFrame, how: str, on: List[str]
+    ) -> Any:
+        pl = import_module("polars")
+
+        joined = _to_polars(left).join(
+            _to_polars(right), on=on, how=_JOIN_TYPES[how], coalesce=True
+        )
+        order = _join_order(how, on)
+        joined = joined.sort(order, nulls_last=True).fill_null(-1)
+        return (
+            joined[_LEFT].cast(pl.Int64).to_numpy(),
+            joined[_RIGHT].cast(pl.Int64).to_numpy(),
+        )
+
+    def slice(
+        self,
+        df: pd.DataFrame,
+        order_by: str,
+        n: int,
+        ascending: bool,
+        groupby: List[str],
+    ) -> Any:
+        frame = _to_polars(df).sort(
+            order_by, descending=not ascending, nulls_last=True, maintain_order=True
+        )
+        if groupby:
+            frame = (
+                frame.drop_nulls(groupby)
+                .group_by(groupby, maintain_order=True)
+                .head(n)
+                .sort(groupby, maintain_order=True)
+            )
+        else:
+            frame = frame.head(n)
+
+        return frame[_ROW].to_numpy()
+
+    def agg(self, df: pd.DataFrame, groups: List[str], column: str, func: str) -> Any:
+        pl = import_module("polars")
+
+        frame = _to_polars(df[[*groups, column]]).drop_nulls(groups)
+        result = (
+            frame.group_by(groups)
+            .agg(getattr(pl.col(column), func)())
+            .sort(groups)
+            .to_pandas()
+        )
+        return result.set_index(groups)[column]
+
+
+class DuckDBBackend(Backend):
+    name = "duckdb"
+    module = "duckdb"
+
+    def count(self, df: pd.DataFrame, columns: List[str], name: str) -> Any:
+        keys = ", ".join(map(_quote, columns))
+        return _sql(
+            f"SELECT {keys}, count(*) AS {_quote(name)} FROM df "
+            f"WHERE {_not_null(columns)} GROUP BY ALL ORDER BY {keys}",
+            df=df[columns],
+        )
+
+    def join(
+        self, left: pd.DataFrame, right: pd.DataFrame, how: str, on: List[str]
+    ) -> Any:
+        condition = " AND ".join(f"l.{_quote(c)} = r.{_quote(c)}" for c in on)
+        keys = [f"coalesce(l.{_quote(c)}, r.{_quote(c)})" for c in on]
+        positions = {_LEFT: f"l.{_quote(_LEFT)}", _RIGHT: f"r.{_quote(_RIGHT)}"}
+        order = [
+            positions.get(c, keys[on.index(c)] if c in on else c) + " NULLS LAST"
+            for c in _join_order(how, on)
+        ]
+        joined = _sql(
+            f"SELECT {positions[_LEFT]}, {positions[_RIGHT]} "
+            f"FROM l {_JOIN_TYPES[how].upper()} JOIN r ON {condition} "
+            f"ORDER BY {', '.join(order)}",
+            l=left,
+            r=right,
+        )
+        return (
+            joined[_LEFT].fillna(-1).to_numpy(dtype=np.int64),
+            joined[_RIGHT].fillna(-1).to_numpy(dtype=np.int64),
+        )
+
+    def slice(
+        self,
+        df: pd.DataFrame,
+        order_by: str,
+        n: int,
+        ascending: bool,
+        groupby: List[str],
+    ) -> Any:
+        direction = "ASC" if ascending else "DESC"
+        order = f"{_quote(order_by)} {direction} NULLS LAST, {_quote(_ROW)}"
+        if not groupby:
+            query = f"SELECT {_quote(_ROW)} FROM df ORDER BY {order} LIMIT {int(n)}"
+        else:
+            keys = ", ".join(map(_quote, groupby))
+            query = (
+                f"SELECT {_quote(_ROW)} FROM df WHERE {_not_null(groupby)} "
+                f"QUALIFY row_number() OVER (PARTITION BY {keys} ORDER BY {order}) "
+                f"<= {int(n)} ORDER BY {keys}, {order}"
+            )
+
+        return _sql(query, df=df)[_ROW].to_numpy(dtype=np.int64)
+
+    def agg(self, df: pd.DataFrame, groups: List[str], column: str, func: str) -> Any:
+        sql_func = {"std": "stddev_samp", "var": "var_samp", "mean": "avg"}.get(
+            func, func
+        )
+        value = _quote(column)
+        if df[column].dtype == bool:
+            value = f"CAST({value} AS INTEGER)"
+
+        keys = ", ".join(map(_quote, groups))
+        result = _sql(
+            f"SELECT {keys}, {sql_func}({value}) AS {_quote(column)} "
+            f"FROM df WHERE {_not_null(groups)} GROUP BY ALL ORDER BY {keys}",
+            df=df[[*groups, column]],
+        )
+        if func == "sum":
+            result[column] = result[column].fillna(0)
+
+        return result.set_index(groups)[column]
+
+
+_BACKENDS: Dict[str, Callable[[], Backend]] = {
+    "polars": PolarsBackend,
+    "duckdb": DuckDBBackend,
+}
+_INSTANCES: Dict[str, Backend] = {}
+
+
+def register_backend(name: str, factory: Callable[[], Backend]) -> None:
+    """Make a backend available as `tidybear.options.backend = name`."""
+    _BACKENDS[name] = factory
+    _INSTANCES.pop(name, None)
+
+
+def get_backend() -> Optional[Backend]:
+    """Get the backend chosen by options.backend, None for pandas."""
+    name = options.backend
+    if name == "pandas":
+        return None
+
+    if name == "auto":
+        name = next((n for n in _AUTO_ORDER if _installed(_BACKENDS[n]().module)), "")
+        if not name:
+            return None
+
+    if name not in _INSTANCES:
+        backend = _BACKENDS[name]()
+        if not _installed(backend.module):
+            raise ImportError(
+                f"The {name} backend needs {backend.module}, which is not installed"
+            )
+        _INSTANCES[name] = backend
+
+    return _INSTANCES[name]
+
+
+def dispatch(verb: str, *args: Any) -> Any:
+    """Run a verb on the active backend, or return NotImplemented to use pandas."""
+    backend = get_backend()
+    if backend is None:
+        return NotImplemented
+
+    frames = [arg for arg in args if isinstance(arg, pd.DataFrame)]
+    if not all(_convertible(df) for df in frames):
+        return NotImplemented
+
+    if verb == "count":
+        df, columns, name = args
+        if not _groupable(df, columns) or not _uniform(df, columns):
+            return NotImplemented
+
+        result = backend.count(df, columns, name)
+        if result is NotImplemented:
+            return result
+
+        dtypes = {c: df[c].dtype for c in columns}
+        return result.astype({**dtypes, name: np.int64})
+
+    if verb == "join":
+        left, right, how, on = args
+        if not _joinable(left, right, how, on):
+            return NotImplemented
+
+        positions = backend.join(
+            _positions(left[on], _LEFT), _positions(right[on], _RIGHT), how, on
+        )
+        if positions is NotImplemented:
+            return positions
+
+        return _join_frame(left, right, on, *positions)
+
+    if verb == "slice":
+        df, order_by, n, ascending, groupby = args
+        columns = list(dict.fromkeys([order_by, *groupby]))
+        if not _groupable(df, columns) or not _uniform(df, columns):
+            return NotImplemented
+
+        used = df[columns]
+        rows = backend.slice(_positions(used, _ROW), order_by, n, ascending, groupby)
+        if rows is NotImplemented:
+            return rows
+
+        result = df.iloc[rows]
+        return result.reset_index(drop=True) if groupby else result
+
+    if verb == "agg":
+        df, groups, column, func = args
+        if (
+            func not in _AGGREGATES
+            or not _groupable(df, groups)
+            or not _uniform(df, [*groups, column])
+        ):
+            return NotImplemented
+
+        result = backend.agg(df, groups, column, func)
+        if result is NotImplemented:
+            return result
+
+        # the dtype pandas gives, e.g. int64 for the sum of a bool column
+        empty = df[[*groups, column]].iloc[:0].groupby(groups)[column].agg(func)
+        return result.astype(empty.dtype)
+
+    return getattr(backend, verb)(*args)
+
+
+def _installed(module: str) -> bool:
+    try:
+        import_module(module)
+    except ImportError:
+        return False
+
+    return True
+
+
+def _convertible(df: pd.DataFrame) -> bool:
+    """Only frames with unique string column names convert to the engines."""
+    return df.columns.is_unique and all(isinstance(c, str) for c in df.columns)
+
+
+def _groupable(df: pd.DataFrame, groups: List[str]) -> bool:
+    """pandas keeps unobserved categories as groups, the engines do not."""
+    return not any(isinstance(df[c].dtype, pd.CategoricalDtype) for c in groups)
+
+
+def _uniform(df: pd.DataFrame, columns: List[str]) -> bool:
+    """Object columns only convert to the engines when their values share one type.
+
+    Arrow can not hold mixed values, polars then fails and duckdb turns them into
+    strings, while pandas keeps every value as it is.
+    """
+    return all(
+        df[c].dtype != object
+        or pd.api.types.infer_dtype(df[c], skipna=True) in _UNIFORM_TYPES
+        for c in dict.fromkeys(columns)
+    )
+
+
+def _joinable(left: pd.DataFrame, right: pd.DataFrame, how: str, on: List[str]) -> bool:
+    """pandas matches missing keys to each other, the engines do not."""
+    return (
+        bool(on)
+        and how in _JOIN_TYPES
+        and all(left[c].dtype == right[c].dtype for c in on)
+        and not left[on].isna().any().any()
+        and not right[on].isna().any().any()
+        and _uniform(left, on)
+        and _uniform(right, on)
+    )
+
+
+def _positions(df: pd.DataFrame, name: str) -> pd.DataFrame:
+    """The columns of df, and the position of every row as the column name"""
+    return df.assign(**{name: np.arange(len(df), dtype=np.int64)})
+
+
+def _join_order(how: str, on: List[str]) -> List[str]:
+    """The columns pd.merge orders the joined rows by."""
+    if how == "right":
+        return [_RIGHT, _LEFT]
+
+    if how == "outer":
+        return [*on, _LEFT, _RIGHT]
+
+    return [_LEFT, _RIGHT]
+
+
+def _join_frame(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    on: List[str],
+    left_rows: npt.NDArray[np.int64],
+    right_rows: npt.NDArray[np.int64],
+) -> pd.DataFrame:
+    """The joined frame from the row positions of both sides, like pd.merge.
+
+    Columns of a side without a row are taken with missing values, so integers
+    become floats and booleans objects, as in pandas.
+    """
+    left, right = _suffix_overlap(left, right, on)
+
+    columns: Dict[Any, Any] = {}
+    for name, column in left.items():
+        columns[name] = _take(column, left_rows)
+
+    # keys of rows only in the right come from the right
+    missing = left_rows < 0
+    for name in on:
+        keys = pd.concat([left[name], right[name]], ignore_index=True).array
+        columns[name] = keys.take(np.where(missing, len(left) + right_rows, left_rows))
+
+    for name, column in right.drop(columns=on).items():
+        columns[name] = _take(column, right_rows)
+
+    return pd.DataFrame(columns)
+
+
+def _take(column: pd.Series, rows: npt.NDArray[np.int64]) -> Any:
+    values = column.to_numpy() if isinstance(column.dtype, np.dtype) else column.array
+    return take(values, rows, allow_fill=True)
+
+
+def _suffix_overlap(
+    left: pd.DataFrame, right: pd.DataFrame, on: List[str]
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Rename columns on both sides that are not keys like pd.merge, with _x and _y"""
+    overlap = [c for c in left.columns if c in set(right.columns) and c not in on]
+    if not overlap:
+        return left, right
+
+    return (
+        left.rename(columns={c: f"{c}_x" for c in overlap}),
+        right.rename(columns={c: f"{c}_y" for c in overlap}),
+    )
+
+
+def _to_polars(df: pd.DataFrame) -> Any:
+    pl = import_module("polars")
+    return pl.from_pandas(df, include_index=False)
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _not_null(columns: List[str]) -> str:
+    return " AND ".join(f"{_quote(c)} IS NOT NULL" for c in columns)
+
+
+def _sql(query: str, **frames: pd.DataFrame) -> pd.DataFrame:
+    duckdb = import_module("duckdb")
+
+    connection = duckdb.connect()
+    try:
+        for name, frame in frames.items():
+            connection.register(name, frame)
+        return connection.execute(query).df()
+    finally:
+        connection.close()
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
+from typing import Callable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
+from tidybear.backends import dispatch
+from tidybear.io import is_source
+from tidybear.io import read_source
+from tidybear.io import Source
+from tidybear.profiling import instrument
 from tidybear.selectors import _ColumnList
+from tidybear.summary import _from_codes
+from tidybear.summary import SummaryState
 from tidybear.utils import get_column_names
 
 
@@ -33,6 +49,8 @@ class GroupBy:
     size : get group sizes
     get : get the grouped column by name
     summarise or summarize : cocatenate all active stats into a single dataframe.
+    mutate : attach all active window stats (cumsum, rank, lag, ...) to the dataframe.
+    asummarise or asummarize : summarise without blocking the event loop.
 
     Examples
     ----------
@@ -55,27 +73,59 @@ class GroupBy:
     ```
     """
 
-    def __init__(self, df: pd.DataFrame, groups: _ColumnList) -> None:
+    def __init__(
+        self,
+        df: Union[pd.DataFrame, Source],
+        groups: _ColumnList,
+        columns: Optional[_ColumnList] = None,
+        lazy: bool = False,
+    ) -> None:
         """Creates an active grouping that can track and summarise provided Stats.
         Must be used within a with statement.
 
         Parameters
         ----------
-        df : DataFrame
-            The dataframe to group.
+        df : DataFrame, path or Scan
+            The dataframe to group, or a file to read it from.
         groups : str, List[str]
             Used to determine the groups for the groupby
+        columns : str, List[str] or selector, optional
+            When df is a file, read only the groups and these columns,
+            by default None which reads every column
+        lazy : bool, optional
+            Only register stats (which then return None), and compute them all in
+            `summarise`, where `n_threads` runs them concurrently, by default False
         """
-        self.__groups = get_column_names(df.columns, groups)
-        self.__groupby_obj = df.groupby(self.__groups)
+        frame: pd.DataFrame
+        if is_source(df):
+            frame, (groups, _) = read_source(df, groups, columns)
+        else:
+            frame = df
+
+        self.__groups = get_column_names(frame, groups)
+        self.__groupby_obj = frame.groupby(self.__groups)
+        self.__codes: Optional[npt.NDArray[np.int64]] = None
 
-        self.__stats: List[pd.Series] = []
+        self.__lazy = lazy
+        self.__stats: List[Union[pd.Series, _Deferred]] = []
+        self.__windows: List[pd.Series] = []
 
     def __enter__(self) -> GroupBy:
         return self
 
     def __exit__(self, *args: Any) -> None:
         self.__stats = []
+        self.__windows = []
+
+    @property
+    def obj(self) -> pd.DataFrame:
+        """Get the dataframe that was grouped
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+        return self.__groupby_obj.obj
 
     @property
     def groups(self) -> List[str]:
@@ -102,27 +152,66 @@ class GroupBy:
         """
         return self.__groupby_obj[column]
 
-    def summarise(self) -> pd.DataFrame:
-        """Concatenate all active stats into a single dataframe.
-        It will naturally join on the grouped columns.
+    def _group_codes(self) -> npt.NDArray[np.int64]:
+        """Get the position of every row's group in `_group_index`, -1 for rows
+        that are in no group (a missing key).
 
-        ```
-        return pd.concat(active_stats, axis=1)
-        ```
+        The positions are looked up in the summary index rather than taken from
+        `ngroup`, which numbers only the observed groups of categorical keys.
+        """
+        if self.__codes is None:
+            index = self._group_index()
+            keys = self.obj[self.__groups]
+            if isinstance(index, pd.MultiIndex):
+                rows = pd.MultiIndex.from_frame(keys)
+            else:
+                rows = keys.iloc[:, 0]
+            self.__codes = index.get_indexer(rows).astype(np.int64, copy=False)
+
+        return self.__codes
+
+    def _group_index(self) -> pd.Index:
+        """Get the index of the summary, one entry per group number."""
+        return self.__groupby_obj.size().index
+
+    @instrument
+    def summarise(self, n_threads: Optional[int] = None) -> pd.DataFrame:
+        """Combine all active stats into a single dataframe, one row per group.
+
+        Stats that share the group index are placed side by side without
+        aligning them, anything else is joined on the grouped columns with
+        `pd.concat(active_stats, axis=1)`.
+
+        Parameters
+        ----------
+        n_threads : int, optional
+            Compute the stats of a lazy GroupBy in this many threads. pandas
+            releases the GIL in most groupby kernels, so independent stats run
+            concurrently, by default None which computes them one by one
 
         Returns
         -------
         pd.DataFrame
             Final summary of all stats
         """
-        return pd.concat(self.__stats, axis=1)
+        return _assemble(self.__resolve(n_threads), self._group_index())
 
-    def summarize(self) -> pd.DataFrame:
-        """Concatenate all active stats into a single dataframe.
-        It will naturally join on the grouped columns.
+    @instrument
+    def summarize(self, n_threads: Optional[int] = None) -> pd.DataFrame:
+        """Combine all active stats into a single dataframe, see `summarise`.
+
+        Returns
+        -------
+        pd.DataFrame
+            Final summary of all stats
+        """
+        return self.summarise(n_threads)
+
+    async def asummarise(self, n_threads: Optional[int] = None) -> pd.DataFrame:
+        """Summarise in a worker thread, so the event loop keeps running.
 
         ```
-        return pd.concat(active_stats, axis=1)
+        summary = await g.asummarise(n_threads=4)
         ```
 
         Returns
@@ -130,20 +219,62 @@ class GroupBy:
         pd.DataFrame
             Final summary of all stats
         """
-        return self.summarise()
-
-    def __add_stat(self, name: str, series: pd.Series) -> pd.Series:
-        self.__stats.append(series.rename(name))
-        return series.rename(name)
-
-    def stat(self, name: str, series: pd.Series) -> pd.Series:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.summarise, n_threads)
+
+    async def asummarize(self, n_threads: Optional[int] = None) -> pd.DataFrame:
+        """Summarise in a worker thread, see `asummarise`."""
+        return await self.asummarise(n_threads)
+
+    def __resolve(self, n_threads: Optional[int]) -> List[pd.Series]:
+        """Compute the deferred stats, and keep them in place of their definitions"""
+        deferred = [stat for stat in self.__stats if callable(stat)]
+        if not deferred:
+            return list(self.__stats)
+
+        if n_threads is None or n_threads <= 1 or len(deferred) == 1:
+            results = [compute() for compute in deferred]
+        else:
+            # build the grouping once, before the threads share it
+            self._group_codes()
+            with ThreadPoolExecutor(n_threads) as pool:
+                results = list(pool.map(lambda compute: compute(), deferred))
+
+        computed = iter(results)
+        self.__stats = [
+            series
+            for stat in self.__stats
+            for series in (next(computed) if callable(stat) else [stat])
+        ]
+        return list(self.__stats)
+
+    def __add_stats(self, compute: _Deferred) -> Optional[List[pd.Series]]:
+        """Compute stats now, or only register them on a lazy GroupBy"""
+        if self.__lazy:
+            self.__stats.append(compute)
+            return None
+
+        stats = compute()
+        self.__stats.extend(stats)
+        return stats
+
+    def __add_stat(
+        self, name: str, stat: Union[pd.Series, Callable[[], pd.Series]]
+    ) -> Optional[pd.Series]:
+        compute = stat if callable(stat) else lambda: stat
+        stats = self.__add_stats(lambda: [compute().rename(name)])
+        return None if stats is None else stats[0]
+
+    def stat(self, name: str, series: pd.Series) -> Optional[pd.Series]:
         return self.__add_stat(name, series)
 
-    def n(self, name: Optional[str] = None) -> pd.Series:
+    @instrument
+    def n(self, name: Optional[str] = None) -> Optional[pd.Series]:
         """Compute group sizes."""
         name = "n" if not name else name
-        return self.__add_stat(name, self.__groupby_obj.size())
+        return self.__add_stat(name, self.__groupby_obj.size)
 
+    @instrument
     def agg(
         self,
         column: str,
@@ -151,7 +282,8 @@ class GroupBy:
         decimals: Optional[int] = None,
         name: Optional[str] = None,
         name_prefix: Optional[str] = None,
-    ) -> pd.Series:
+        dtype: Optional[Any] = None,
+    ) -> Optional[pd.Series]:
         """Aggregate one or more columns using one or more operations.
 
         Parameters
@@ -169,6 +301,13 @@ class GroupBy:
         name_prefix: str, optional
             If passing multiple columns to agg with a custom function you can pass
             name_prefix to help name the summary columns
+        dtype : dtype or "compact", optional
+            Cast the result to this dtype, by default None. Casting to a smaller
+            integer raises an OverflowError if a value does not fit. "compact"
+            picks the smallest integer dtype that fits, or float32 for floats
+            within its range, and keeps other dtypes (e.g. bool or object
+            results). Rounding and casting are applied in place to the
+            aggregated values.
         temp : bool, optional, by default False
             If False, the Stat is appended to the GroupBy.
             If True, no Stat is appended, and instead the renamed series
@@ -181,13 +320,13 @@ class GroupBy:
 
         if isinstance(func, list):
             for f in func:
-                self.agg(column, f, decimals=decimals)
-            return
+                self.agg(column, f, decimals=decimals, dtype=dtype)
+            return None
 
         if isinstance(column, list):
             for c in column:
-                self.agg(c, func, decimals=decimals)
-            return
+                self.agg(c, func, decimals=decimals, dtype=dtype)
+            return None
 
         if not name:
             if isinstance(func, str):
@@ -197,47 +336,488 @@ class GroupBy:
             else:
                 name = column
 
-        agg = self.get(column).agg(func)
+        def compute() -> pd.Series:
+            if func in ("var", "std") and _is_narrow_float(self.obj[column]):
+                agg = self.__precise_var(column, sqrt=func == "std")
+            elif func == "n_distinct":
+                agg = self.get(column).nunique(dropna=False)
+            else:
+                agg = dispatch("agg", self.obj, self.groups, column, func)
+                if agg is NotImplemented:
+                    agg = self.get(column).agg(func)
 
-        if decimals is not None:
-            agg = agg.round(decimals)
+            if decimals is not None or dtype is not None:
+                agg = _round_and_cast(agg, decimals, dtype)
 
-        return self.__add_stat(name, agg)
+            return agg
 
-    def n_distinct(self, column: str, **kwargs: Any) -> pd.Series:
-        """Compute number of unique values in group."""
-        if "name_prefix" not in kwargs:
-            kwargs["name_prefix"] = "n_distinct"
+        return self.__add_stat(name, compute)
 
-        return self.agg(column, lambda x: len(x.unique()), **kwargs)
+    def __precise_var(self, column: str, sqrt: bool) -> pd.Series:
+        """Group variance of a float16/float32 column, accumulated in float64.
 
-    def sum(self, column: str, **kwargs: Any) -> pd.Series:
+        Uses two passes (mean, then squared deviations) over row chunks, so only
+        one chunk is ever upcast to float64. The result keeps the column's dtype,
+        including nullable and Arrow-backed ones.
+        """
+        dtype = self.obj[column].dtype
+        values = self.obj[column].to_numpy(
+            dtype=getattr(dtype, "numpy_dtype", dtype), na_value=np.nan
+        )
+        codes = self._group_codes()
+        n_groups = len(self._group_index())
+
+        counts = np.zeros(n_groups)
+        sums = np.zeros(n_groups)
+        for chunk_codes, chunk in _valid_chunks(codes, values):
+            counts += np.bincount(chunk_codes, minlength=n_groups)
+            sums += np.bincount(chunk_codes, weights=chunk, minlength=n_groups)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = sums / counts
+
+        squares = np.zeros(n_groups)
+        for chunk_codes, chunk in _valid_chunks(codes, values):
+            deviations = chunk - means[chunk_codes]
+            squares += np.bincount(
+                chunk_codes, weights=deviations * deviations, minlength=n_groups
+            )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            var = np.where(counts > 1, squares / (counts - 1), np.nan)
+
+        if sqrt:
+            var = np.sqrt(var)
+
+        result = pd.Series(var.astype(values.dtype), index=self._group_index())
+        return result if isinstance(dtype, np.dtype) else result.astype(dtype)
+
+    @instrument
+    def n_distinct(self, column: str, **kwargs: Any) -> Optional[pd.Series]:
+        """Compute number of unique values in group, counting missing as a value."""
+        if "name_prefix" in kwargs and not kwargs.get("name"):
+            kwargs["name"] = f"{kwargs.pop('name_prefix')}_{column}"
+
+        return self.agg(column, "n_distinct", **kwargs)
+
+    @instrument
+    def sum(self, column: str, **kwargs: Any) -> Optional[pd.Series]:
         """Compute sum of group values."""
         return self.agg(column, "sum", **kwargs)
 
-    def mean(self, column: str, **kwargs: Any) -> pd.Series:
+    @instrument
+    def mean(self, column: str, **kwargs: Any) -> Optional[pd.Series]:
         """Compute mean of group values."""
         return self.agg(column, "mean", **kwargs)
 
-    def median(self, column: str, **kwargs: Any) -> pd.Series:
+    @instrument
+    def median(self, column: str, **kwargs: Any) -> Optional[pd.Series]:
         """Compute median of group values."""
         return self.agg(column, "median", **kwargs)
 
-    def max(self, column: str, **kwargs: Any) -> pd.Series:
+    @instrument
+    def max(self, column: str, **kwargs: Any) -> Optional[pd.Series]:
         """Compute max of group values."""
         return self.agg(column, "max", **kwargs)
 
-    def min(self, column: str, **kwargs: Any) -> pd.Series:
+    @instrument
+    def min(self, column: str, **kwargs: Any) -> Optional[pd.Series]:
         """Compute min of group values."""
         return self.agg(column, "min", **kwargs)
 
-    def var(self, column: str, **kwargs: Any) -> pd.Series:
+    @instrument
+    def var(self, column: str, **kwargs: Any) -> Optional[pd.Series]:
         """Compute variance of group values."""
         return self.agg(column, "var", **kwargs)
 
-    def std(self, column: str, **kwargs: Any) -> pd.Series:
+    @instrument
+    def std(self, column: str, **kwargs: Any) -> Optional[pd.Series]:
         """Compute standard deviation of group values."""
         return self.agg(column, "std", **kwargs)
 
+    @instrument
+    def quantile(
+        self,
+        column: str,
+        q: Union[float, Sequence[float]] = 0.5,
+        approx: bool = False,
+        max_samples: int = 10_000,
+        random_state: Optional[int] = None,
+        decimals: Optional[int] = None,
+        dtype: Optional[Any] = None,
+    ) -> Union[pd.Series, pd.DataFrame, None]:
+        """Compute one or more quantiles of group values.
+
+        All quantiles are read from a single sort of the column by group, with
+        linear interpolation like pd.Series.quantile. Each quantile is added as
+        its own stat, named like "q90_{column}".
+
+        Parameters
+        ----------
+        column : str
+            Name of the numeric column
+        q : float or list of floats, optional
+            Quantiles to compute, between 0 and 1, by default 0.5
+        approx : bool, optional
+            Estimate the quantiles from a random sample of at most about
+            `max_samples` rows per group, by default False. Only the sample is
+            sorted, which is much faster for very large groups.
+        max_samples : int, optional
+            Expected sample size per group when approx=True, by default 10_000
+        random_state : int, optional
+            Seed for the approx sample, by default None
+        decimals, dtype : optional
+            Round and cast the results, see `agg`
+
+        Returns
+        -------
+        pd.Series, pd.DataFrame or None
+            A Series for a single quantile, else one column per quantile. None on
+            a lazy GroupBy.
+        """
+        quantiles = [q] if isinstance(q, (int, float)) else list(q)
+        if any(not 0 <= p <= 1 for p in quantiles):
+            raise ValueError(f"Quantiles must be between 0 and 1, got {q}")
+
+        stats = self.__add_stats(
+            lambda: self.__quantiles(
+                column, quantiles, approx, max_samples, random_state, decimals, dtype
+            )
+        )
+        if stats is None:
+            return None
+
+        return stats[0] if isinstance(q, (int, float)) else pd.concat(stats, axis=1)
+
+    def __quantiles(
+        self,
+        column: str,
+        quantiles: List[float],
+        approx: bool,
+        max_samples: int,
+        random_state: Optional[int],
+        decimals: Optional[int],
+        dtype: Optional[Any],
+    ) -> List[pd.Series]:
+        """The quantile stats of a column, from one sort by group and value."""
+        values = self.obj[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        codes = self._group_codes()
+        index = self._group_index()
+        keep = (codes >= 0) & ~np.isnan(values)
+
+        if approx:
+            rng = np.random.default_rng(random_state)
+            sizes = np.bincount(codes[keep], minlength=len(index))
+            rates = np.minimum(1.0, max_samples / np.maximum(sizes, 1))
+            keep[keep] = rng.random(keep.sum()) < rates[codes[keep]]
+
+        results = _sorted_quantiles(codes[keep], values[keep], len(index), quantiles)
+
+        stats = []
+        for p, result in zip(quantiles, results):
+            stat = pd.Series(result, index=index)
+            if isinstance(self.obj[column].dtype, pd.ArrowDtype):
+                stat = stat.astype("double[pyarrow]")
+            if decimals is not None or dtype is not None:
+                stat = _round_and_cast(stat, decimals, dtype)
+
+            stats.append(stat.rename(f"q{p * 100:g}_{column}"))
+
+        return stats
+
+    @instrument
+    def summary_state(
+        self,
+        columns: Optional[_ColumnList] = None,
+        distinct: Optional[_ColumnList] = None,
+        precision: int = 10,
+    ) -> SummaryState:
+        """Get a mergeable summary that can be updated with new rows later.
+
+        Parameters
+        ----------
+        columns : str, list or selector, optional
+            Numeric columns to keep count, sum, mean, var, std, min and max of,
+            by default None
+        distinct : str, list or selector, optional
+            Columns to estimate the number of distinct values of with a
+            HyperLogLog sketch, by default None
+        precision : int, optional
+            HyperLogLog precision, between 4 and 16, by default 10
+
+        Returns
+        -------
+        SummaryState
+        """
+        return _from_codes(
+            self.obj,
+            self.groups,
+            self._group_codes(),
+            self._group_index(),
+            columns,
+            distinct,
+            precision,
+        )
+
+    @instrument
+    def mutate(self) -> pd.DataFrame:
+        """Attach all active window stats to the grouped dataframe as new columns.
+
+        Returns
+        -------
+        pd.DataFrame
+            The grouped dataframe with one new column per window stat
+        """
+        return pd.concat([self.obj, *self.__windows], axis=1)
+
+    def __add_window(self, name: str, series: pd.Series) -> pd.Series:
+        series = series.rename(name)
+        self.__windows.append(series)
+        return series
+
+    @instrument
+    def cumsum(self, column: str, name: Optional[str] = None) -> pd.Series:
+        """Compute running sum of values within each group."""
+        return self.__add_window(name or f"cumsum_{column}", self.get(column).cumsum())
+
+    @instrument
+    def cumprod(self, column: str, name: Optional[str] = None) -> pd.Series:
+        """Compute running product of values within each group."""
+        series = self.get(column).cumprod()
+        return self.__add_window(name or f"cumprod_{column}", series)
+
+    @instrument
+    def cummax(self, column: str, name: Optional[str] = None) -> pd.Series:
+        """Compute running max of values within each group."""
+        return self.__add_window(name or f"cummax_{column}", self.get(column).cummax())
+
+    @instrument
+    def cummin(self, column: str, name: Optional[str] = None) -> pd.Series:
+        """Compute running min of values within each group."""
+        return self.__add_window(name or f"cummin_{column}", self.get(column).cummin())
+
+    @instrument
+    def rank(
+        self,
+        column: str,
+        method: str = "average",
+        ascending: bool = True,
+        pct: bool = False,
+        name: Optional[str] = None,
+    ) -> pd.Series:
+        """Rank values within each group. See pd.Series.rank for the options."""
+        series = self.get(column).rank(method=method, ascending=ascending, pct=pct)
+        return self.__add_window(name or f"rank_{column}", series)
+
+    @instrument
+    def lag(
+        self,
+        column: str,
+        n: int = 1,
+        fill_value: Optional[Any] = None,
+        name: Optional[str] = None,
+    ) -> pd.Series:
+        """Get the value n rows earlier in the same group."""
+        series = self.get(column).shift(n, fill_value=fill_value)
+        return self.__add_window(name or f"lag_{column}", series)
+
+    @instrument
+    def lead(
+        self,
+        column: str,
+        n: int = 1,
+        fill_value: Optional[Any] = None,
+        name: Optional[str] = None,
+    ) -> pd.Series:
+        """Get the value n rows later in the same group."""
+        series = self.get(column).shift(-n, fill_value=fill_value)
+        return self.__add_window(name or f"lead_{column}", series)
+
+    @instrument
+    def rolling_sum(
+        self,
+        column: str,
+        window: int,
+        min_periods: Optional[int] = None,
+        name: Optional[str] = None,
+    ) -> pd.Series:
+        """Compute sum of the last `window` values within each group.
+
+        Like pd.Series.rolling, the result is NaN where fewer than min_periods
+        (by default `window`) non-missing values are in the window.
+        """
+        sums = self.__rolling(column, window, min_periods, "sum")
+        return self.__add_window(name or f"rolling_sum_{column}", sums)
+
+    @instrument
+    def rolling_mean(
+        self,
+        column: str,
+        window: int,
+        min_periods: Optional[int] = None,
+        name: Optional[str] = None,
+    ) -> pd.Series:
+        """Compute mean of the last `window` values within each group.
+
+        Like pd.Series.rolling, the result is NaN where fewer than min_periods
+        (by default `window`) non-missing values are in the window.
+        """
+        means = self.__rolling(column, window, min_periods, "mean")
+        return self.__add_window(name or f"rolling_mean_{column}", means)
+
+    def __rolling(
+        self, column: str, window: int, min_periods: Optional[int], func: str
+    ) -> pd.Series:
+        """Rolling sum or mean of the last `window` values within each group.
+
+        Uses the grouped rolling kernels of pandas, which keep a compensated
+        running sum, and puts the results back in row order by position.
+        """
+        if window < 1:
+            raise ValueError(f"window must be a positive integer, got {window}")
+
+        codes = self._group_codes()
+        values = self.obj[column]
+
+        rolling = (
+            values.reset_index(drop=True)
+            .groupby(codes)
+            .rolling(window, min_periods=min_periods)
+        )
+        result = getattr(rolling, func)()
+
+        # the result is ordered by group, its last index level is the row position
+        ordered = np.empty(len(values), dtype=np.float64)
+        ordered[result.index.get_level_values(-1)] = result.to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        series = pd.Series(ordered, index=values.index).where(codes >= 0)
+        if isinstance(values.dtype, pd.ArrowDtype):
+            series = series.astype("double[pyarrow]")
+
+        return series
+
     def __str__(self) -> str:
         return f"GroupBy({self.groups})"
+
+
+_CHUNK_ROWS = 1 << 20
+
+# a stat registered on a lazy GroupBy, computed by summarise
+_Deferred = Callable[[], List[pd.Series]]
+
+
+def _assemble(stats: List[pd.Series], index: pd.Index) -> pd.DataFrame:
+    """Put the stats side by side, as the columns of a dataframe"""
+    names = [stat.name for stat in stats]
+    if (
+        stats
+        and len(set(names)) == len(names)
+        and all(stat.index.equals(index) for stat in stats)
+    ):
+        # every stat is already aligned on the groups, nothing to join. The
+        # stats are copied, so the summary does not share memory with the Series
+        # returned by the stat methods.
+        data = {stat.name: stat.array for stat in stats}
+        return pd.DataFrame(data, index=index, copy=True)
+
+    return pd.concat(stats, axis=1)
+
+
+def _is_narrow_float(series: pd.Series) -> bool:
+    return series.dtype.kind == "f" and series.dtype.itemsize < 8
+
+
+def _valid_chunks(
+    codes: npt.NDArray[np.int64], values: npt.NDArray[Any]
+) -> Iterator[Tuple[npt.NDArray[np.int64], npt.NDArray[np.float64]]]:
+    """Yield (codes, float64 values) for row chunks, skipping NaNs and ungrouped rows"""
+    for start in range(0, len(values), _CHUNK_ROWS):
+        stop = start + _CHUNK_ROWS
+        chunk_codes = codes[start:stop]
+        chunk = values[start:stop].astype(np.float64)
+        keep = (chunk_codes >= 0) & ~np.isnan(chunk)
+        yield chunk_codes[keep], chunk[keep]
+
+
+def _sorted_quantiles(
+    codes: npt.NDArray[np.int64],
+    values: npt.NDArray[np.float64],
+    n_groups: int,
+    quantiles: List[float],
+) -> List[npt.NDArray[np.float64]]:
+    """Interpolated quantiles of each group from one sort by (group, value)."""
+    order = np.lexsort((values, codes))
+    ordered = values[order]
+
+    counts = np.bincount(codes, minlength=n_groups)
+    starts = np.cumsum(counts) - counts
+    last = np.maximum(counts - 1, 0)
+
+    results = []
+    for p in quantiles:
+        position = p * last
+        lower = np.floor(position).astype(np.int64)
+        upper = np.minimum(lower + 1, last)
+        fraction = position - lower
+
+        if len(ordered):
+            low = ordered[np.minimum(starts + lower, len(ordered) - 1)]
+            high = ordered[np.minimum(starts + upper, len(ordered) - 1)]
+            result = low + (high - low) * fraction
+        else:
+            result = np.zeros(n_groups)
+
+        results.append(np.where(counts > 0, result, np.nan))
+
+    return results
+
+
+def _round_and_cast(
+    agg: pd.Series, decimals: Optional[int], dtype: Optional[Any]
+) -> pd.Series:
+    """Round and cast an aggregated series, reusing its buffer where possible."""
+    values = agg.to_numpy()
+    if not isinstance(agg.dtype, np.dtype) or values.dtype.kind not in "iuf":
+        if decimals is not None:
+            agg = agg.round(decimals)
+        # "compact" only shrinks numpy numbers, other dtypes are kept
+        return agg if dtype is None or dtype == "compact" else agg.astype(dtype)
+
+    if decimals is not None and values.dtype.kind == "f":
+        if not values.flags.writeable:
+            values = values.copy()
+        np.round(values, decimals, out=values)
+
+    if dtype is not None:
+        target = _compact_dtype(values) if dtype == "compact" else np.dtype(dtype)
+        if target.kind in "iu" and values.size > 0:
+            if values.dtype.kind == "f" and np.isnan(values).any():
+                raise ValueError(f"Cannot cast {agg.name} to {target}, it has NaNs")
+
+            info = np.iinfo(target)
+            if values.min() < info.min or values.max() > info.max:
+                raise OverflowError(f"Values of {agg.name} do not fit in {target}")
+
+        values = values.astype(target, copy=False)
+
+    return pd.Series(values, index=agg.index, name=agg.name)
+
+
+def _compact_dtype(values: npt.NDArray[Any]) -> np.dtype[Any]:
+    if values.dtype.kind == "f":
+        # floats beyond the float32 range would become inf, they keep their dtype
+        limits = np.finfo(np.float32)
+        finite = values[np.isfinite(values)]
+        if finite.size == 0 or (
+            finite.min() >= limits.min and finite.max() <= limits.max
+        ):
+            return np.dtype(np.float32)
+        return values.dtype
+
+    for candidate in (np.int8, np.int16, np.int32):
+        info = np.iinfo(candidate)
+        if values.size == 0 or (values.min() >= info.min and values.max() <= info.max):
+            return np.dtype(candidate)
+
+    return np.dtype(np.int64)
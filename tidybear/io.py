@@ -0,0 +1,194 @@
+"""
+File sources
+
+`count`, `select` and `GroupBy` accept a parquet, feather or CSV path (or a `scan()` of
+one) in place of a dataframe. Selectors are resolved against the file schema and only
+the columns the verb uses are read. Filters given to `scan()` are pushed down into the
+reader, so parquet row groups whose statistics rule them out are skipped.
+
+Reading files needs pyarrow.
+
+Examples
+--------
+code ::
+    import tidybear as tb
+
+    tb.count("events.parquet", ["country", "device"])
+
+    events = tb.scan("events/", filters=[("year", ">=", 2022)])
+    with tb.GroupBy(events, "country", columns=["revenue"]) as g:
+        g.sum("revenue")
+        summary = g.summarise()
+"""
+from __future__ import annotations
+
+import os
+from importlib import import_module
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import pandas as pd
+
+from tidybear.selectors import _ColumnList
+from tidybear.utils import get_column_names
+
+_FORMATS = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "feather",
+    ".arrow": "feather",
+    ".ipc": "feather",
+    ".csv": "csv",
+}
+
+
+class Scan:
+    """A parquet, feather or CSV file (or directory of files) read on demand.
+
+    Parameters
+    ----------
+    source : str, path or pyarrow.dataset.Dataset
+        The file or directory to read
+    format : str, optional
+        "parquet", "feather" or "csv", by default guessed from the file extension,
+        and "parquet" for directories
+    filters : list of tuples or pyarrow expression, optional
+        Rows to keep, in the DNF form of `pd.read_parquet`,
+        e.g. [("year", ">=", 2022), ("country", "in", ["DE", "FR"])]
+    """
+
+    def __init__(
+        self, source: Any, format: Optional[str] = None, filters: Optional[Any] = None
+    ) -> None:
+        self.source = source
+        self.format = format
+        self.filters = filters
+        self._dataset: Any = None
+        self._schema_frame: Optional[pd.DataFrame] = None
+
+    @property
+    def dataset(self) -> Any:
+        if self._dataset is None:
+            ds = _import_pyarrow("pyarrow.dataset")
+            if isinstance(self.source, ds.Dataset):
+                self._dataset = self.source
+            else:
+                self._dataset = ds.dataset(
+                    self.source, format=self.format or _guess_format(self.source)
+                )
+
+        return self._dataset
+
+    @property
+    def schema_frame(self) -> pd.DataFrame:
+        """An empty dataframe with the columns and dtypes of the file"""
+        if self._schema_frame is None:
+            self._schema_frame = self.dataset.schema.empty_table().to_pandas()
+
+        return self._schema_frame
+
+    @property
+    def columns(self) -> pd.Index:
+        return self.schema_frame.columns
+
+    def read(self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Read the rows that pass the filters, and only the given columns.
+
+        Parameters
+        ----------
+        columns : list of str, optional
+            Columns to read, by default all of them
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+        if columns is not None:
+            columns = list(dict.fromkeys(columns))
+
+        table = self.dataset.to_table(columns=columns, filter=_expression(self.filters))
+        return table.to_pandas()
+
+    def __repr__(self) -> str:
+        return f"Scan({self.source!r}, filters={self.filters!r})"
+
+
+def scan(
+    source: Any, format: Optional[str] = None, filters: Optional[Any] = None
+) -> Scan:
+    """Point a verb at a file instead of a dataframe, see `Scan`.
+
+    Returns
+    -------
+    Scan
+    """
+    return Scan(source, format=format, filters=filters)
+
+
+Source = Union[str, "os.PathLike[str]", Scan]
+
+
+def is_source(obj: Any) -> bool:
+    """Whether obj is a file a verb should read, instead of a dataframe"""
+    if isinstance(obj, (str, os.PathLike, Scan)):
+        return True
+
+    # a pyarrow.dataset.Dataset, checked without importing pyarrow
+    return type(obj).__module__.startswith("pyarrow") and hasattr(obj, "to_table")
+
+
+def read_source(
+    source: Any, *selections: Optional[_ColumnList]
+) -> Tuple[pd.DataFrame, List[List[str]]]:
+    """Read the columns picked by one or more selections from a file.
+
+    A selection of None reads all the columns.
+
+    Returns
+    -------
+    Tuple[pd.DataFrame, List[List[str]]]
+        The dataframe, and the column names of each selection
+    """
+    scanned = source if isinstance(source, Scan) else Scan(source)
+
+    frame = scanned.schema_frame
+    names = [
+        list(frame.columns if s is None else get_column_names(frame, s))
+        for s in selections
+    ]
+    columns = None if any(s is None for s in selections) else sum(names, [])
+    return scanned.read(columns), names
+
+
+def _guess_format(source: Any) -> str:
+    path = os.fspath(source)
+    if os.path.isdir(path):
+        return "parquet"
+
+    root, extension = os.path.splitext(path.lower())
+    if extension in (".gz", ".bz2", ".zst"):
+        _, extension = os.path.splitext(root)
+
+    if extension not in _FORMATS:
+        raise ValueError(f"Can not tell the format of {path}, pass format=")
+
+    return _FORMATS[extension]
+
+
+def _expression(filters: Optional[Any]) -> Any:
+    if filters is None or not isinstance(filters, list):
+        return filters
+
+    parquet = _import_pyarrow("pyarrow.parquet")
+    return parquet.filters_to_expression(filters)
+
+
+def _import_pyarrow(module: str) -> Any:
+    try:
+        return import_module(module)
+    except ImportError as e:
+        raise ImportError("Reading files with tidybear needs pyarrow") from e
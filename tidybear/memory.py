@@ -0,0 +1,75 @@
+"""
+Memory accounting
+
+Helpers used by the verbs to estimate how much memory they will allocate, and to
+check that estimate against `tidybear.options.max_memory` before doing the work.
+"""
+from __future__ import annotations
+
+from typing import Any
+from typing import Optional
+
+from tidybear.options import options
+
+
+class MemoryBudgetError(MemoryError):
+    """Raised when a verb is estimated to need more memory than options.max_memory."""
+
+
+def budget_active() -> bool:
+    """Whether a memory budget is set, so the verbs need to estimate their memory."""
+    return options.max_memory is not None
+
+
+def frame_bytes(df: Any) -> int:
+    """Estimate the memory used by a dataframe or series, including its index."""
+    usage = df.memory_usage(index=True, deep=options.deep_memory)
+    return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+
+
+def column_bytes(df: Any) -> Any:
+    """Estimate the memory used by each column of a dataframe, as a Series."""
+    return df.memory_usage(index=False, deep=options.deep_memory)
+
+
+def row_bytes(df: Any) -> float:
+    """Estimate the memory used by a single row of a dataframe."""
+    if len(df) == 0:
+        return float(df.memory_usage(index=False).count() * 8)
+
+    return frame_bytes(df) / len(df)
+
+
+def check_memory(verb: str, estimated_bytes: float, hint: Optional[str] = None) -> None:
+    """Raise a MemoryBudgetError if the estimate is over options.max_memory.
+
+    Parameters
+    ----------
+    verb : str
+        Name of the verb, used in the error message
+    estimated_bytes : float
+        Estimated memory the verb will allocate
+    hint : str, optional
+        How to bring the memory down, added to the error message
+    """
+    budget = options.max_memory
+    if budget is None or estimated_bytes <= budget:
+        return
+
+    message = (
+        f"{verb} needs an estimated {_format_bytes(estimated_bytes)}, "
+        f"more than tidybear.options.max_memory ({_format_bytes(budget)})."
+    )
+    if hint:
+        message += " " + hint
+
+    raise MemoryBudgetError(message)
+
+
+def _format_bytes(n: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(n) < 1024:
+            return f"{n:.1f}{unit}"
+        n /= 1024
+
+    return f"{n:.1f}TB"
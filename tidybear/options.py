@@ -0,0 +1,91 @@
+"""
+Options
+
+Global settings for tidybear, changed by setting attributes on `tidybear.options`.
+
+Examples
+--------
+code ::
+    import tidybear as tb
+
+    tb.options.max_memory = "4GB"
+    tb.options.deep_memory = True
+    tb.options.backend = "polars"
+"""
+from __future__ import annotations
+
+import re
+from typing import Optional
+from typing import Union
+
+_UNITS = {"": 1, "B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4}
+
+
+class Options:
+    """Global tidybear options
+
+    Properties
+    ----------
+    max_memory : int, str, or None
+        Memory budget for a single verb, in bytes or as a string like "512MB" or
+        "4GB". Verbs that copy or grow their input estimate their output size first
+        and raise a MemoryBudgetError instead of going over it.
+        By default None, meaning no budget.
+    deep_memory : bool
+        Measure the contents of object columns when estimating memory, which is
+        slower but more accurate for string columns, by default False
+    backend : str
+        Engine the heavy verbs run on: "pandas", "polars", "duckdb" or "auto" for
+        whichever of polars and duckdb is installed, by default "pandas".
+        See `tidybear.backends`.
+    """
+
+    def __init__(self) -> None:
+        self._max_memory: Optional[int] = None
+        self._backend = "pandas"
+        self.deep_memory = False
+        self.reset()
+
+    @property
+    def max_memory(self) -> Optional[int]:
+        return self._max_memory
+
+    @max_memory.setter
+    def max_memory(self, value: Union[int, str, None]) -> None:
+        self._max_memory = _parse_bytes(value)
+
+    @property
+    def backend(self) -> str:
+        return self._backend
+
+    @backend.setter
+    def backend(self, value: str) -> None:
+        from tidybear.backends import _BACKENDS
+
+        if value not in ("pandas", "auto") and value not in _BACKENDS:
+            names = ", ".join(["pandas", "auto", *_BACKENDS])
+            raise ValueError(f"Unknown backend '{value}', use one of {names}")
+
+        self._backend = value
+
+    def reset(self) -> None:
+        """Restore the default options."""
+        self._max_memory = None
+        self._backend = "pandas"
+        self.deep_memory = False
+
+
+def _parse_bytes(value: Union[int, str, None]) -> Optional[int]:
+    if value is None or isinstance(value, int):
+        return value
+
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?B?)\s*", value.upper())
+    if not match:
+        raise ValueError(f"Could not parse memory size '{value}', use e.g. '512MB'")
+
+    number, unit = match.groups()
+    unit = unit if unit.endswith("B") or unit == "" else unit + "B"
+    return int(float(number) * _UNITS[unit])
+
+
+options = Options()
@@ -0,0 +1,264 @@
+"""
+Profiling
+
+Opt-in instrumentation for tidybear verbs and GroupBy stats. Every instrumented call
+records its wall time, input and output shapes, the bytes allocated while it ran and
+the approximate number of bytes it copied.
+
+Records are collected by an active `profile()` context and passed to every callback
+registered with `add_hook`. When neither is active, instrumented calls go straight to
+the wrapped function.
+
+Examples
+--------
+code ::
+    import tidybear as tb
+
+    with tb.profile() as prof:
+        wide = tb.pivot_wider(data, names_from="key", values_from="value")
+        counts = tb.count(wide, "group")
+
+    prof.report()
+
+    tb.add_hook(lambda record: statsd.timing(record["verb"], record["wall_time"]))
+"""
+from __future__ import annotations
+
+import functools
+import threading
+import time
+import tracemalloc
+from bisect import bisect_right
+from contextlib import contextmanager
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+
+ProfileRecord = Dict[str, Any]
+ProfileHook = Callable[[ProfileRecord], None]
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_HOOKS: List[ProfileHook] = []
+# the active profilers and whether a call is being recorded, per thread
+_STATE = threading.local()
+
+_COLUMNS = (
+    "verb",
+    "wall_time",
+    "input_shape",
+    "output_shape",
+    "bytes_allocated",
+    "copied_bytes",
+)
+
+
+class Profiler:
+    """Collects the records of instrumented calls made inside a `profile()` block.
+
+    Properties
+    ----------
+    records : List[dict]
+        One record per call, with the keys verb, wall_time (seconds), input_shape,
+        output_shape, bytes_allocated and copied_bytes. The memory keys are None
+        when memory tracking is off.
+    """
+
+    def __init__(self, memory: bool = True) -> None:
+        self.memory = memory
+        self.records: List[ProfileRecord] = []
+
+    def report(self) -> Any:
+        """Get the records as a DataFrame, one row per call.
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self.records, columns=list(_COLUMNS))
+
+
+@contextmanager
+def profile(memory: bool = True) -> Iterator[Profiler]:
+    """Record every tidybear verb and GroupBy stat called inside the block.
+
+    Only calls made by this thread are recorded, so concurrent blocks in other
+    threads do not see each other's calls.
+
+    Parameters
+    ----------
+    memory : bool, optional
+        Track bytes allocated (with tracemalloc) and bytes copied, by default True.
+        This slows the profiled calls down.
+
+    Yields
+    ------
+    Profiler
+    """
+    profiler = Profiler(memory)
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    profilers = _profilers()
+    profilers.append(profiler)
+    try:
+        yield profiler
+    finally:
+        profilers.remove(profiler)
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def add_hook(callback: ProfileHook) -> None:
+    """Call callback with the record of every instrumented call.
+
+    Memory fields are only filled in while a `profile(memory=True)` block is active.
+    """
+    _HOOKS.append(callback)
+
+
+def remove_hook(callback: ProfileHook) -> None:
+    """Stop calling a callback registered with `add_hook`."""
+    _HOOKS.remove(callback)
+
+
+def instrument(func: _F) -> _F:
+    """Record calls to a verb or GroupBy stat while profiling is active.
+
+    Only the outermost instrumented call is recorded, so verbs calling other verbs
+    are not counted twice.
+    """
+    verb = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if (not _HOOKS and not _profilers()) or getattr(_STATE, "active", False):
+            return func(*args, **kwargs)
+
+        _STATE.active = True
+        try:
+            return _record(verb, func, args, kwargs)
+        finally:
+            _STATE.active = False
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _record(
+    verb: str, func: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Any:
+    profilers = _profilers()
+    memory = any(p.memory for p in profilers) and tracemalloc.is_tracing()
+    source = _input_frame(args)
+
+    if memory:
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    wall_time = time.perf_counter() - start
+
+    record: ProfileRecord = {
+        "verb": verb,
+        "wall_time": wall_time,
+        "input_shape": _shape(source),
+        "output_shape": _shape(result),
+        "bytes_allocated": None,
+        "copied_bytes": None,
+    }
+
+    if memory:
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        record["bytes_allocated"] = max(peak_bytes - start_bytes, 0)
+        record["copied_bytes"] = _copied_bytes(source, result)
+
+    for profiler in profilers:
+        profiler.records.append(dict(record))
+
+    for hook in _HOOKS:
+        hook(dict(record))
+
+    return result
+
+
+def _profilers() -> List[Profiler]:
+    """The profilers of the active `profile()` blocks of this thread"""
+    profilers: Optional[List[Profiler]] = getattr(_STATE, "profilers", None)
+    if profilers is None:
+        profilers = _STATE.profilers = []
+
+    return profilers
+
+
+def _input_frame(args: Tuple[Any, ...]) -> Any:
+    for arg in args:
+        if hasattr(arg, "shape"):
+            return arg
+
+        if hasattr(arg, "obj"):
+            return arg.obj
+
+    return None
+
+
+def _shape(obj: Any) -> Optional[Tuple[int, ...]]:
+    shape = getattr(obj, "shape", None)
+    return tuple(shape) if shape is not None else None
+
+
+def _arrays(obj: Any) -> List[Any]:
+    """The array of every column, numpy arrays for numpy dtypes, without copies"""
+    import numpy as np
+
+    if hasattr(obj, "columns"):
+        columns = [obj.iloc[:, i] for i in range(obj.shape[1])]
+    elif hasattr(obj, "dtype") and hasattr(obj, "array"):
+        columns = [obj]
+    else:
+        return []
+
+    return [c.to_numpy() if isinstance(c.dtype, np.dtype) else c.array for c in columns]
+
+
+def _copied_bytes(source: Any, result: Any) -> Optional[int]:
+    """Approximate the bytes of the result that are not views of the source data.
+
+    Only numpy arrays are compared by their buffers. Extension arrays (e.g. Arrow
+    columns) are not converted, and count as copied unless the result holds the
+    same array object as the source.
+    """
+    if source is None or not hasattr(result, "shape"):
+        return None
+
+    source_arrays = _arrays(source)
+    ranges = sorted(
+        (start, start + arr.nbytes)
+        for arr in source_arrays
+        if hasattr(arr, "__array_interface__")
+        for start in [arr.__array_interface__["data"][0]]
+    )
+    starts = [start for start, _ in ranges]
+    shared = {id(arr) for arr in source_arrays}
+
+    copied = 0
+    for arr in _arrays(result):
+        if not hasattr(arr, "__array_interface__"):
+            copied += 0 if id(arr) in shared else arr.nbytes
+            continue
+
+        pointer = arr.__array_interface__["data"][0]
+        i = bisect_right(starts, pointer) - 1
+        if i < 0 or pointer >= ranges[i][1]:
+            copied += arr.nbytes
+
+    return copied
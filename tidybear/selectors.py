@@ -17,33 +17,263 @@ code ::
 from __future__ import annotations
 
 import re
+import weakref
+from functools import lru_cache
+from typing import Any
+from typing import Callable
+from typing import Dict
 from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import MutableSequence
+from typing import Optional
 from typing import Protocol
 from typing import Sequence
+from typing import Tuple
 from typing import Union
 
 
+_SelectionCache = Dict[int, Tuple["weakref.ref[Any]", List[str]]]
+
+
 class TidySelectFunction(Protocol):
     def __call__(self, columns: Iterable[str]) -> Sequence[str]:
         ...
 
 
 class TidySelector:
+    """Wraps a tidy select function.
+
+    Selections are memoized per column index. Passing the same immutable
+    columns object (e.g. ``df.columns``) again returns the cached selection
+    without re-scanning the columns. Mutable containers such as lists are
+    never memoized.
+
+    Selectors can be combined with ``&`` (intersection), ``|`` (union),
+    ``-`` (difference) and negated with unary ``-``. Combined selectors
+    evaluate each part once as a mask over the columns, so the result keeps
+    the column order and never contains duplicates.
+    """
+
     def __init__(self, selector: TidySelectFunction) -> None:
         self.selector = selector
-
-    def __call__(self, columns: Iterable[str]) -> Sequence[str]:
+        self._cache: _SelectionCache = {}
+
+    @property
+    def uses_dtypes(self) -> bool:
+        """Whether the selection depends on the column dtypes."""
+        return False
+
+    def __call__(
+        self, columns: Iterable[str], dtypes: Optional[Iterable[Any]] = None
+    ) -> Sequence[str]:
+        if _is_frame(columns):
+            frame = columns
+            columns = frame.columns  # type: ignore[attr-defined]
+            if self.uses_dtypes:
+                dtypes = _frame_dtype_index(frame)
+
+        if self.uses_dtypes:
+            return list(self._select(columns, _as_dtype_index(dtypes)))
+
+        key = id(columns)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0]() is columns:
+            return list(cached[1])
+
+        selected = list(self._select(columns, dtypes))
+
+        if isinstance(columns, (MutableSequence, Iterator)):
+            return selected
+
+        try:
+            ref = weakref.ref(columns, _evict(self._cache, key))
+        except TypeError:
+            return selected
+
+        self._cache[key] = (ref, selected)
+        return list(selected)
+
+    def _select(
+        self, columns: Iterable[str], dtypes: Optional[Iterable[Any]]
+    ) -> Sequence[str]:
         return self.selector(columns)
 
+    def mask(
+        self, columns: Sequence[str], dtypes: Optional[Iterable[Any]] = None
+    ) -> List[bool]:
+        """Get a boolean mask over the columns, True where the column is selected."""
+        selected = set(self(columns, dtypes))
+        return [c in selected for c in columns]
+
     def filter_columns(self, columns: Iterable[str]) -> Sequence[str]:
-        return self.selector(columns)
+        return self(columns)
 
     def __neg__(self) -> TidySelector:
-        def neg_selector(columns: Iterable[str]) -> List[str]:
-            return [c for c in columns if c not in self.selector(columns)]
+        return _CombinedSelector("not", [self])
+
+    def __and__(self, other: Union[str, TidySelector]) -> TidySelector:
+        return _CombinedSelector("and", [self, _as_selector(other)])
+
+    def __rand__(self, other: Union[str, TidySelector]) -> TidySelector:
+        return _CombinedSelector("and", [_as_selector(other), self])
+
+    def __or__(self, other: Union[str, TidySelector]) -> TidySelector:
+        return _CombinedSelector("or", [self, _as_selector(other)])
+
+    def __ror__(self, other: Union[str, TidySelector]) -> TidySelector:
+        return _CombinedSelector("or", [_as_selector(other), self])
+
+    def __sub__(self, other: Union[str, TidySelector]) -> TidySelector:
+        return _CombinedSelector("sub", [self, _as_selector(other)])
+
+    def __rsub__(self, other: Union[str, TidySelector]) -> TidySelector:
+        return _CombinedSelector("sub", [_as_selector(other), self])
+
+
+class _MaskSelector(TidySelector):
+    """A selector defined by its mask, so it can be combined in a single pass."""
+
+    def _select(
+        self, columns: Iterable[str], dtypes: Optional[Iterable[Any]] = None
+    ) -> List[str]:
+        columns = _as_sequence(columns)
+        return [c for c, keep in zip(columns, self.mask(columns, dtypes)) if keep]
+
+
+class _CombinedSelector(_MaskSelector):
+    def __init__(self, op: str, selectors: List[TidySelector]) -> None:
+        super().__init__(self._select)
+        self.op = op
+        self.selectors = selectors
+
+    @property
+    def uses_dtypes(self) -> bool:
+        return any(s.uses_dtypes for s in self.selectors)
+
+    def mask(
+        self, columns: Sequence[str], dtypes: Optional[Iterable[Any]] = None
+    ) -> List[bool]:
+        dtypes = _as_dtype_index(dtypes)
+        masks = [s.mask(columns, dtypes) for s in self.selectors]
+
+        if self.op == "not":
+            return [not a for a in masks[0]]
+        if self.op == "and":
+            return [a and b for a, b in zip(*masks)]
+        if self.op == "or":
+            return [a or b for a, b in zip(*masks)]
+        return [a and not b for a, b in zip(*masks)]
+
+
+class _WhereSelector(_MaskSelector):
+    def __init__(self, predicate: Callable[[Any], bool]) -> None:
+        super().__init__(self._select)
+        self.predicate = predicate
+
+    @property
+    def uses_dtypes(self) -> bool:
+        return True
+
+    def mask(
+        self, columns: Sequence[str], dtypes: Optional[Iterable[Any]] = None
+    ) -> List[bool]:
+        index = _as_dtype_index(dtypes)
+        if index is None:
+            raise ValueError("where() selectors need the column dtypes to select")
+
+        return index.mask(self.predicate)
+
+
+class _DtypeIndex:
+    """Maps each distinct dtype to the positions of the columns with that dtype.
+
+    Predicates are evaluated once per distinct dtype rather than once per
+    column, and the resulting masks are cached per predicate.
+    """
+
+    def __init__(self, dtypes: Iterable[Any]) -> None:
+        self.dtypes = list(dtypes)
+        self.positions: Dict[Any, List[int]] = {}
+        for i, dtype in enumerate(self.dtypes):
+            self.positions.setdefault(dtype, []).append(i)
+
+        self._masks: Dict[Callable[[Any], bool], List[bool]] = {}
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.dtypes)
+
+    def mask(self, predicate: Callable[[Any], bool]) -> List[bool]:
+        if predicate not in self._masks:
+            mask = [False] * len(self.dtypes)
+            for dtype, positions in self.positions.items():
+                if predicate(dtype):
+                    for i in positions:
+                        mask[i] = True
+
+            self._masks[predicate] = mask
+
+        return list(self._masks[predicate])
+
+
+_FrameCache = Dict[int, Tuple["weakref.ref[Any]", Any, Any, _DtypeIndex]]
+_FRAME_DTYPE_INDEXES: _FrameCache = {}
+
+
+def _frame_dtype_index(frame: Any) -> _DtypeIndex:
+    """Get the dtype index of a dataframe, reusing it while the frame is unchanged."""
+    key = id(frame)
+    columns = frame.columns
+    dtypes = frame.dtypes.to_numpy()
+
+    cached = _FRAME_DTYPE_INDEXES.get(key)
+    if cached is not None:
+        ref, cached_columns, cached_dtypes, index = cached
+        if (
+            ref() is frame
+            and cached_columns is columns
+            and (cached_dtypes == dtypes).all()
+        ):
+            return index
+
+    index = _DtypeIndex(dtypes)
+    ref = weakref.ref(frame, _evict(_FRAME_DTYPE_INDEXES, key))
+    _FRAME_DTYPE_INDEXES[key] = (ref, columns, dtypes, index)
+    return index
+
+
+def _as_dtype_index(dtypes: Optional[Iterable[Any]]) -> Optional[_DtypeIndex]:
+    if dtypes is None or isinstance(dtypes, _DtypeIndex):
+        return dtypes
+
+    return _DtypeIndex(dtypes)
+
 
-        return TidySelector(neg_selector)
+def _is_frame(columns: Iterable[str]) -> bool:
+    return hasattr(columns, "columns") and hasattr(columns, "dtypes")
+
+
+def _evict(cache: Dict[int, Any], key: int) -> Callable[[weakref.ref[Any]], None]:
+    def callback(_: weakref.ref[Any]) -> None:
+        cache.pop(key, None)
+
+    return callback
+
+
+def _as_selector(to_select: Union[str, TidySelector]) -> TidySelector:
+    if isinstance(to_select, TidySelector):
+        return to_select
+
+    def selector(columns: Iterable[str]) -> List[str]:
+        return [c for c in columns if c == to_select]
+
+    return TidySelector(selector)
+
+
+def _as_sequence(columns: Iterable[str]) -> Sequence[str]:
+    if hasattr(columns, "__getitem__") and hasattr(columns, "__len__"):
+        return columns  # type: ignore[return-value]
+    return list(columns)
 
 
 _ColumnList = Union[str, TidySelector, Sequence[Union[str, TidySelector]]]
@@ -76,7 +306,7 @@ def last_col() -> TidySelector:
     """
 
     def selector(columns: Iterable[str]) -> List[str]:
-        return [list(columns)[-1]]
+        return [_as_sequence(columns)[-1]]
 
     return TidySelector(selector)
 
@@ -92,7 +322,7 @@ def first_col() -> TidySelector:
     """
 
     def selector(columns: Iterable[str]) -> List[str]:
-        return [list(columns)[0]]
+        return [_as_sequence(columns)[0]]
 
     return TidySelector(selector)
 
@@ -201,9 +431,98 @@ def num_range(prefix: str, values: Iterable[int], width: int = 0) -> TidySelecto
     >>> num_range("x", range(2, 4), width=2)(cols)
     ['x02', 'x03']
     """
+    allowed = {f"{prefix}{str(i).zfill(width)}" for i in values}
 
     def selector(columns: Iterable[str]) -> List[str]:
-        allowed = [f"{prefix}{str(i).zfill(width)}" for i in values]
         return [c for c in columns if c in allowed]
 
     return TidySelector(selector)
+
+
+def where(predicate: Any) -> TidySelector:
+    """Select all columns whose dtype satisfies the predicate
+
+    The predicate is evaluated once per distinct dtype. When selecting from
+    a dataframe, the dtype lookup is cached until its columns or dtypes change.
+
+    Parameters
+    ----------
+    predicate : function or dtype
+        Called with the dtype of each column, returns True to select it.
+        If a dtype or dtype name is given, select the columns of that dtype.
+
+    Examples
+    --------
+    >>> cols = ["x01", "x02", "name"]
+    >>> dtypes = [np.dtype("int64"), np.dtype("float64"), np.dtype("O")]
+    >>> where(is_numeric)(cols, dtypes)
+    ['x01', 'x02']
+    >>> where("float64")(cols, dtypes)
+    ['x02']
+    """
+    if isinstance(predicate, type) or not callable(predicate):
+        predicate = _dtype_equals(predicate)
+
+    return _WhereSelector(predicate)
+
+
+@lru_cache(maxsize=None)
+def _dtype_equals(target: Any) -> Callable[[Any], bool]:
+    from pandas.api.types import pandas_dtype
+
+    target = pandas_dtype(target)
+
+    def predicate(dtype: Any) -> bool:
+        return bool(dtype == target)
+
+    return predicate
+
+
+def is_numeric(dtype: Any) -> bool:
+    """Predicate for where(), True for integer, float and complex dtypes"""
+    from pandas.api.types import is_bool_dtype
+    from pandas.api.types import is_numeric_dtype
+
+    return is_numeric_dtype(dtype) and not is_bool_dtype(dtype)
+
+
+def is_integer(dtype: Any) -> bool:
+    """Predicate for where(), True for integer dtypes"""
+    from pandas.api.types import is_integer_dtype
+
+    return bool(is_integer_dtype(dtype))
+
+
+def is_float(dtype: Any) -> bool:
+    """Predicate for where(), True for float dtypes"""
+    from pandas.api.types import is_float_dtype
+
+    return bool(is_float_dtype(dtype))
+
+
+def is_bool(dtype: Any) -> bool:
+    """Predicate for where(), True for boolean dtypes"""
+    from pandas.api.types import is_bool_dtype
+
+    return bool(is_bool_dtype(dtype))
+
+
+def is_string(dtype: Any) -> bool:
+    """Predicate for where(), True for string and object dtypes"""
+    from pandas.api.types import is_string_dtype
+
+    return bool(is_string_dtype(dtype))
+
+
+def is_datetime(dtype: Any) -> bool:
+    """Predicate for where(), True for datetime dtypes"""
+    from pandas.api.types import is_datetime64_any_dtype
+
+    return bool(is_datetime64_any_dtype(dtype))
+
+
+def is_categorical(dtype: Any) -> bool:
+    """Predicate for where(), True for categorical dtypes"""
+    from pandas import CategoricalDtype
+
+    return isinstance(dtype, CategoricalDtype)
@@ -0,0 +1,326 @@
+"""
+Incremental summaries
+
+A `SummaryState` holds mergeable per-group statistics: row counts, sums, centered sums
+of squares, min and max of numeric columns, and HyperLogLog sketches for the number of
+distinct values. Two states are merged without looking at the rows again, so a summary
+over a growing table is refreshed by summarising only the new rows.
+
+Examples
+--------
+code ::
+    import tidybear as tb
+
+    with tb.GroupBy(history, "store") as g:
+        state = g.summary_state(["sales"], distinct="customer")
+
+    state.save("sales_state.pkl")
+
+    state = tb.SummaryState.load("sales_state.pkl").update(new_rows)
+    state.summarise()
+"""
+from __future__ import annotations
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from tidybear.selectors import _ColumnList
+from tidybear.utils import get_column_names
+
+
+class SummaryState:
+    """Mergeable per-group summary statistics.
+
+    Create one with `GroupBy.summary_state` or `SummaryState.from_frame`.
+
+    Properties
+    ----------
+    groups : List[str]
+        The grouping variables
+    columns : List[str]
+        Numeric columns with count, sum, mean, var, std, min and max
+    distinct : List[str]
+        Columns with an approximate number of distinct values
+    precision : int
+        HyperLogLog precision. Each group keeps 2**precision one-byte registers per
+        distinct column, with a relative error of about 1.04 / sqrt(2**precision).
+    """
+
+    def __init__(
+        self,
+        groups: List[str],
+        columns: List[str],
+        distinct: List[str],
+        precision: int,
+        stats: pd.DataFrame,
+        registers: Dict[str, npt.NDArray[np.uint8]],
+    ) -> None:
+        self.groups = list(groups)
+        self.columns = list(columns)
+        self.distinct = list(distinct)
+        self.precision = precision
+        self._stats = stats
+        self._registers = registers
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        groups: _ColumnList,
+        columns: Optional[_ColumnList] = None,
+        distinct: Optional[_ColumnList] = None,
+        precision: int = 10,
+    ) -> SummaryState:
+        """Summarise a dataframe into a new state.
+
+        Parameters
+        ----------
+        df : DataFrame
+        groups : str, list or selector
+            Columns to group by
+        columns : str, list or selector, optional
+            Numeric columns to keep moments of, by default None
+        distinct : str, list or selector, optional
+            Columns to count distinct values of, by default None
+        precision : int, optional
+            HyperLogLog precision, between 4 and 16, by default 10
+
+        Returns
+        -------
+        SummaryState
+        """
+        from tidybear.groupby import GroupBy
+
+        with GroupBy(df, groups) as g:
+            return g.summary_state(columns, distinct=distinct, precision=precision)
+
+    @classmethod
+    def load(cls, path: Any) -> SummaryState:
+        """Read a state written by `save`."""
+        state = pd.read_pickle(path)
+        if not isinstance(state, cls):
+            raise TypeError(f"{path} does not contain a SummaryState")
+
+        return state
+
+    def save(self, path: Any) -> None:
+        """Write the state to a file, see `pd.to_pickle`."""
+        pd.to_pickle(self, path)
+
+    @property
+    def ngroups(self) -> int:
+        return len(self._stats)
+
+    def update(self, df: pd.DataFrame) -> SummaryState:
+        """Get a new state that also covers the rows of df.
+
+        Only df is summarised, so this takes time proportional to the new rows
+        and the number of groups.
+        """
+        batch = SummaryState.from_frame(
+            df, self.groups, self.columns, self.distinct, self.precision
+        )
+        return self.merge(batch)
+
+    def merge(self, other: SummaryState) -> SummaryState:
+        """Combine two states summarising different rows of the same table."""
+        fields = ("groups", "columns", "distinct", "precision")
+        if any(getattr(self, f) != getattr(other, f) for f in fields):
+            raise ValueError("Only states with the same groups and columns can merge")
+
+        index = self._stats.index.union(other._stats.index)
+        left = self._stats.reindex(index)
+        right = other._stats.reindex(index)
+
+        stats = {"n": left["n"].fillna(0) + right["n"].fillna(0)}
+        for column in self.columns:
+            stats.update(_merge_moments(left, right, column))
+
+        registers: Dict[str, npt.NDArray[np.uint8]] = {}
+        for column in self.distinct:
+            merged = np.zeros((len(index), 1 << self.precision), dtype=np.uint8)
+            for state in (self, other):
+                rows = index.get_indexer(state._stats.index)
+                merged[rows] = np.maximum(merged[rows], state._registers[column])
+            registers[column] = merged
+
+        merged_stats = pd.DataFrame(stats, index=index).astype({"n": np.int64})
+        return SummaryState(
+            self.groups,
+            self.columns,
+            self.distinct,
+            self.precision,
+            merged_stats,
+            registers,
+        )
+
+    def summarise(self) -> pd.DataFrame:
+        """Get the summary, one row per group.
+
+        Columns are n, then mean, sum, var, std, min and max of each numeric
+        column, then the estimated n_distinct of each distinct column.
+
+        Returns
+        -------
+        pd.DataFrame
+        """
+        summary = {"n": self._stats["n"]}
+        for column in self.columns:
+            count = self._stats[f"count_{column}"]
+            m2 = self._stats[f"m2_{column}"]
+            var = (m2 / (count - 1)).where(count > 1)
+
+            summary[f"mean_{column}"] = self._stats[f"sum_{column}"] / count
+            summary[f"sum_{column}"] = self._stats[f"sum_{column}"]
+            summary[f"var_{column}"] = var
+            summary[f"std_{column}"] = np.sqrt(var)
+            summary[f"min_{column}"] = self._stats[f"min_{column}"]
+            summary[f"max_{column}"] = self._stats[f"max_{column}"]
+
+        for column in self.distinct:
+            estimate = _estimate_distinct(self._registers[column])
+            summary[f"n_distinct_{column}"] = pd.Series(
+                estimate, index=self._stats.index
+            )
+
+        return pd.DataFrame(summary, index=self._stats.index)
+
+    def summarize(self) -> pd.DataFrame:
+        """Get the summary, one row per group. See `summarise`."""
+        return self.summarise()
+
+    def __repr__(self) -> str:
+        return (
+            f"SummaryState(groups={self.groups}, columns={self.columns}, "
+            f"distinct={self.distinct}, ngroups={self.ngroups})"
+        )
+
+
+def _from_codes(
+    df: pd.DataFrame,
+    groups: List[str],
+    codes: npt.NDArray[np.int64],
+    index: pd.Index,
+    columns: Optional[_ColumnList],
+    distinct: Optional[_ColumnList],
+    precision: int,
+) -> SummaryState:
+    """Build a state from the group number of every row (-1 for no group)."""
+    if not 4 <= precision <= 16:
+        raise ValueError(f"precision must be between 4 and 16, got {precision}")
+
+    numeric = list(get_column_names(df, columns)) if columns is not None else []
+    hashed = list(get_column_names(df, distinct)) if distinct is not None else []
+
+    n_groups = len(index)
+    grouped = codes >= 0
+    stats = {"n": np.bincount(codes[grouped], minlength=n_groups)}
+
+    for column in numeric:
+        values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        keep = grouped & ~np.isnan(values)
+        keep_codes, keep_values = codes[keep], values[keep]
+
+        count = np.bincount(keep_codes, minlength=n_groups)
+        total = np.bincount(keep_codes, weights=keep_values, minlength=n_groups)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = total / count
+
+        deviations = keep_values - mean[keep_codes]
+        minimum = np.full(n_groups, np.inf)
+        maximum = np.full(n_groups, -np.inf)
+        np.minimum.at(minimum, keep_codes, keep_values)
+        np.maximum.at(maximum, keep_codes, keep_values)
+
+        stats[f"count_{column}"] = count
+        stats[f"sum_{column}"] = total
+        stats[f"m2_{column}"] = np.bincount(
+            keep_codes, weights=deviations * deviations, minlength=n_groups
+        )
+        stats[f"min_{column}"] = np.where(count > 0, minimum, np.nan)
+        stats[f"max_{column}"] = np.where(count > 0, maximum, np.nan)
+
+    registers = {}
+    for column in hashed:
+        hashes = pd.util.hash_pandas_object(df[column], index=False).to_numpy()
+        registers[column] = _sketch(
+            codes[grouped], hashes[grouped], n_groups, precision
+        )
+
+    return SummaryState(
+        groups, numeric, hashed, precision, pd.DataFrame(stats, index=index), registers
+    )
+
+
+def _merge_moments(
+    left: pd.DataFrame, right: pd.DataFrame, column: str
+) -> Dict[str, pd.Series]:
+    """Combine counts, sums and centered sums of squares (Chan et al.)"""
+    count_l = left[f"count_{column}"].fillna(0)
+    count_r = right[f"count_{column}"].fillna(0)
+    sum_l = left[f"sum_{column}"].fillna(0)
+    sum_r = right[f"sum_{column}"].fillna(0)
+    count = count_l + count_r
+
+    both = (count_l > 0) & (count_r > 0)
+    delta = (sum_r / count_r - sum_l / count_l).where(both, 0)
+    m2 = (
+        left[f"m2_{column}"].fillna(0)
+        + right[f"m2_{column}"].fillna(0)
+        + delta * delta * count_l * count_r / count.where(both, 1)
+    )
+
+    return {
+        f"count_{column}": count.astype(np.int64),
+        f"sum_{column}": sum_l + sum_r,
+        f"m2_{column}": m2,
+        f"min_{column}": np.fmin(left[f"min_{column}"], right[f"min_{column}"]),
+        f"max_{column}": np.fmax(left[f"max_{column}"], right[f"max_{column}"]),
+    }
+
+
+def _sketch(
+    codes: npt.NDArray[np.int64],
+    hashes: npt.NDArray[np.uint64],
+    n_groups: int,
+    precision: int,
+) -> npt.NDArray[np.uint8]:
+    """HyperLogLog registers of each group, shape (n_groups, 2**precision)"""
+    width = 64 - precision
+    buckets = (hashes >> np.uint64(width)).astype(np.int64)
+    rest = hashes & np.uint64((1 << width) - 1)
+    ranks = (width - _bit_length(rest) + 1).astype(np.uint8)
+
+    registers = np.zeros((n_groups, 1 << precision), dtype=np.uint8)
+    np.maximum.at(registers, (codes, buckets), ranks)
+    return registers
+
+
+def _bit_length(values: npt.NDArray[np.uint64]) -> npt.NDArray[np.int64]:
+    values = values.copy()
+    lengths = np.zeros(len(values), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        high = values >= np.uint64(1 << shift)
+        lengths[high] += shift
+        values[high] >>= np.uint64(shift)
+
+    return lengths + (values > 0)
+
+
+def _estimate_distinct(registers: npt.NDArray[np.uint8]) -> npt.NDArray[np.int64]:
+    m = registers.shape[1]
+    alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+
+    raw = alpha * m * m / np.sum(np.exp2(-registers.astype(np.float64)), axis=1)
+    zeros = np.count_nonzero(registers == 0, axis=1)
+    with np.errstate(divide="ignore"):
+        linear = m * np.log(m / np.maximum(zeros, 1))
+
+    estimate = np.where((raw <= 2.5 * m) & (zeros > 0), linear, raw)
+    return np.round(estimate).astype(np.int64)
@@ -1,5 +1,7 @@
+from typing import Any
 from typing import Iterable
 from typing import List
+from typing import Optional
 from typing import Sequence
 from typing import Union
 
@@ -8,21 +10,37 @@ from tidybear.selectors import TidySelector
 
 
 def get_column_name(
-    cols: Iterable[str], to_select: Union[str, TidySelector]
+    cols: Iterable[str],
+    to_select: Union[str, TidySelector],
+    dtypes: Optional[Iterable[Any]] = None,
 ) -> Sequence[str]:
     if isinstance(to_select, str):
         return [to_select]
 
-    return to_select(cols)
+    return to_select(cols, dtypes)
 
 
-def get_column_names(cols: Iterable[str], to_select: _ColumnList) -> Sequence[str]:
+def get_column_names(
+    cols: Iterable[str], to_select: _ColumnList, dtypes: Optional[Iterable[Any]] = None
+) -> Sequence[str]:
 
     if isinstance(to_select, str) or isinstance(to_select, TidySelector):
-        return get_column_name(cols, to_select)
+        return get_column_name(cols, to_select, dtypes)
+
+    if dtypes is not None:
+        dtypes = list(dtypes)
 
     selected: List[str] = []
     for item in to_select:
-        selected.extend(get_column_name(cols, item))
+        selected.extend(get_column_name(cols, item, dtypes))
 
     return selected
+
+
+def uses_arrow(df: Any) -> bool:
+    """Whether any column is Arrow-backed, an ArrowDtype or string[pyarrow]"""
+    return any(
+        getattr(dtype, "pyarrow_dtype", None) is not None
+        or str(getattr(dtype, "storage", "")).startswith("pyarrow")
+        for dtype in df.dtypes
+    )
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from pandas import DataFrame
+
+from tidybear.memory import budget_active
+from tidybear.memory import check_memory
+from tidybear.memory import row_bytes
+from tidybear.profiling import instrument
+from tidybear.selectors import TidySelector
+from tidybear.utils import get_column_names
+
+
+class desc:
+    """Sort a column in descending order in `arrange`
+
+    ```python
+    tb.arrange(df, "country", tb.desc("revenue"))
+    ```
+    """
+
+    def __init__(self, column: Union[str, TidySelector]) -> None:
+        self.column = column
+
+    def __repr__(self) -> str:
+        return f"desc({self.column!r})"
+
+
+_Key = Union[str, TidySelector, desc]
+
+
+@instrument
+def arrange(
+    df: DataFrame,
+    *keys: _Key,
+    na_position: str = "last",
+    limit: Optional[int] = None,
+) -> DataFrame:
+    """Sort the rows of a dataframe by one or more columns
+
+    The sort is stable, so rows with equal keys keep their order.
+
+    Parameters
+    ----------
+    df : DataFrame
+    *keys : str, TidySelector or desc
+        Columns to sort by, in order of priority. Wrap a column in `desc` to
+        sort it in descending order.
+    na_position : str, optional
+        "first" or "last", where to put missing values, by default "last"
+    limit : int, optional
+        Only return the first limit rows. Rows are partitioned on the first key
+        before sorting, so only the candidates for the top rows are sorted,
+        by default None
+
+    Returns
+    -------
+    DataFrame
+        The sorted rows, with their index
+    """
+    if na_position not in ("first", "last"):
+        raise ValueError(f"na_position must be 'first' or 'last', got {na_position}")
+
+    if limit is not None and limit < 0:
+        raise ValueError(f"limit must not be negative, got {limit}")
+
+    rows = len(df) if limit is None else min(limit, len(df))
+    if budget_active():
+        check_memory("arrange", rows * row_bytes(df))
+
+    sort_keys: List[npt.NDArray[Any]] = []
+    for column, ascending in _resolve_keys(df, keys):
+        values, missing = _sort_key(df[column], ascending, na_position == "last")
+        sort_keys.append(values)
+        # the filled values already put missing values at the end chosen, the mask
+        # only breaks ties with values equal to the fill
+        if missing is not None:
+            sort_keys.append(missing if na_position == "last" else ~missing)
+
+    if not sort_keys:
+        return df.iloc[:rows].copy()
+
+    return df.take(_sort_order(sort_keys, rows))
+
+
+def _resolve_keys(df: DataFrame, keys: Tuple[_Key, ...]) -> List[Tuple[str, bool]]:
+    resolved: List[Tuple[str, bool]] = []
+    for key in keys:
+        column, ascending = (
+            (key.column, False) if isinstance(key, desc) else (key, True)
+        )
+        resolved.extend((c, ascending) for c in get_column_names(df, column))
+
+    return resolved
+
+
+def _sort_key(
+    series: pd.Series, ascending: bool, na_last: bool
+) -> Tuple[npt.NDArray[Any], Optional[npt.NDArray[np.bool_]]]:
+    """An array whose ascending order is the order of the column, and its missing mask
+
+    Numeric and datetime columns are sorted on their values, descending by
+    negating them (or flipping their bits, which can not overflow). Other columns
+    are factorized into codes in sorted order. Missing values get the largest or
+    smallest value, so the first key can be partitioned on directly.
+    """
+    dtype = series.dtype
+    missing: Optional[npt.NDArray[np.bool_]] = None
+
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufmM":
+        values = series.to_numpy()
+        if dtype.kind in "mM":
+            missing = np.isnat(values)
+            values = values.view(np.int64)
+        elif dtype.kind == "f":
+            missing = np.isnan(values)
+        elif dtype.kind == "b":
+            values = values.view(np.uint8)
+
+        if not ascending:
+            values = -values if dtype.kind == "f" else ~values
+    else:
+        if isinstance(dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy()
+        else:
+            codes = pd.factorize(series, sort=True)[0]
+
+        missing = codes < 0
+        values = codes if ascending else ~codes
+
+    if missing is None or not missing.any():
+        return values, None
+
+    info = (
+        np.finfo(values.dtype) if values.dtype.kind == "f" else np.iinfo(values.dtype)
+    )
+    fill = np.inf if values.dtype.kind == "f" else info.max
+    if not na_last:
+        fill = -np.inf if values.dtype.kind == "f" else info.min
+
+    return np.where(missing, fill, values), missing
+
+
+def _sort_order(keys: List[npt.NDArray[Any]], limit: int) -> npt.NDArray[np.intp]:
+    """Stable order of the rows by keys, in order of priority, cut to limit rows"""
+    n = len(keys[0])
+    if limit >= n:
+        return np.lexsort(keys[::-1])
+
+    if limit == 0:
+        return np.zeros(0, dtype=np.intp)
+
+    # every row in the top limit has a first key at most the limit-th smallest one
+    first = keys[0]
+    threshold = np.partition(first, limit - 1)[limit - 1]
+    candidates = np.flatnonzero(first <= threshold)
+
+    order = np.lexsort([key[candidates] for key in keys[::-1]])
+    return candidates[order[:limit]]
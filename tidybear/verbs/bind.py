@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from pandas import DataFrame
+from pandas.api.types import pandas_dtype
+
+from tidybear.memory import budget_active
+from tidybear.memory import check_memory
+from tidybear.memory import frame_bytes
+from tidybear.memory import row_bytes
+from tidybear.profiling import instrument
+
+_Frames = Union[DataFrame, Iterable[DataFrame]]
+
+
+@instrument
+def bind_rows(*frames: _Frames, ignore_index: bool = False) -> DataFrame:
+    """Stack dataframes on top of each other
+
+    The columns are the union of all columns, in order of first appearance, and
+    rows of a frame without a column are missing. Every column gets the common
+    dtype of its pieces once, instead of being upcast step by step: integers
+    and floats become floats, other mixes become objects, and categoricals
+    become the union of their categories.
+
+    ```python
+    tb.bind_rows(jan, feb, mar)
+    tb.bind_rows(pd.read_parquet(path) for path in daily_files)
+    ```
+
+    Parameters
+    ----------
+    *frames : DataFrames, or one list or iterable of them
+        A list is checked up front, and the output is allocated once. An
+        iterator is read one frame at a time, and each frame is copied into the
+        output (grown geometrically) before the next one is read.
+    ignore_index : bool, optional
+        Number the rows 0, 1, ... instead of keeping their index, by default False
+
+    Returns
+    -------
+    DataFrame
+    """
+    inputs = _as_frames(frames)
+    if not isinstance(inputs, Sequence):
+        builder = _RowBuilder({}, 0)
+        for df in inputs:
+            builder.append(df)
+
+        return builder.finish(ignore_index)
+
+    if budget_active():
+        check_memory("bind_rows", sum(frame_bytes(df) for df in inputs))
+
+    builder = _RowBuilder(_schema(inputs), sum(len(df) for df in inputs))
+    for df in inputs:
+        builder.append(df)
+
+    return builder.finish(ignore_index)
+
+
+@instrument
+def bind_cols(*frames: _Frames) -> DataFrame:
+    """Put dataframes side by side, matching rows by position
+
+    Columns with the same dtype are copied into one block, so the output is
+    allocated once. The index of the first frame is kept.
+
+    Parameters
+    ----------
+    *frames : DataFrames, or one list or iterable of them
+        The frames must have the same number of rows and no column names in
+        common.
+
+    Returns
+    -------
+    DataFrame
+    """
+    inputs = list(_as_frames(frames))
+    if not inputs:
+        return DataFrame()
+
+    lengths = {len(df) for df in inputs}
+    if len(lengths) > 1:
+        raise ValueError(
+            f"Can only bind frames with the same number of rows, got {lengths}"
+        )
+
+    if budget_active():
+        check_memory("bind_cols", sum(frame_bytes(df) for df in inputs))
+
+    data: Dict[Hashable, Any] = {}
+    for df in inputs:
+        for i, name in enumerate(df.columns):
+            if name in data:
+                raise ValueError(f"Column {name!r} is in more than one frame")
+
+            data[name] = df.iloc[:, i].array
+
+    return DataFrame(data, index=inputs[0].index, copy=True)
+
+
+def _as_frames(frames: Sequence[_Frames]) -> Iterable[DataFrame]:
+    """The frames passed one by one, or the single list or iterable of them"""
+    if len(frames) == 1 and not isinstance(frames[0], DataFrame):
+        inputs = frames[0]
+        return list(inputs) if isinstance(inputs, (tuple, list)) else iter(inputs)
+
+    return list(frames)
+
+
+def _schema(frames: Sequence[DataFrame]) -> Dict[Hashable, Any]:
+    """The output column dtypes of a list of frames"""
+    dtypes: Dict[Hashable, Any] = {}
+    for df in frames:
+        for name, dtype in _dtypes(df):
+            dtypes[name] = (
+                _common_dtype(dtypes[name], dtype) if name in dtypes else dtype
+            )
+
+    for name in dtypes:
+        if any(len(df) and name not in df.columns for df in frames):
+            dtypes[name] = _with_missing(dtypes[name])
+
+    return dtypes
+
+
+def _dtypes(df: DataFrame) -> Any:
+    if not df.columns.is_unique:
+        raise ValueError("Can only bind frames with unique column names")
+
+    return df.dtypes.items()
+
+
+def _common_dtype(a: Any, b: Any) -> Any:
+    """The dtype that holds the values of both dtypes"""
+    if isinstance(a, pd.CategoricalDtype) and isinstance(b, pd.CategoricalDtype):
+        if a == b:
+            return a
+
+        if a.ordered or b.ordered:
+            raise TypeError(
+                "Can only bind ordered categoricals with the same categories"
+            )
+
+        # appending keeps the codes of a valid
+        new = b.categories.difference(a.categories, sort=False)
+        return pd.CategoricalDtype(a.categories.append(new)) if len(new) else a
+
+    a, b = (
+        d.categories.dtype if isinstance(d, pd.CategoricalDtype) else d for d in (a, b)
+    )
+    if a == b:
+        return a
+
+    if isinstance(a, np.dtype) and isinstance(b, np.dtype):
+        if a.kind == b.kind or (a.kind in "iuf" and b.kind in "iuf"):
+            return np.result_type(a, b)
+
+        return np.dtype(object)
+
+    extension = b if isinstance(a, np.dtype) else a
+    common = extension._get_common_dtype([a, b])
+    return np.dtype(object) if common is None else pandas_dtype(common)
+
+
+def _with_missing(dtype: Any) -> Any:
+    """The dtype that holds the values of dtype and missing values"""
+    if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+        return np.dtype(np.float64)
+
+    if isinstance(dtype, np.dtype) and dtype.kind == "b":
+        return np.dtype(object)
+
+    return dtype
+
+
+def _values(column: pd.Series) -> Any:
+    """The numpy array or extension array of a column"""
+    return column.to_numpy() if isinstance(column.dtype, np.dtype) else column.array
+
+
+class _ColumnBuilder:
+    """One output column, filled in place, block after block.
+
+    numpy columns and the codes of categoricals live in a preallocated array.
+    Other extension arrays can not be preallocated, so their blocks are kept and
+    concatenated once at the end.
+    """
+
+    def __init__(self, dtype: Any, capacity: int) -> None:
+        self._init(dtype, capacity)
+
+    def _init(self, dtype: Any, capacity: int) -> None:
+        self.dtype = dtype
+        self.capacity = capacity
+        self.blocks: List[Any] = []
+        self.values: Optional[npt.NDArray[Any]] = None
+        if isinstance(dtype, pd.CategoricalDtype):
+            self.values = np.empty(capacity, dtype=np.int64)
+        elif isinstance(dtype, np.dtype):
+            self.values = np.empty(capacity, dtype=dtype)
+
+    def reserve(self, capacity: int) -> None:
+        self.capacity = capacity
+        if self.values is not None:
+            self.values.resize(capacity, refcheck=False)
+
+    def put(self, start: int, array: Any) -> None:
+        """Write a numpy or extension array to the rows from start"""
+        self._retype(_common_dtype(self.dtype, array.dtype), start)
+
+        stop = start + len(array)
+        values = self.values
+        if values is None:
+            self.blocks.append(
+                pd.array(array, copy=False).astype(self.dtype, copy=False)
+            )
+        elif isinstance(self.dtype, pd.CategoricalDtype):
+            recode = self.dtype.categories.get_indexer(array.categories)
+            codes = array.codes
+            values[start:stop] = np.where(codes < 0, -1, recode[codes])
+        else:
+            values[start:stop] = array.astype(self.dtype, copy=False)
+
+    def put_missing(self, start: int, stop: int) -> None:
+        """Write missing values to the rows from start to stop"""
+        self._retype(_with_missing(self.dtype), start)
+
+        values = self.values
+        if values is None:
+            empty = pd.array([], dtype=self.dtype)
+            self.blocks.append(empty.take(np.full(stop - start, -1), allow_fill=True))
+        elif isinstance(self.dtype, pd.CategoricalDtype):
+            values[start:stop] = -1
+        else:
+            kind = self.dtype.kind
+            values[start:stop] = np.array("NaT", self.dtype) if kind in "mM" else np.nan
+
+    def finish(self, rows: int) -> Any:
+        """The first rows values, as an array"""
+        if self.values is not None:
+            self.values.resize(rows, refcheck=False)
+
+        if isinstance(self.dtype, pd.CategoricalDtype):
+            return pd.Categorical.from_codes(self.values, dtype=self.dtype)
+
+        if self.values is not None:
+            return self.values
+
+        if not self.blocks:
+            return pd.array([], dtype=self.dtype)
+
+        return type(self.blocks[0])._concat_same_type(self.blocks)
+
+    def _retype(self, dtype: Any, rows: int) -> None:
+        """Change the dtype, converting the first rows values"""
+        if dtype == self.dtype:
+            return
+
+        if isinstance(self.dtype, pd.CategoricalDtype) and isinstance(
+            dtype, pd.CategoricalDtype
+        ):
+            # the union only appends categories, the codes so far still hold
+            self.dtype = dtype
+            return
+
+        filled = self.finish(rows)
+        self._init(dtype, self.capacity)
+        if rows:
+            self.put(0, filled)
+
+
+class _RowBuilder:
+    def __init__(self, dtypes: Dict[Hashable, Any], capacity: int) -> None:
+        self.columns = {name: _ColumnBuilder(d, capacity) for name, d in dtypes.items()}
+        self.capacity = capacity
+        self.rows = 0
+        self.index: List[pd.Index] = []
+
+    def append(self, df: DataFrame) -> None:
+        start, stop = self.rows, self.rows + len(df)
+        if stop > self.capacity:
+            capacity = max(stop, 2 * self.capacity)
+            if budget_active():
+                check_memory("bind_rows", capacity * row_bytes(df))
+
+            self.capacity = capacity
+            for column in self.columns.values():
+                column.reserve(capacity)
+
+        for name, column in self.columns.items():
+            if name not in df.columns:
+                column.put_missing(start, stop)
+
+        for (name, _), (_, values) in zip(_dtypes(df), df.items()):
+            if name not in self.columns:
+                self.columns[name] = _ColumnBuilder(values.dtype, self.capacity)
+                if start:
+                    self.columns[name].put_missing(0, start)
+
+            self.columns[name].put(start, _values(values))
+
+        self.index.append(df.index)
+        self.rows = stop
+
+    def finish(self, ignore_index: bool) -> DataFrame:
+        if ignore_index or not self.index:
+            index: pd.Index = pd.RangeIndex(self.rows)
+        else:
+            index = self.index[0].append(self.index[1:])
+
+        data = {name: column.finish(self.rows) for name, column in self.columns.items()}
+        return DataFrame(data, index=index, copy=False)
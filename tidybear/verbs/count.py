@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+from typing import List
+from typing import Union
+
 from pandas import DataFrame
 
+from tidybear.backends import dispatch
+from tidybear.io import is_source
+from tidybear.io import read_source
+from tidybear.io import Source
+from tidybear.profiling import instrument
 from tidybear.selectors import _ColumnList
 from tidybear.utils import get_column_names
 
 
+@instrument
 def count(
-    df: DataFrame,
+    df: Union[DataFrame, Source],
     columns: _ColumnList,
     *,
     sort: bool = False,
@@ -17,8 +26,8 @@ def count(
 
     Parameters
     ----------
-    df : DataFrame
-        The dataframe to use
+    df : DataFrame, path or Scan
+        The dataframe to use. For a file, only the counted columns are read
     columns : str, TidySelectors, or list or str, TidySelectors
         The column(s) to group by.
     sort : bool
@@ -27,10 +36,19 @@ def count(
         What to rename the new column with counts. By default "n" is used.
     """
 
-    groupby_cols = get_column_names(df.columns, columns)
-    counts = df.groupby(groupby_cols).size().rename(name).reset_index()
+    frame: DataFrame
+    groupby_cols: List[str]
+    if is_source(df):
+        frame, (groupby_cols,) = read_source(df, columns)
+    else:
+        frame = df
+        groupby_cols = list(get_column_names(frame, columns))
+
+    counts = dispatch("count", frame, groupby_cols, name)
+    if counts is NotImplemented:
+        counts = frame.groupby(groupby_cols).size().rename(name).reset_index()
 
     if sort:
-        return counts.sort_values(name, ascending=False)
+        return counts.sort_values(name, ascending=False, kind="stable")
     else:
-        return counts.sort_values(columns)
+        return counts.sort_values(groupby_cols)
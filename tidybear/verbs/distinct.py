@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import overload
+from typing import Set
+from typing import Union
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from pandas import DataFrame
+
+from tidybear.memory import budget_active
+from tidybear.memory import check_memory
+from tidybear.memory import frame_bytes
+from tidybear.profiling import instrument
+from tidybear.selectors import _ColumnList
+from tidybear.utils import get_column_names
+
+
+# chunks first, a DataFrame iterates over its labels so it only matches the second
+@overload
+def distinct(
+    df: Iterable[DataFrame],
+    cols: Optional[_ColumnList] = ...,
+    *,
+    keep_all: bool = ...,
+    count: bool = ...,
+    name: str = ...,
+) -> Iterator[DataFrame]:
+    ...
+
+
+@overload
+def distinct(
+    df: DataFrame,
+    cols: Optional[_ColumnList] = ...,
+    *,
+    keep_all: bool = ...,
+    count: bool = ...,
+    name: str = ...,
+) -> DataFrame:
+    ...
+
+
+@instrument
+def distinct(
+    df: Union[DataFrame, Iterable[DataFrame]],
+    cols: Optional[_ColumnList] = None,
+    *,
+    keep_all: bool = False,
+    count: bool = False,
+    name: str = "n",
+) -> Union[DataFrame, Iterator[DataFrame]]:
+    """Keep the first row of every distinct combination of values
+
+    Missing values are treated as equal to each other.
+
+    Parameters
+    ----------
+    df : DataFrame or iterable of DataFrames
+        The dataframe, or chunks of one (e.g. from `pd.read_csv(chunksize=...)`).
+        For chunks, an iterator is returned that yields the rows of each chunk
+        that were not seen in an earlier chunk. Rows across chunks are compared
+        by a 64 bit hash of their values.
+    cols : str, list or selector, optional
+        The columns to compare, by default all of them
+    keep_all : bool, optional
+        Keep all the columns of the first row, not just cols, by default False
+    count : bool, optional
+        Add the number of rows of each combination, by default False.
+        Not available for chunks.
+    name : str, optional
+        The name of the count column, by default "n"
+
+    Returns
+    -------
+    DataFrame or Iterator[DataFrame]
+        The distinct rows, with the index of their first occurrence
+    """
+    if not isinstance(df, DataFrame):
+        if count:
+            raise ValueError("count=True is not available for chunked inputs")
+
+        return _iter_distinct(iter(df), cols, keep_all)
+
+    if budget_active():
+        check_memory("distinct", frame_bytes(df))
+
+    columns = list(df.columns) if cols is None else list(get_column_names(df, cols))
+    codes = _row_codes(df, columns)
+    first = _first_rows(codes)
+
+    keep = slice(None) if keep_all else df.columns.get_indexer_for(columns)
+    result = df.iloc[first, keep]
+    if count:
+        result = result.assign(**{name: np.bincount(codes, minlength=len(first))})
+
+    return result
+
+
+def _row_codes(df: DataFrame, columns: List[str]) -> npt.NDArray[np.int64]:
+    """Number each row by its combination of values, in order of first appearance.
+
+    Every column is factorized with a hash table, and the codes are combined into
+    one int64 key that is factorized again. No sorting is involved. The key is
+    compressed early whenever the next column could overflow it.
+    """
+    key = np.zeros(len(df), dtype=np.int64)
+    n_keys = 1
+    for column in columns:
+        codes, uniques = pd.factorize(df[column], use_na_sentinel=False)
+        if n_keys * len(uniques) > np.iinfo(np.int64).max:
+            key, uniques_so_far = pd.factorize(key)
+            n_keys = len(uniques_so_far)
+
+        key = key * len(uniques) + codes
+        n_keys *= len(uniques)
+
+    if len(columns) == 1:
+        return key
+
+    return pd.factorize(key)[0]
+
+
+def _first_rows(codes: npt.NDArray[np.int64]) -> npt.NDArray[np.intp]:
+    """Position of the first row of each code, for codes in order of first appearance"""
+    if len(codes) == 0:
+        return np.zeros(0, dtype=np.intp)
+
+    new = np.empty(len(codes), dtype=bool)
+    new[0] = True
+    new[1:] = codes[1:] > np.maximum.accumulate(codes)[:-1]
+    return np.flatnonzero(new)
+
+
+def _iter_distinct(
+    chunks: Iterator[DataFrame], cols: Optional[_ColumnList], keep_all: bool
+) -> Iterator[DataFrame]:
+    seen: Set[int] = set()
+    for chunk in chunks:
+        columns = list(chunk.columns) if cols is None else get_column_names(chunk, cols)
+        hashes = pd.util.hash_pandas_object(chunk[columns], index=False).to_numpy()
+
+        first = _first_rows(pd.factorize(hashes)[0])
+        new = [i for i, h in zip(first, hashes[first].tolist()) if h not in seen]
+        seen.update(hashes[new].tolist())
+
+        keep = slice(None) if keep_all else chunk.columns.get_indexer_for(columns)
+        yield chunk.iloc[new, keep]
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import sys
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from pandas import DataFrame
+
+from tidybear.memory import budget_active
+from tidybear.memory import check_memory
+from tidybear.memory import frame_bytes
+from tidybear import profiling
+from tidybear.profiling import instrument
+from tidybear.selectors import _ColumnList
+from tidybear.utils import get_column_names
+from tidybear.verbs.mutate import _GroupedFrame
+from tidybear.verbs.mutate import _ungrouped
+
+_Predicate = Union[str, Callable[..., Any]]
+
+
+@instrument
+def filter(
+    df: DataFrame,
+    *predicates: _Predicate,
+    groupby: Optional[_ColumnList] = None,
+) -> DataFrame:
+    """Keep the rows where every predicate is true
+
+    ```python
+    tb.filter(df, "price > 100 and qty >= 2", lambda x: x.country.isin(["DE", "FR"]))
+    tb.filter(df, lambda x: x.n() > 10, groupby="user")
+    ```
+
+    Parameters
+    ----------
+    df : DataFrame
+    *predicates : str or function
+        Expression strings are evaluated on the rows with DataFrame.eval, which
+        uses numexpr when it is installed. Like DataFrame.query, they can refer
+        to variables of the calling code with @, e.g. "price > @limit".
+        Functions are called once with the whole frame and return a boolean
+        Series, which is aligned on the index like a pandas boolean indexer. All
+        predicates are combined into one mask before any row is copied, and rows
+        where a predicate is missing are dropped.
+    groupby : str, list or selector, optional
+        Group by these columns. Functions are then called with the grouped frame,
+        whose column aggregates (mean, sum, max, ...) and n() are the group values
+        of each row, see `mutate`. By default None
+
+    Returns
+    -------
+    DataFrame
+        The kept rows, with their index
+    """
+    if budget_active():
+        check_memory("filter", frame_bytes(df))
+
+    grouped = None
+    if groupby is not None:
+        grouped = _GroupedFrame(df, get_column_names(df, groupby))
+
+    local_dict, global_dict = _caller_scope()
+
+    mask = np.ones(len(df), dtype=bool)
+    for predicate in predicates:
+        if isinstance(predicate, str):
+            result = df.eval(predicate, local_dict=local_dict, global_dict=global_dict)
+        else:
+            result = _ungrouped(predicate(df if grouped is None else grouped))
+
+        mask &= _as_mask(result, df.index)
+
+    if mask.all():
+        return df.copy()
+
+    return df.iloc[np.flatnonzero(mask)]
+
+
+def _caller_scope() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """The locals and globals of the code that called filter, skipping the frames
+    of the profiling wrapper"""
+    frame = sys._getframe(2)
+    while (
+        frame.f_back is not None and frame.f_globals["__name__"] == profiling.__name__
+    ):
+        frame = frame.f_back
+
+    try:
+        return frame.f_locals, frame.f_globals
+    finally:
+        del frame
+
+
+def _as_mask(result: Any, index: pd.Index) -> npt.NDArray[np.bool_]:
+    """A boolean numpy mask over the rows of index, with missing values as False
+
+    A Series is aligned on the index like boolean indexing in pandas, and must
+    have a label for every row.
+    """
+    if np.ndim(result) == 0:
+        return np.full(len(index), bool(result))
+
+    if isinstance(result, pd.Series) and not result.index.equals(index):
+        if not result.index.is_unique or not index.isin(result.index).all():
+            raise ValueError("A boolean Series predicate must have the frame's index")
+        result = result.reindex(index)
+
+    if isinstance(result, (pd.Series, pd.Index)):
+        return result.to_numpy(dtype=bool, na_value=False)
+
+    return np.asarray(pd.array(result, dtype="boolean").fillna(False), dtype=bool)
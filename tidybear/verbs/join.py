@@ -4,6 +4,12 @@ from typing import List
 import pandas as pd
 from pandas import DataFrame
 
+from tidybear.backends import dispatch
+from tidybear.memory import budget_active
+from tidybear.memory import check_memory
+from tidybear.memory import row_bytes
+from tidybear.profiling import instrument
+
 
 def join(
     left: pd.DataFrame,
@@ -54,6 +60,15 @@ def join(
         left_on.extend(kwargs.keys())
         right_on.extend(kwargs.values())
 
+    if budget_active():
+        rows = _join_rows(left, right, how, left_on, right_on)
+        check_memory(f"{how}_join", rows * (row_bytes(left) + row_bytes(right)))
+
+    if left_on == right_on:
+        result = dispatch("join", left, right, how, left_on)
+        if result is not NotImplemented:
+            return result
+
     return left.merge(
         right,
         how=how,
@@ -62,6 +77,30 @@ def join(
     )
 
 
+def _join_rows(
+    left: DataFrame, right: DataFrame, how: str, left_on: List[str], right_on: List[str]
+) -> int:
+    """Count the rows a join will return, from the key counts on each side"""
+    if not left_on:
+        left_on = right_on = [c for c in left.columns if c in set(right.columns)]
+
+    left_counts = left.groupby(left_on, dropna=False).size()
+    right_counts = right.groupby(right_on, dropna=False).size()
+    left_counts.index.names = right_counts.index.names = range(len(left_on))
+
+    counts = pd.concat([left_counts, right_counts], axis=1, keys=["l", "r"])
+    counts = counts.fillna(0)
+
+    rows = (counts.l * counts.r).sum()
+    if how in ("left", "outer"):
+        rows += counts.l[counts.r == 0].sum()
+    if how in ("right", "outer"):
+        rows += counts.r[counts.l == 0].sum()
+
+    return int(rows)
+
+
+@instrument
 def inner_join(
     left: DataFrame, right: DataFrame, *args: Any, **kwargs: str
 ) -> DataFrame:
@@ -88,6 +127,7 @@ def inner_join(
     return join(left, right, "inner", *args, **kwargs)
 
 
+@instrument
 def left_join(
     left: DataFrame, right: DataFrame, *args: Any, **kwargs: str
 ) -> DataFrame:
@@ -114,6 +154,7 @@ def left_join(
     return join(left, right, "left", *args, **kwargs)
 
 
+@instrument
 def right_join(
     left: DataFrame, right: DataFrame, *args: Any, **kwargs: str
 ) -> DataFrame:
@@ -140,6 +181,7 @@ def right_join(
     return join(left, right, "right", *args, **kwargs)
 
 
+@instrument
 def outer_join(
     left: DataFrame, right: DataFrame, *args: Any, **kwargs: str
 ) -> DataFrame:
@@ -166,6 +208,7 @@ def outer_join(
     return join(left, right, "outer", *args, **kwargs)
 
 
+@instrument
 def cross_join(left: DataFrame, right: DataFrame) -> DataFrame:
     """Cross join two dataframes
 
@@ -177,4 +220,8 @@ def cross_join(left: DataFrame, right: DataFrame) -> DataFrame:
         The right dataframe to join
     """
 
+    if budget_active():
+        rows = len(left) * len(right)
+        check_memory("cross_join", rows * (row_bytes(left) + row_bytes(right)))
+
     return left.merge(right, how="cross")
@@ -1,19 +1,131 @@
+from __future__ import annotations
+
+import inspect
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing import shared_memory
+from importlib import import_module
 from typing import Any
 from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
 
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
 from pandas import DataFrame
 
+from tidybear.memory import budget_active
+from tidybear.memory import check_memory
+from tidybear.memory import frame_bytes
+from tidybear.profiling import instrument
+from tidybear.selectors import _ColumnList
+from tidybear.selectors import TidySelector
+from tidybear.utils import get_column_names
+from tidybear.utils import uses_arrow
+
+# SeriesGroupBy methods a grouped column computes per group, by transform function.
+# agg and transform take the function as their first argument.
+_GROUP_METHODS: Dict[str, Optional[str]] = {
+    **{
+        func: func
+        for func in (
+            "all",
+            "any",
+            "count",
+            "first",
+            "idxmax",
+            "idxmin",
+            "last",
+            "max",
+            "mean",
+            "median",
+            "min",
+            "nunique",
+            "prod",
+            "quantile",
+            "sem",
+            "skew",
+            "std",
+            "sum",
+            "var",
+            "bfill",
+            "cummax",
+            "cummin",
+            "cumprod",
+            "cumsum",
+            "diff",
+            "ffill",
+            "pct_change",
+            "rank",
+            "shift",
+        )
+    },
+    "agg": None,
+    "aggregate": None,
+    "transform": None,
+}
+
+# The definitions and columns of a parallel mutate, only set in its worker processes.
+# Shared columns are arrays over _WORKER_MEMORY, the others are None.
+_WORKER_DEFINITIONS: Dict[str, Callable[..., Any]] = {}
+_WORKER_COLUMNS: List[Tuple[Hashable, Optional[npt.NDArray[Any]]]] = []
+_WORKER_MEMORY: List[shared_memory.SharedMemory] = []
 
-def mutate(df: DataFrame, **kwargs: Callable[..., Any]) -> DataFrame:
+
+@instrument
+def mutate(
+    df: DataFrame,
+    *,
+    groupby: Optional[_ColumnList] = None,
+    n_jobs: Optional[int] = None,
+    engine: str = "python",
+    **kwargs: Callable[..., Any],
+) -> DataFrame:
     """Create a new column in a dataframe using applied functions
 
     ```python
     tb.mutate(df, col_squared=lambda x: x.col**2)
+    tb.mutate(df, groupby="g", demeaned=lambda x: x.col - x.col.mean())
+    tb.mutate(df, engine="numba", total=lambda price, qty: price * qty)
     ```
 
+    groupby, n_jobs and engine are options, not column names. To create a column
+    with one of those names, mutate under another name and rename it.
+
     Parameters
     ----------
     df : DataFrame
+    groupby : str, list or selector, optional
+        Group by these columns. Each definition is then called once with the whole
+        frame, and aggregates of its columns (mean, sum, quantile, agg, ...) are the
+        group values broadcast back to the rows, with the arguments of their
+        SeriesGroupBy method. Window functions (cumsum, rank, shift, ...) run within
+        each group, by default None
+    n_jobs : int, optional
+        Number of processes to run row-wise definitions in, -1 for one per CPU.
+        The rows are split into chunks, and every chunk runs all definitions in
+        order. Workers are started with forkserver (spawn where it is not
+        available), so scripts need an `if __name__ == "__main__":` guard. Each
+        worker is sent the definitions once, and reads numeric columns from
+        shared memory, only the other columns of its chunks are pickled. Definitions
+        can be lambdas when cloudpickle is installed, otherwise they must be
+        picklable. Can not be combined with groupby, by default None
+    engine : str, optional
+        "python" calls definitions with each row. "numba" compiles definitions
+        into ufuncs that run over the column arrays, called with the values of
+        the columns named by their arguments. Compiled definitions are cached on
+        disk when they are defined in a file. Numba definitions need numeric,
+        boolean or datetime columns and can not be grouped or run with n_jobs,
+        by default "python"
     new_name : str
         the name of the new column to create
     definition : function
@@ -24,9 +136,356 @@ def mutate(df: DataFrame, **kwargs: Callable[..., Any]) -> DataFrame:
     DataFrame
     """
 
+    _check_options(groupby=groupby, n_jobs=n_jobs, engine=engine)
+
+    if engine not in ("python", "numba"):
+        raise ValueError(f"engine must be 'python' or 'numba', got {engine}")
+
+    if groupby is not None and n_jobs is not None:
+        raise ValueError("n_jobs is for row-wise definitions, it can not be grouped")
+
+    if engine == "numba" and (groupby is not None or n_jobs is not None):
+        raise ValueError("engine='numba' can not be combined with groupby or n_jobs")
+
+    workers = _workers(n_jobs, len(df))
+
+    if budget_active():
+        check_memory("mutate", frame_bytes(df) + len(df) * 8 * len(kwargs))
+
     df = df.copy()
 
-    for name, definition in kwargs.items():
-        df[name] = df.apply(definition, axis=1)
+    if groupby is not None:
+        grouped = _GroupedFrame(df, get_column_names(df, groupby))
+        for name, definition in kwargs.items():
+            df[name] = _ungrouped(definition(grouped))
+            grouped._evict(name)
+
+        return df
+
+    if engine == "numba":
+        _apply_numba(df, kwargs)
+        return df
+
+    if workers == 1:
+        _apply_rows(df, kwargs)
+        return df
+
+    columns = _apply_rows_parallel(df, kwargs, workers)
+    for name in kwargs:
+        df[name] = columns[name].array
 
     return df
+
+
+def _check_options(**options: Any) -> None:
+    """Reject definitions that were passed under the name of an option"""
+    for option, value in options.items():
+        if callable(value) and not isinstance(value, TidySelector):
+            raise TypeError(
+                f"{option} is an option of mutate, not a column name. Create the "
+                f"column under another name and rename it"
+            )
+
+
+def _apply_rows(df: DataFrame, definitions: Dict[str, Callable[..., Any]]) -> None:
+    """Add the columns of row-wise definitions to df, in order"""
+    arrow = uses_arrow(df)
+    for name, definition in definitions.items():
+        column = df.apply(definition, axis=1)
+        # the rows are object Series, bring the results back to Arrow dtypes
+        df[name] = column.convert_dtypes(dtype_backend="pyarrow") if arrow else column
+
+
+def _apply_numba(df: DataFrame, definitions: Dict[str, Callable[..., Any]]) -> None:
+    """Add the columns of numba compiled definitions to df, in order"""
+    arrow = uses_arrow(df)
+    for name, definition in definitions.items():
+        ufunc, arguments = _compile(definition)
+        missing = [a for a in arguments if a not in df.columns]
+        if missing:
+            raise KeyError(f"{name} uses columns that are not in the frame: {missing}")
+
+        column = pd.Series(ufunc(*(_numba_array(df[a]) for a in arguments)), df.index)
+        if arrow:
+            # keep the ufunc's dtype, only turn NaN into missing values
+            column = column.convert_dtypes(
+                dtype_backend="pyarrow", convert_integer=False
+            )
+
+        df[name] = column
+
+
+@lru_cache(maxsize=256)
+def _compile(definition: Callable[..., Any]) -> Tuple[Any, List[str]]:
+    """A lazily compiled ufunc of a definition, and the columns it is called with"""
+    try:
+        numba = import_module("numba")
+    except ImportError as e:
+        raise ImportError("engine='numba' needs numba, which is not installed") from e
+
+    # a function that is already jitted is compiled again from its python source
+    function = getattr(definition, "py_func", definition)
+    arguments = list(inspect.signature(function).parameters)
+
+    # numba can only cache functions it can find the source file of
+    cache = os.path.isfile(function.__code__.co_filename)
+    return numba.vectorize(cache=cache)(function), arguments
+
+
+def _numba_array(column: pd.Series) -> npt.NDArray[Any]:
+    """The numpy values of a column, with missing values as NaN or NaT"""
+    if column.dtype.kind not in "biufmM":
+        raise TypeError(
+            f"engine='numba' needs numeric, boolean or datetime columns, "
+            f"{column.name} is {column.dtype}"
+        )
+
+    if isinstance(column.dtype, np.dtype):
+        return column.to_numpy()
+
+    if column.hasnans:
+        return column.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    return column.to_numpy(dtype=column.dtype.numpy_dtype)
+
+
+def _workers(n_jobs: Optional[int], rows: int) -> int:
+    """Number of processes to use, 1 to stay in this process"""
+    if n_jobs is None:
+        return 1
+
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    elif n_jobs < 1:
+        raise ValueError(f"n_jobs must be a positive number or -1, got {n_jobs}")
+
+    return max(1, min(n_jobs, rows))
+
+
+def _apply_rows_parallel(
+    df: DataFrame, definitions: Dict[str, Callable[..., Any]], workers: int
+) -> DataFrame:
+    """The new columns of row-wise definitions, computed on chunks of rows.
+
+    Numeric columns are copied once into shared memory that every worker maps,
+    only the other (object and extension) columns of each chunk are pickled.
+    """
+    # a few chunks per worker, so one slow chunk does not hold up the rest
+    bounds = np.linspace(0, len(df), min(len(df), workers * 4) + 1).astype(int)
+    starts, stops = bounds[:-1].tolist(), bounds[1:].tolist()
+
+    shared = [
+        isinstance(dtype, np.dtype) and dtype.kind in "biufcmM" for dtype in df.dtypes
+    ]
+    pickled = df.iloc[:, [i for i, is_shared in enumerate(shared) if not is_shared]]
+    chunks = (pickled.iloc[start:stop] for start, stop in zip(starts, stops))
+
+    # fork is unsafe once threads are running, and is not available everywhere
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+
+    blocks: List[shared_memory.SharedMemory] = []
+    try:
+        layout: List[Tuple[Hashable, Optional[Tuple[str, str]]]] = []
+        for i, name in enumerate(df.columns):
+            if not shared[i]:
+                layout.append((name, None))
+                continue
+
+            values = df.iloc[:, i].to_numpy()
+            block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+            blocks.append(block)
+            np.ndarray(values.shape, values.dtype, buffer=block.buf)[:] = values
+            layout.append((name, (block.name, values.dtype.str)))
+
+        with ProcessPoolExecutor(
+            workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(_dump_definitions(definitions), layout, len(df)),
+        ) as pool:
+            return pd.concat(
+                pool.map(_apply_chunk, starts, stops, chunks), ignore_index=True
+            )
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def _dump_definitions(definitions: Dict[str, Callable[..., Any]]) -> bytes:
+    """The pickled definitions, with cloudpickle when it is installed"""
+    try:
+        dumps = import_module("cloudpickle").dumps
+    except ImportError:
+        dumps = pickle.dumps
+
+    try:
+        return dumps(definitions)
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        raise TypeError(
+            "n_jobs sends the definitions to other processes, so they must be "
+            "picklable. Install cloudpickle to use lambdas and local functions"
+        ) from e
+
+
+def _init_worker(
+    definitions: bytes,
+    layout: List[Tuple[Hashable, Optional[Tuple[str, str]]]],
+    rows: int,
+) -> None:
+    """Run once in every worker, before its first chunk. Maps the shared columns"""
+    _WORKER_DEFINITIONS.update(pickle.loads(definitions))
+    for name, location in layout:
+        if location is None:
+            _WORKER_COLUMNS.append((name, None))
+            continue
+
+        block = shared_memory.SharedMemory(name=location[0])
+        _WORKER_MEMORY.append(block)
+        values: npt.NDArray[Any] = np.ndarray(
+            (rows,), np.dtype(location[1]), buffer=block.buf
+        )
+        _WORKER_COLUMNS.append((name, values))
+
+
+def _apply_chunk(start: int, stop: int, pickled: DataFrame) -> DataFrame:
+    """Run in a worker, the new columns of rows start:stop.
+
+    The chunk is put back together from the shared columns and the pickled ones,
+    in the order of the original frame.
+    """
+    others = iter(range(pickled.shape[1]))
+    columns = [
+        pickled.iloc[:, next(others)]
+        if values is None
+        else pd.Series(values[start:stop], index=pickled.index, name=name)
+        for name, values in _WORKER_COLUMNS
+    ]
+    chunk = pd.concat(columns, axis=1) if columns else pickled.copy()
+    _apply_rows(chunk, _WORKER_DEFINITIONS)
+    return chunk[list(_WORKER_DEFINITIONS)]
+
+
+class _GroupedFrame:
+    """What grouped mutate definitions and filter predicates are called with.
+
+    Columns are `_GroupedColumn`s, whose aggregates are computed with `transform` on
+    group codes shared by every definition, so no join back onto the rows is needed.
+    Aggregates without arguments are cached until the column is overwritten.
+    """
+
+    def __init__(self, df: DataFrame, groups: Sequence[str]) -> None:
+        self._df = df
+        self._codes = df.groupby(groups, sort=False, dropna=False).ngroup().to_numpy()
+        self._cache: Dict[Tuple[Hashable, str], pd.Series] = {}
+
+    def __getitem__(self, key: Hashable) -> _GroupedColumn:
+        return _GroupedColumn(self, key)
+
+    def __getattr__(self, name: str) -> _GroupedColumn:
+        if not name.startswith("_") and name in self._df.columns:
+            return self[name]
+
+        raise AttributeError(name)
+
+    def __len__(self) -> int:
+        return len(self._df)
+
+    def n(self) -> pd.Series:
+        """Get the number of rows in each row's group"""
+        sizes = np.bincount(self._codes)
+        return pd.Series(sizes[self._codes], index=self._df.index)
+
+    def _transform(self, key: Hashable, func: Any, *args: Any, **kwargs: Any) -> Any:
+        """The group values of a column for each row, from SeriesGroupBy.transform"""
+        cached = isinstance(func, str) and not args and not kwargs
+        if cached and (key, func) in self._cache:
+            return self._cache[key, func]
+
+        grouped = self._df[key].groupby(self._codes)
+        try:
+            result = grouped.transform(func, *args, **kwargs)
+        except TypeError:
+            if not isinstance(func, str) or not (args or kwargs):
+                raise
+
+            # options only the Series method has, e.g. mean(skipna=False)
+            result = grouped.transform(
+                lambda group: getattr(group, func)(*args, **kwargs)
+            )
+
+        if cached:
+            self._cache[key, func] = result
+
+        return result
+
+    def _evict(self, key: Hashable) -> None:
+        for cached in [k for k in self._cache if k[0] == key]:
+            del self._cache[cached]
+
+
+class _GroupedColumn(np.lib.mixins.NDArrayOperatorsMixin):
+    """A column of a `_GroupedFrame`.
+
+    Aggregates (mean, sum, quantile, agg, ...) and window functions (cumsum, rank,
+    shift, ...) are computed per group and take the arguments of their
+    SeriesGroupBy method. Everything else, operators included, is the plain
+    column, so `(x.a - x.a.mean()).mean()` is the overall mean again.
+    """
+
+    # pandas defers operators with a column to this class, see __array_ufunc__
+    __pandas_priority__ = 3500
+
+    def __init__(self, frame: _GroupedFrame, key: Hashable) -> None:
+        self._frame = frame
+        self._key = key
+
+    @property
+    def _series(self) -> pd.Series:
+        return self._frame._df[self._key]
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        if name in _GROUP_METHODS:
+            func = _GROUP_METHODS[name]
+
+            def method(*args: Any, **kwargs: Any) -> Any:
+                if func is None:
+                    return self._frame._transform(self._key, *args, **kwargs)
+                return self._frame._transform(self._key, func, *args, **kwargs)
+
+            method.__name__ = name
+            return method
+
+        return getattr(self._series, name)
+
+    def __array_ufunc__(
+        self, ufunc: np.ufunc, method: str, *inputs: Any, **kwargs: Any
+    ) -> Any:
+        inputs = tuple(_ungrouped(value) for value in inputs)
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def __array__(self, dtype: Any = None) -> npt.NDArray[Any]:
+        return np.asarray(self._series, dtype=dtype)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._series[_ungrouped(key)]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._series)
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def __repr__(self) -> str:
+        return repr(self._series)
+
+
+def _ungrouped(value: Any) -> Any:
+    """The plain column of a `_GroupedColumn`, anything else as it is"""
+    return value._series if isinstance(value, _GroupedColumn) else value
@@ -1,14 +1,27 @@
 from typing import Any
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import overload
 from typing import Union
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
+from pandas.api.extensions import take
 
+from tidybear.memory import budget_active
+from tidybear.memory import check_memory
+from tidybear.memory import column_bytes
+from tidybear.memory import frame_bytes
+from tidybear.profiling import instrument
 from tidybear.selectors import _ColumnList
 from tidybear.utils import get_column_names
+from tidybear.utils import uses_arrow
 
 
+@instrument
 def pivot_wider(
     df: pd.DataFrame,
     *,
@@ -50,19 +63,81 @@ def pivot_wider(
         values_from = [values_from]
 
     index_cols = [c for c in df.columns if c not in [names_from, *values_from]]
-    df = df.pivot(index=index_cols, columns=names_from, values=values_from)
 
-    if len(values_from) == 1 and not prefix_names:
-        df.columns = [name for _, name in df.columns.to_flat_index()]
-    else:
-        df.columns = [f"{value}_{name}" for value, name in df.columns.to_flat_index()]
+    if budget_active():
+        check_memory(
+            "pivot_wider", _wider_bytes(df, index_cols, names_from, len(values_from))
+        )
+
+    rows, first_rows = _row_codes(df, index_cols)
+    names, labels = _sorted_codes(df[names_from])
+
+    cells = rows * len(labels) + names
+    if len(np.unique(cells)) < len(cells):
+        raise ValueError("Index contains duplicate entries, cannot reshape")
+
+    # position of the long row filling each (wide row, name) cell, -1 if missing
+    positions = np.full((len(first_rows), len(labels)), -1, dtype=np.intp)
+    positions[rows, names] = np.arange(len(df))
+
+    wide = {c: _take(df[c], first_rows) for c in index_cols}
+    # like DataFrame.pivot, numpy value columns share one dtype, which can hold
+    # missing values if any cell is missing. Arrow-backed columns keep their own.
+    common = None
+    if all(isinstance(dtype, np.dtype) for dtype in df[values_from].dtypes):
+        common = df[values_from].iloc[:0].to_numpy().dtype
+        if (positions == -1).any():
+            common = take(np.empty(0, common), np.array([-1]), allow_fill=True).dtype
+
+    for value in values_from:
+        values = df[value] if common is None else df[value].astype(common)
+
+        for j, name in enumerate(labels.tolist()):
+            if len(values_from) == 1 and not prefix_names:
+                column = name
+            else:
+                column = f"{value}_{name}"
+            wide[column] = _take(values, positions[:, j])
+
+    df = pd.DataFrame(wide)
 
     if fill_value is not None:
         df = df.fillna(fill_value)
 
-    return df.reset_index()
+    return df
+
+
+@overload
+def pivot_longer(
+    df: pd.DataFrame,
+    cols: _ColumnList,
+    *,
+    names_to: str = ...,
+    values_to: str = ...,
+    drop_na: bool = ...,
+    cols_are_index: bool = ...,
+    chunksize: None = ...,
+    chunk_by: str = ...,
+) -> pd.DataFrame:
+    ...
 
 
+@overload
+def pivot_longer(
+    df: pd.DataFrame,
+    cols: _ColumnList,
+    *,
+    names_to: str = ...,
+    values_to: str = ...,
+    drop_na: bool = ...,
+    cols_are_index: bool = ...,
+    chunksize: int,
+    chunk_by: str = ...,
+) -> Iterator[pd.DataFrame]:
+    ...
+
+
+@instrument
 def pivot_longer(
     df: pd.DataFrame,
     cols: _ColumnList,
@@ -71,7 +146,9 @@ def pivot_longer(
     values_to: str = "value",
     drop_na: bool = True,
     cols_are_index: bool = False,
-) -> pd.DataFrame:
+    chunksize: Optional[int] = None,
+    chunk_by: str = "rows",
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """
     Transform a dataframe from wide to long
 
@@ -89,6 +166,13 @@ def pivot_longer(
         Whether to drop rows with missing values, default True
     cols_are_index : bool, optional
         Whether the columns are the index or the columns to pivot on, default False
+    chunksize : int, optional
+        If given, return an iterator of long format chunks instead of a single
+        dataframe. Only one chunk is held in memory at a time, by default None
+    chunk_by : str, optional
+        How to split the dataframe when chunksize is given. "rows" pivots
+        chunksize rows at a time, "columns" pivots chunksize value columns
+        at a time, by default "rows"
 
     Examples
     --------
@@ -101,26 +185,178 @@ def pivot_longer(
     2    2    a      2
     3    2    b      2
 
+    >>> for chunk in pivot_longer(df, ["a", "b"], chunksize=1):
+    ...     chunk.to_csv("long.csv", mode="a", header=False)
+
     Returns
     -------
-    pandas.DataFrame
-        The transformed dataframe
+    pandas.DataFrame or Iterator[pandas.DataFrame]
+        The transformed dataframe, or an iterator of chunks if chunksize is given
     """
 
-    df = df.copy()
+    columns = get_column_names(df, cols)
+    if cols_are_index:
+        index_columns = list(columns)
+    else:
+        selected = set(columns)
+        index_columns = [c for c in df.columns if c not in selected]
+
+    if budget_active():
+        rows, values = df.shape[0], df.shape[1] - len(index_columns)
+        if chunksize is not None and chunk_by == "rows":
+            rows = min(rows, chunksize)
+        if chunksize is not None and chunk_by == "columns":
+            values = min(values, chunksize)
+
+        check_memory(
+            "pivot_longer",
+            _longer_bytes(df, index_columns, rows, values),
+            "Pass chunksize= to pivot in chunks."
+            if chunksize is None
+            else "Use a smaller chunksize.",
+        )
+
+    if chunksize is None:
+        return _stack_longer(df, index_columns, names_to, values_to, drop_na)
 
-    columns = get_column_names(df.columns, cols)
-    index_columns = (
-        columns if cols_are_index else [c for c in df.columns if c not in columns]
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be a positive integer, got {chunksize}")
+
+    if chunk_by not in ("rows", "columns"):
+        raise ValueError(f"chunk_by must be 'rows' or 'columns', got '{chunk_by}'")
+
+    return _iter_longer(
+        df, index_columns, names_to, values_to, drop_na, chunksize, chunk_by
     )
 
-    if len(index_columns) > 0:
-        df.set_index(index_columns, inplace=True)
 
-    df = df.stack(dropna=False).reset_index()
-    df.columns = [*index_columns, names_to, values_to]
+def _wider_bytes(
+    df: pd.DataFrame, index_cols: List[str], names_from: str, n_values: int
+) -> float:
+    """Estimate the memory of pivot_wider: a copy of df plus the wide output"""
+    if len(df) == 0:
+        return 0
+
+    n_names = max(df[names_from].nunique(), 1)
+    index_row_bytes = column_bytes(df)[index_cols].sum() / len(df)
+    wide_rows = max(len(df) // n_names, 1)
 
+    return frame_bytes(df) + wide_rows * (index_row_bytes + n_names * n_values * 8)
+
+
+def _longer_bytes(
+    df: pd.DataFrame, index_columns: List[str], rows: int, n_values: int
+) -> float:
+    """Estimate the memory of pivot_longer for rows rows and n_values value columns
+
+    Each long row holds the index columns, a name, a value and a row label.
+    """
+    if len(df) == 0:
+        return 0
+
+    index_row_bytes = column_bytes(df)[index_columns].sum() / len(df)
+    return rows * n_values * (index_row_bytes + 24)
+
+
+def _row_codes(
+    df: pd.DataFrame, columns: List[str]
+) -> Tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """Number the distinct rows of columns in sorted order, missing values first.
+
+    Returns the number of every row, and the position of the first row of each.
+    """
+    if not columns:
+        return np.zeros(len(df), dtype=np.intp), np.zeros(min(len(df), 1), np.intp)
+
+    keys = np.column_stack([_sorted_codes(df[c])[0] for c in columns])
+    _, first_rows, codes = np.unique(
+        keys, axis=0, return_index=True, return_inverse=True
+    )
+    return codes.reshape(-1), first_rows
+
+
+def _sorted_codes(values: pd.Series) -> Tuple[npt.NDArray[np.intp], pd.Index]:
+    """Factorize values in sorted order with missing values first, like DataFrame.pivot"""
+    codes, labels = pd.factorize(values, sort=True)
+    if (codes < 0).any():
+        codes = codes + 1
+        labels = labels.insert(0, np.nan)
+
+    return codes, labels
+
+
+def _take(values: pd.Series, positions: npt.NDArray[np.intp]) -> pd.Series:
+    """Take values by position, missing where the position is -1.
+
+    The values keep their dtype, including Arrow-backed dtypes, unless a missing
+    value needs a wider one (e.g. int64 to float64).
+    """
+    array = values.to_numpy() if isinstance(values.dtype, np.dtype) else values.array
+    return pd.Series(take(array, positions, allow_fill=True), name=values.name)
+
+
+def _stack_longer(
+    df: pd.DataFrame,
+    index_columns: List[str],
+    names_to: str,
+    values_to: str,
+    drop_na: bool,
+) -> pd.DataFrame:
+    """Stack the value columns into rows, one long row per (row, value column)
+
+    Columns are taken by position instead of going through DataFrame.stack, so
+    the index and value columns keep their dtypes (including Arrow-backed ones).
+    An index column named like names_to or values_to is kept next to it.
+    """
+    index_set = set(index_columns)
+    value_columns = [c for c in df.columns if c not in index_set]
+    n_rows, n_values = len(df), len(value_columns)
+
+    rows = np.repeat(np.arange(n_rows), n_values)
+    long = [_take(df[c], rows) for c in index_columns]
+
+    names = pd.Index(value_columns).take(np.tile(np.arange(n_values), n_rows))
+    if uses_arrow(df) and all(isinstance(c, str) for c in value_columns):
+        names = pd.array(names, dtype="string[pyarrow]")
+    long.append(pd.Series(names))
+
+    stacked = pd.concat(
+        [df.iloc[:, i] for i in range(df.shape[1]) if df.columns[i] not in index_set],
+        ignore_index=True,
+    )
+    # stacked is column by column, reorder it row by row
+    order = (np.arange(n_rows)[:, None] + np.arange(n_values)[None, :] * n_rows).ravel()
+    values = _take(stacked, order)
+    long.append(values)
+
+    # built by position, so the names may repeat
+    df = pd.DataFrame(dict(enumerate(long)))
+    df.columns = [*index_columns, names_to, values_to]
     if drop_na:
-        df = df.dropna(subset=[values_to])
+        df = df[values.notna().to_numpy()]
 
     return df
+
+
+def _iter_longer(
+    df: pd.DataFrame,
+    index_columns: List[str],
+    names_to: str,
+    values_to: str,
+    drop_na: bool,
+    chunksize: int,
+    chunk_by: str,
+) -> Iterator[pd.DataFrame]:
+    if chunk_by == "rows":
+        for start in range(0, df.shape[0], chunksize):
+            stop = start + chunksize
+            chunk = df.iloc[start:stop]
+            yield _stack_longer(chunk, index_columns, names_to, values_to, drop_na)
+        return
+
+    index_set = set(index_columns)
+    value_columns = [c for c in df.columns if c not in index_set]
+    for start in range(0, len(value_columns), chunksize):
+        stop = start + chunksize
+        chunk = df.loc[:, [*index_columns, *value_columns[start:stop]]]
+        yield _stack_longer(chunk, index_columns, names_to, values_to, drop_na)
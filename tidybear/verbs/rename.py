@@ -1,8 +1,17 @@
 from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Mapping
+from typing import Optional
 
 from pandas import DataFrame
 
+from tidybear.profiling import instrument
+from tidybear.selectors import _ColumnList
+from tidybear.utils import get_column_names
 
+
+@instrument
 def rename(df: DataFrame, *args: Any, **kwargs: Any) -> DataFrame:
     """Rename the columns of a dataframe
 
@@ -18,6 +27,9 @@ def rename(df: DataFrame, *args: Any, **kwargs: Any) -> DataFrame:
     - Use keyword arguments with the key as existing column names
       and values as the new columns names.
 
+    Only the column labels change, the returned dataframe shares its data
+    with df (a shallow copy).
+
     Parameters
     ----------
     df : DataFrame
@@ -56,12 +68,11 @@ def rename(df: DataFrame, *args: Any, **kwargs: Any) -> DataFrame:
     1  2  4
     ```
     """
-    df = df.copy()
     if len(kwargs) > 0:
-        return df.rename(columns=kwargs)
+        return _rename_columns(df, kwargs)
 
     if len(args) == 1 and isinstance(args[0], dict):
-        return df.rename(columns=args[0])
+        return _rename_columns(df, args[0])
 
     if len(args) >= 1:
         new_cols = args[0] if isinstance(args[0], list) else list(args)
@@ -71,7 +82,57 @@ def rename(df: DataFrame, *args: Any, **kwargs: Any) -> DataFrame:
             f"does not match the number of features in the dataframe ({df.shape[1]})."
         )
 
-        df.columns = new_cols
-        return df
+        return _set_columns(df, new_cols)
+
+    return df.copy(deep=False)
+
+
+@instrument
+def rename_with(
+    df: DataFrame,
+    func: Callable[[Any], Hashable],
+    cols: Optional[_ColumnList] = None,
+) -> DataFrame:
+    """Rename columns of a dataframe using a function
+
+    Like rename, only the column labels change and the returned dataframe
+    shares its data with df.
+
+    Parameters
+    ----------
+    df : DataFrame
+    func : function
+        Called with each selected column name, returns the new name
+    cols : str, TidySelector, or list of str, TidySelectors, optional
+        The columns to rename, by default all columns
+
+    Returns
+    -------
+    DataFrame
+
+    Examples
+    --------
+
+    ```
+    >>> df = pd.DataFrame({"A": [1, 2], "B": [3, 4], "xC": [5, 6]})
+    >>> tb.rename_with(df, str.lower, starts_with("x"))
+       A  B  xc
+    0  1  3   5
+    1  2  4   6
+    ```
+    """
+    if cols is None:
+        return _set_columns(df, [func(c) for c in df.columns])
+
+    selected = set(get_column_names(df, cols))
+    return _set_columns(df, [func(c) if c in selected else c for c in df.columns])
+
+
+def _rename_columns(df: DataFrame, mapping: Mapping[Any, Any]) -> DataFrame:
+    return _set_columns(df, [mapping.get(c, c) for c in df.columns])
+
 
-    return df
+def _set_columns(df: DataFrame, columns: Any) -> DataFrame:
+    renamed = df.copy(deep=False)
+    renamed.columns = columns
+    return renamed
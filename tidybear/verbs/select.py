@@ -1,23 +1,40 @@
 from typing import List
+from typing import Optional
+from typing import Sequence
 from typing import Union
 
 import pandas as pd
 
+from tidybear.io import is_source
+from tidybear.io import read_source
+from tidybear.io import Source
+from tidybear.profiling import instrument
 from tidybear.selectors import TidySelector
 from tidybear.utils import get_column_names
 
 
+@instrument
 def select(
-    df: pd.DataFrame, *args: Union[str, TidySelector], **kwargs: str
+    df: Union[pd.DataFrame, Source],
+    *args: Union[str, TidySelector],
+    copy: Optional[bool] = None,
+    **kwargs: str,
 ) -> pd.DataFrame:
     """Select columns from a dataframe
 
     Parameters
     ----------
-    df : pandas.DataFrame
-        The dataframe to select columns from
+    df : pandas.DataFrame, path or Scan
+        The dataframe to select columns from. For a file, selectors are resolved
+        against its schema and only the selected columns are read.
     *args : str
         The column names to select
+    copy : bool, optional
+        Whether to copy the selected columns. If False, the result shares its
+        column arrays with df, so selecting is cheap no matter how many columns
+        are selected. Without copy-on-write, writing to the result may then
+        write to df as well. By default None, which copies unless pandas
+        copy-on-write is enabled.
     **kwargs : str
         The column names to select and rename, new_name="old_name"
 
@@ -55,10 +72,51 @@ def select(
         to_select.extend(kwargs.values())
         rename_dict = {v: k for k, v in kwargs.items()}
 
-    to_select_names = get_column_names(df.columns, to_select)
-    selected = df.loc[:, to_select_names].copy()
+    frame: pd.DataFrame
+    if is_source(df):
+        frame, (to_select_names,) = read_source(df, to_select)
+        copy = bool(copy)
+    else:
+        frame = df
+        to_select_names = list(get_column_names(frame, to_select))
+
+    if copy is None:
+        copy = not _copy_on_write()
+
+    if copy:
+        selected = frame.loc[:, to_select_names].copy()
+    else:
+        positions = frame.columns.get_indexer_for(to_select_names)
+        selected = _take_columns(frame, positions)
 
     if kwargs:
-        selected.rename(columns=rename_dict, inplace=True)
+        selected.columns = [rename_dict.get(c, c) for c in selected.columns]
 
     return selected
+
+
+def _copy_on_write() -> bool:
+    return getattr(pd.options.mode, "copy_on_write", False) is True
+
+
+def _take_columns(df: pd.DataFrame, positions: Sequence[int]) -> pd.DataFrame:
+    """Select columns by position, sharing the column arrays with df.
+
+    With copy-on-write, contiguous runs of columns are sliced and concatenated.
+    Without it, slicing across blocks and concatenating frames both copy, so
+    each column is taken as its own Series instead.
+    """
+    if len(positions) == 0:
+        return df.iloc[:, []]
+
+    if not _copy_on_write():
+        return pd.concat([df.iloc[:, i] for i in positions], axis=1, copy=False)
+
+    runs: List[slice] = []
+    for position in positions:
+        if runs and runs[-1].stop == position:
+            runs[-1] = slice(runs[-1].start, position + 1)
+        else:
+            runs.append(slice(position, position + 1))
+
+    return pd.concat([df.iloc[:, run] for run in runs], axis=1)
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+from typing import Any
 from typing import List
+from typing import Optional
 from typing import Union
 
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
 from pandas import DataFrame
 
+from tidybear.backends import dispatch
+from tidybear.memory import budget_active
+from tidybear.memory import check_memory
+from tidybear.memory import frame_bytes
+from tidybear.profiling import instrument
+
 
 def _slice(
     df: DataFrame,
@@ -13,18 +24,25 @@ def _slice(
     ascending: bool,
     groupby: Union[str, List[str], None] = None,
 ) -> DataFrame:
-    df = df.copy()
+    if budget_active():
+        check_memory("slice_min" if ascending else "slice_max", frame_bytes(df))
+
+    groups = [groupby] if isinstance(groupby, str) else list(groupby or [])
+    result = dispatch("slice", df, order_by, n, ascending, groups)
+    if result is not NotImplemented:
+        return result
+
+    ordered = df.sort_values(order_by, ascending=ascending, kind="stable")
 
     if groupby:
-        return (
-            df.groupby(groupby)
-            .apply(lambda x: _slice(x, order_by, n, ascending))
-            .reset_index(drop=True)
-        )
+        # the first n rows of every group, then the groups in order of their keys
+        top = ordered.groupby(groupby).head(n)
+        return top.sort_values(groups, kind="stable").reset_index(drop=True)
 
-    return df.sort_values(order_by, ascending=ascending).head(n)
+    return ordered.head(n)
 
 
+@instrument
 def slice_max(
     df: DataFrame,
     *,
@@ -51,6 +69,7 @@ def slice_max(
     return _slice(df, order_by, n, False, groupby)
 
 
+@instrument
 def slice_min(
     df: DataFrame,
     *,
@@ -75,3 +94,185 @@ def slice_min(
     Dataframe
     """
     return _slice(df, order_by, n, True, groupby)
+
+
+@instrument
+def slice_head(
+    df: DataFrame,
+    *,
+    n: Optional[int] = None,
+    prop: Optional[float] = None,
+    groupby: Union[str, List[str], None] = None,
+) -> DataFrame:
+    """Get the first N rows of a dataframe or group.
+
+    Parameters
+    ----------
+    df : DataFrame
+    n : int, optional
+        The number of rows to get
+    prop : float, optional
+        The proportion of rows to get, rounded down, instead of n
+    groupby : str or list, optional
+        Get the first rows of each group. These columns used for groupby, by default None
+
+    Returns
+    -------
+    Dataframe
+    """
+    return _slice_position(df, "slice_head", n, prop, groupby, from_end=False)
+
+
+@instrument
+def slice_tail(
+    df: DataFrame,
+    *,
+    n: Optional[int] = None,
+    prop: Optional[float] = None,
+    groupby: Union[str, List[str], None] = None,
+) -> DataFrame:
+    """Get the last N rows of a dataframe or group.
+
+    Parameters
+    ----------
+    df : DataFrame
+    n : int, optional
+        The number of rows to get
+    prop : float, optional
+        The proportion of rows to get, rounded down, instead of n
+    groupby : str or list, optional
+        Get the last rows of each group. These columns used for groupby, by default None
+
+    Returns
+    -------
+    Dataframe
+    """
+    return _slice_position(df, "slice_tail", n, prop, groupby, from_end=True)
+
+
+@instrument
+def slice_sample(
+    df: DataFrame,
+    *,
+    n: Optional[int] = None,
+    prop: Optional[float] = None,
+    weights: Union[str, Any, None] = None,
+    seed: Union[int, np.random.Generator, None] = None,
+    groupby: Union[str, List[str], None] = None,
+) -> DataFrame:
+    """Get N random rows of a dataframe or group, without replacement.
+
+    Every row gets a random key, and the rows with the smallest keys of each group
+    are kept, so all groups are sampled with one sort.
+
+    Parameters
+    ----------
+    df : DataFrame
+    n : int, optional
+        The number of rows to get
+    prop : float, optional
+        The proportion of rows to get, rounded down, instead of n
+    weights : str or array-like, optional
+        A column, or an array with one non-negative weight per row. Rows are
+        picked with probability proportional to their weight, and rows with a
+        weight of zero or missing are never picked, by default None
+    seed : int or numpy Generator, optional
+        Seed of the random numbers, by default None
+    groupby : str or list, optional
+        Sample rows of each group. These columns used for groupby, by default None
+
+    Returns
+    -------
+    Dataframe
+    """
+    if budget_active():
+        check_memory("slice_sample", frame_bytes(df))
+
+    codes = _group_codes(df, groupby)
+    limits = _limits(codes, n, prop)
+
+    rng = np.random.default_rng(seed)
+    if weights is None:
+        keys = rng.random(len(df))
+    else:
+        w = df[weights] if isinstance(weights, str) else weights
+        w = pd.Series(w).to_numpy(dtype=np.float64, na_value=np.nan)
+        if len(w) != len(df) or (w < 0).any():
+            raise ValueError("weights must be one non-negative number per row")
+
+        # Efraimidis-Spirakis: the smallest exponential keys divided by the weights
+        with np.errstate(divide="ignore", invalid="ignore"):
+            keys = rng.exponential(size=len(df)) / w
+        keys[~np.isfinite(keys)] = np.inf
+
+    order = np.lexsort((keys, codes))
+    order = order[codes[order] >= 0]
+
+    # the rank of each row by its key within its group
+    sorted_codes = codes[order]
+    rank = np.arange(len(order)) - np.searchsorted(sorted_codes, sorted_codes)
+
+    if np.ndim(limits):
+        limits = limits[order]
+
+    keep = (rank < limits) & (keys[order] < np.inf)
+    result = df.iloc[order[keep]]
+    return result.reset_index(drop=True) if groupby else result
+
+
+def _slice_position(
+    df: DataFrame,
+    verb: str,
+    n: Optional[int],
+    prop: Optional[float],
+    groupby: Union[str, List[str], None],
+    from_end: bool,
+) -> DataFrame:
+    if budget_active():
+        check_memory(verb, frame_bytes(df))
+
+    codes = _group_codes(df, groupby)
+    limits = _limits(codes, n, prop)
+
+    # the position of each row in its group, from the start or from the end
+    position = (
+        pd.Series(codes).groupby(codes, sort=False).cumcount(ascending=not from_end)
+    )
+    rows = np.flatnonzero((position.to_numpy() < limits) & (codes >= 0))
+    if not groupby:
+        return df.iloc[rows]
+
+    # the groups in order of their keys, like slice_min and slice_max
+    rows = rows[np.argsort(codes[rows], kind="stable")]
+    return df.iloc[rows].reset_index(drop=True)
+
+
+def _group_codes(
+    df: DataFrame, groupby: Union[str, List[str], None]
+) -> npt.NDArray[np.intp]:
+    """The group number of every row, in order of the keys, -1 for missing keys"""
+    if not groupby:
+        return np.zeros(len(df), dtype=np.intp)
+
+    codes = df.groupby(groupby, sort=True, observed=True, dropna=True).ngroup()
+    return codes.fillna(-1).to_numpy(dtype=np.intp)
+
+
+def _limits(
+    codes: npt.NDArray[np.intp], n: Optional[int], prop: Optional[float]
+) -> Any:
+    """The number of rows to keep, for all groups or for the group of every row"""
+    if (n is None) == (prop is None):
+        raise ValueError("Pass exactly one of n and prop")
+
+    if prop is None:
+        if isinstance(n, bool) or not isinstance(n, (int, np.integer)) or n < 0:
+            raise ValueError(f"n must be a non-negative integer, got {n!r}")
+        return n
+
+    if not 0 <= prop <= 1:
+        raise ValueError(f"prop must be between 0 and 1, got {prop}")
+
+    sizes = np.bincount(codes[codes >= 0])
+    # the trailing 0 is the limit of rows without a group, at code -1
+    return np.append(np.floor(prop * sizes).astype(np.intp), 0)[codes]